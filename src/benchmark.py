@@ -0,0 +1,190 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .pose_coach.features import PoseFeatures
+from .pose_coach.recording import LandmarkRecording
+from .pose_coach.registry import EXERCISES, POSES
+from .pose_coach.synthetic import synthetic_stream
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pose Coach: analyzer update() benchmark")
+    parser.add_argument("--recording", help="Landmark recording (.npy) to replay instead of a synthetic stream")
+    parser.add_argument("--frames", type=int, default=3000, help="Synthetic frames per analyzer")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the stream (best pass is kept)")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="Benchmark only these registry names")
+    parser.add_argument("--json", metavar="PATH", help="Write results as JSON")
+    parser.add_argument("--rep-counters", action="store_true",
+                        help="Also time each coach's RepCounter alone: step() per frame vs one vectorized run()")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Save results as a baseline for --compare")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a saved baseline and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative p50/p99 slowdown for --compare")
+    return parser.parse_args()
+
+
+def load_stream(args) -> Tuple[List[Tuple[Optional[np.ndarray], Optional[np.ndarray], tuple]], str]:
+    """Materialize the frames up front so decoding never shows up in the timings."""
+    if args.recording:
+        recording = LandmarkRecording(args.recording)
+        frames = [
+            (None if lp is None else lp.copy(), None if vis is None else vis.copy(), shape)
+            for _, lp, vis, shape in recording.frames()
+        ]
+        return frames, args.recording
+    shape = (args.height, args.width, 3)
+    landmarks_px, visibility, detected = synthetic_stream(args.frames, frame_shape=shape)
+    frames = [
+        (landmarks_px[i], visibility[i], shape) if detected[i] else (None, None, shape)
+        for i in range(len(landmarks_px))
+    ]
+    return frames, f"synthetic:{args.frames}"
+
+
+def bench_analyzer(cls, frames, repeat: int) -> Dict[str, float]:
+    """Time ``update()`` per frame; allocations are measured in a separate pass.
+
+    tracemalloc slows everything down, so it never runs during the timed passes.
+    ``alloc_bytes_per_frame`` is the mean tracemalloc peak inside ``update()``,
+    i.e. the transient Python + NumPy memory each frame churns through.
+    """
+    best: Optional[np.ndarray] = None
+    latencies = np.empty(len(frames), dtype=np.int64)
+    perf = time.perf_counter_ns
+    for _ in range(max(1, repeat)):
+        analyzer = cls()
+        update = analyzer.update
+        for i, (lp, vis, shape) in enumerate(frames):
+            t0 = perf()
+            update(lp, vis, shape)
+            latencies[i] = perf() - t0
+        if best is None or latencies.sum() < best.sum():
+            best = latencies.copy()
+
+    analyzer = cls()
+    peak_bytes = 0
+    tracemalloc.start()
+    try:
+        for lp, vis, shape in frames:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            analyzer.update(lp, vis, shape)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes += peak - before
+    finally:
+        tracemalloc.stop()
+
+    n = max(1, len(frames))
+    total_s = best.sum() / 1e9
+    return {
+        "frames": len(frames),
+        "fps": round(len(frames) / total_s, 1) if total_s > 0 else float("inf"),
+        "p50_us": round(float(np.percentile(best, 50)) / 1e3, 2),
+        "p99_us": round(float(np.percentile(best, 99)) / 1e3, 2),
+        "alloc_bytes_per_frame": round(peak_bytes / n, 1),
+    }
+
+
+def bench_rep_counter(cls, frames, repeat: int) -> Dict[str, float]:
+    """Time the rep counter alone on signals measured once up front."""
+    detected = [(lp, vis, shape) for lp, vis, shape in frames if lp is not None]
+    if not detected:
+        return {"frames": 0, "step_ns_per_frame": 0.0, "run_us": 0.0, "reps": 0}
+    features = PoseFeatures(np.stack([d[0] for d in detected]), np.stack([d[1] for d in detected]), detected[0][2])
+    signals = {key: np.broadcast_to(value, (len(detected),)) for key, value in cls().measure(features).items()}
+    rows = [dict(zip(signals, values)) for values in zip(*(s.tolist() for s in signals.values()))]
+    perf = time.perf_counter_ns
+    step_ns = run_ns = None
+    for _ in range(max(1, repeat)):
+        counter = cls().counter
+        step = counter.step
+        t0 = perf()
+        for i, row in enumerate(rows):
+            step(row, i)
+        elapsed = perf() - t0
+        step_ns = elapsed if step_ns is None else min(step_ns, elapsed)
+
+        batch = cls().counter
+        t0 = perf()
+        batch.run(signals, np.arange(len(rows), dtype=float))
+        elapsed = perf() - t0
+        run_ns = elapsed if run_ns is None else min(run_ns, elapsed)
+    return {
+        "frames": len(rows),
+        "step_ns_per_frame": round(step_ns / len(rows), 1),
+        "run_us": round(run_ns / 1e3, 1),
+        "reps": counter.reps,
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    regressions = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for key in ("p50_us", "p99_us"):
+            if base[key] > 0 and cur[key] > base[key] * (1.0 + threshold):
+                regressions.append(f"{name}: {key} {base[key]:.2f} -> {cur[key]:.2f} (+{cur[key] / base[key] - 1.0:.0%})")
+    return regressions
+
+
+def main():
+    args = parse_args()
+    frames, source = load_stream(args)
+    registry = [("exercise", n, c) for n, c in EXERCISES] + [("pose", n, c) for n, c in POSES]
+    if args.only:
+        registry = [entry for entry in registry if entry[1] in args.only]
+        if not registry:
+            raise ValueError("No analyzers matched --only")
+
+    print(f"Stream: {source} ({len(frames)} frames)")
+    print(f"{'analyzer':<20}{'fps':>12}{'p50 us':>10}{'p99 us':>10}{'peak B/frame':>15}")
+    results: Dict[str, Dict] = {}
+    for mode, name, cls in registry:
+        stats = bench_analyzer(cls, frames, args.repeat)
+        stats["mode"] = mode
+        stats["class"] = cls.__name__
+        results[name] = stats
+        print(
+            f"{name:<20}{stats['fps']:>12.0f}{stats['p50_us']:>10.2f}{stats['p99_us']:>10.2f}"
+            f"{stats['alloc_bytes_per_frame']:>15.0f}"
+        )
+
+    report = {"source": source, "frames": len(frames), "results": results}
+    if args.rep_counters:
+        print(f"\n{'rep counter':<20}{'step ns/frame':>15}{'run us':>10}{'reps':>7}")
+        counters: Dict[str, Dict] = {}
+        for mode, name, cls in registry:
+            if mode != "exercise":
+                continue
+            stats = bench_rep_counter(cls, frames, args.repeat)
+            counters[name] = stats
+            print(f"{name:<20}{stats['step_ns_per_frame']:>15.1f}{stats['run_us']:>10.1f}{stats['reps']:>7}")
+        report["rep_counters"] = counters
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("Regressions vs baseline:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print(f"No regressions vs {args.compare} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import argparse
+import json
+import threading
+import time
+from typing import List
+
+import cv2
+import numpy as np
+
+from .pose_coach.frame_server import FrameServer
+from .pose_coach.ingest import IngestService
+from .pose_coach.profiling import format_stage_summary
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pose Coach: local load generator for the micro-batching frame server")
+    parser.add_argument("--sessions", type=int, default=8, help="Simulated concurrent athletes")
+    parser.add_argument("--fps", type=float, default=15.0, help="Frames per second each session submits")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to generate load for")
+    parser.add_argument("--video", help="Loop frames from this video instead of synthetic noise")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=360)
+    parser.add_argument("--workers", type=int, default=2, help="Estimator processes")
+    parser.add_argument("--batch-window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=16)
+    parser.add_argument(
+        "--max-sessions-per-worker",
+        type=int,
+        default=4,
+        help="MediaPipe estimators a worker keeps (one per session, ~100 MB each, least recently used closed first)",
+    )
+    parser.add_argument("--drain-timeout", type=float, default=30.0, help="Seconds to wait for in-flight frames at the end")
+    parser.add_argument("--exercise", default="squat", help="Analyzer each session runs")
+    parser.add_argument("--json", metavar="PATH", help="Write the final server stats as JSON")
+    return parser.parse_args()
+
+
+def load_frames(args, limit: int = 120) -> List[np.ndarray]:
+    if not args.video:
+        rng = np.random.default_rng(0)
+        return [rng.integers(0, 255, (args.height, args.width, 3), dtype=np.uint8) for _ in range(8)]
+    cap = cv2.VideoCapture(args.video)
+    frames = []
+    try:
+        while len(frames) < limit:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frame = cv2.resize(frame, (args.width, args.height), interpolation=cv2.INTER_AREA)
+            frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    finally:
+        cap.release()
+    if not frames:
+        raise RuntimeError(f"No frames decoded from {args.video}")
+    return frames
+
+
+def run_session(server: FrameServer, session_id: str, frames: List[np.ndarray], fps: float, duration: float, offset: float):
+    """Submit at a fixed rate without waiting on results, like a webcam would."""
+    interval = 1.0 / fps
+    start = time.perf_counter() + offset
+    end = start + duration
+    i = 0
+    while True:
+        due = start + i * interval
+        if due >= end:
+            break
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        server.submit(session_id, frames[i % len(frames)], timestamp=i * interval)
+        i += 1
+
+
+def main():
+    args = parse_args()
+    frames = load_frames(args)
+    service = IngestService()
+    server = FrameServer(
+        service,
+        pose_kwargs=dict(
+            static_image_mode=False,
+            model_complexity=1,
+            smooth_landmarks=True,
+            enable_segmentation=False,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+        ),
+        workers=args.workers,
+        batch_window_s=args.batch_window_ms / 1000.0,
+        max_batch=args.max_batch,
+        max_sessions_per_worker=args.max_sessions_per_worker,
+    )
+    sessions = [service.open("exercise", args.exercise) for _ in range(args.sessions)]
+    threads = [
+        threading.Thread(
+            target=run_session,
+            args=(server, sid, frames, args.fps, args.duration, i / (args.fps * args.sessions)),
+            daemon=True,
+        )
+        for i, sid in enumerate(sessions)
+    ]
+    if args.sessions > args.workers * args.max_sessions_per_worker:
+        print("warning: more sessions than estimators; evicted sessions lose tracking and re-initialize")
+    print(f"{args.sessions} sessions x {args.fps:g} fps for {args.duration:g}s on {args.workers} workers"
+          f" (up to {args.max_sessions_per_worker} estimators each)")
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Let in-flight frames drain before reading the counters
+    deadline = time.perf_counter() + args.drain_timeout
+    while server.stats()["in_flight"] and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    stats = server.stats()
+    if stats["in_flight"]:
+        print(f"warning: {stats['in_flight']} frames still in flight after {args.drain_timeout:g}s")
+    server.close()
+
+    print(
+        f"submitted {stats['submitted']}  completed {stats['completed']}  failed {stats['failed']}"
+        f"  batches {stats['batches']}  mean batch {stats['mean_batch']}  throughput {stats['throughput_fps']} fps"
+    )
+    print(f"estimators per worker {stats['estimators_per_worker']}")
+    for line in format_stage_summary({key: stats[key] for key in ("queue_wait", "inference", "end_to_end")}):
+        print(line)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(stats, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,42 @@
 import argparse
+import contextlib
+import functools
+import signal
+import sys
 import time
 from typing import Optional, Tuple
 
 import cv2
 import numpy as np
 
-from .pose_coach.utils import init_pose_estimator, extract_landmarks
-from .pose_coach.drawing import draw_landmarks_and_info
+from .pose_coach.utils import init_pose_estimator
+from .pose_coach.drawing import OverlayRenderer
+from .pose_coach.events import FeedbackEvents, JsonlWriter
+from .pose_coach.offline import analyze_files, expand_inputs, replay_files
+from .pose_coach.frame_server import FrameServer
+from .pose_coach.ingest import IngestService
+from .pose_coach.multi_person import MultiPersonCoach, MultiPoseEstimator
+from .pose_coach.multicam import (
+    MULTI_CAMERA_INFERENCE_SIZE,
+    CameraStream,
+    TiledView,
+    is_file_source,
+    open_source,
+    parse_sources,
+)
+from .pose_coach.recording import LandmarkRecorder
+from .pose_coach.roi import RoiPoseEstimator
+from .pose_coach.scheduling import AdaptiveInferenceScheduler, ModelComplexityController
+from .pose_coach.video_writer import AnnotatedVideoWriter
+from .pose_coach.pipeline import (
+    FpsMeter,
+    FrameProcessor,
+    InferenceResizer,
+    ThreadedPipeline,
+    format_pipeline_stats,
+    parse_inference_size,
+)
+from .pose_coach.profiling import StageTimer, format_stage_summary
 from .pose_coach.exercises.bicep_curl import BicepCurlCoach
 from .pose_coach.exercises.barbell_row import BarbellRowCoach
 from .pose_coach.poses.double_biceps import DoubleBicepsRater
@@ -26,59 +56,119 @@ def parse_args() -> argparse.Namespace:
         "back_double_biceps","rear_lat_spread","side_triceps","ab_thigh","most_muscular",
         "vacuum","moon_pose"
     ], help="Pose to rate in pose mode")
-    parser.add_argument("--camera-index", type=int, default=0, help="Webcam index (default: 0)")
+    parser.add_argument("--camera-index", nargs="+", default=["0"], metavar="SOURCE",
+                        help="Webcam indices and/or video files/URLs; several sources share one estimator worker pool")
+    parser.add_argument("--input", nargs="+", metavar="VIDEO", help="Analyze video files or globs headlessly instead of the webcam")
+    parser.add_argument("--output-dir", default="analysis", help="Where --input writes one JSON result per file")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Worker processes for --input (default: one per CPU, at most one per file) or several --camera-index sources "
+                             "(default: as few as --max-sessions-per-worker allows, i.e. one for up to 4 sources)")
+    parser.add_argument("--max-sessions-per-worker", type=int, default=4,
+                        help="MediaPipe estimators each worker keeps with several --camera-index sources (one per source)")
+    parser.add_argument("--headless", action="store_true", help="Run without a window or drawing; stop at end of stream, Ctrl+C or SIGTERM")
+    parser.add_argument("--events", metavar="PATH",
+                        help="Stream rep/phase/fault events as JSON Lines to PATH ('-' for stdout, the default with --headless)")
+    parser.add_argument("--tile-width", type=int, default=640, help="Per-stream tile width in the multi-camera view")
+    parser.add_argument("--tile-height", type=int, default=360, help="Per-stream tile height in the multi-camera view")
+    parser.add_argument("--save-landmarks", action="store_true", help="With --input, also write a landmark recording per file")
+    parser.add_argument("--record-landmarks", metavar="PATH", help="Record live landmarks to a .npy file for later --replay")
+    parser.add_argument("--record-annotated", metavar="PATH", help="Encode the annotated frames to a video (e.g. out.mp4) on a background thread")
+    parser.add_argument("--record-fps", type=float, default=0.0, help="Frame rate of --record-annotated (default: the source's, else --target-fps)")
+    parser.add_argument("--record-queue", type=int, default=64, help="Frames buffered for the --record-annotated encoder")
+    parser.add_argument("--record-policy", choices=AnnotatedVideoWriter.POLICIES, default="drop",
+                        help="When the encoder falls behind: drop the oldest queued frame, or block the frame loop")
+    parser.add_argument("--adaptive-inference", action="store_true", help="Run pose inference every N frames and extrapolate landmarks in between")
+    parser.add_argument("--target-fps", type=float, default=30.0, help="Frame rate that --adaptive-inference and --model-complexity auto budget against")
+    parser.add_argument("--max-stride", type=int, default=4, help="Most frames between inferences in --adaptive-inference mode")
+    parser.add_argument("--profile", action="store_true", help="Time every frame-loop stage and print latency histograms on exit")
+    parser.add_argument("--profile-out", metavar="PATH", help="Periodically dump stage latencies to PATH (.json or .csv)")
+    parser.add_argument("--profile-interval", type=float, default=10.0, help="Seconds between --profile-out dumps")
+    parser.add_argument("--chrome-trace", metavar="PATH", help="Write the most recent stage spans as a Chrome trace on exit")
+    parser.add_argument("--trace-events", type=int, default=100000, help="Spans kept for --chrome-trace")
+    parser.add_argument("--replay", nargs="+", metavar="RECORDING", help="Re-run the analyzer over landmark recordings without MediaPipe")
+    parser.add_argument("--sequence", action="store_true", help="With --replay, analyze each recording in one vectorized pass (rep boundaries and check pass rates instead of tip text)")
+    parser.add_argument("--min-dwell", type=int, default=1, metavar="FRAMES",
+                        help="Frames an exercise phase must hold before the rep counter can leave it (filters threshold jitter)")
     parser.add_argument("--width", type=int, default=1280, help="Camera capture width")
     parser.add_argument("--height", type=int, default=720, help="Camera capture height")
+    parser.add_argument("--inference-size", metavar="WxH|H", help="Run pose inference at this size (e.g. 854x480 or 480) while drawing at capture resolution "
+                             "(several --camera-index sources default to 360; 'full' disables)")
+    parser.add_argument("--model-complexity", choices=["0", "1", "2", "auto"], default="1",
+                        help="MediaPipe model complexity; 'auto' switches at runtime to hold --target-fps (offline modes use 1)")
     parser.add_argument("--min-detection-confidence", type=float, default=0.5)
     parser.add_argument("--min-tracking-confidence", type=float, default=0.5)
-    return parser.parse_args()
+    parser.add_argument("--roi", action="store_true", help="Run inference on a padded crop around the athlete instead of the full frame")
+    parser.add_argument("--roi-padding", type=float, default=0.25, help="Crop padding as a fraction of the landmark bounding box")
+    parser.add_argument("--roi-max-side", type=int, default=512, help="Downscale --roi crops so their longer side is at most this many pixels")
+    parser.add_argument("--multi-person", type=int, default=0, metavar="N",
+                        help="Track up to N people with one analyzer each (needs --pose-model)")
+    parser.add_argument("--pose-model", metavar="PATH", help="MediaPipe pose_landmarker_*.task model for --multi-person")
+    parser.add_argument("--pipelined", action="store_true", help="Run capture, inference and rendering on separate threads")
+    parser.add_argument("--queue-size", type=int, default=1, help="Frames buffered between pipeline stages (oldest dropped first)")
+    args = parser.parse_args()
+    if len(args.camera_index) > 1 and not (args.replay or args.input):
+        # Several sources run plain estimators in the shared frame server, without the single-stream frame loop
+        unsupported = [flag for flag, used in (
+            ("--roi", args.roi),
+            ("--adaptive-inference", args.adaptive_inference),
+            ("--model-complexity auto", args.model_complexity == "auto"),
+            ("--profile", args.profile),
+            ("--profile-out", args.profile_out),
+            ("--chrome-trace", args.chrome_trace),
+            ("--record-annotated", args.record_annotated),
+            ("--record-landmarks", args.record_landmarks),
+            ("--multi-person", args.multi_person),
+        ) if used]
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} cannot be used with several --camera-index sources")
+    return args
 
 
 def get_coach_or_rater(args):
     if args.mode == "exercise":
         if args.exercise == "bicep_curl":
-            return BicepCurlCoach()
+            return BicepCurlCoach(min_dwell=args.min_dwell)
         if args.exercise == "barbell_row":
-            return BarbellRowCoach()
+            return BarbellRowCoach(min_dwell=args.min_dwell)
         if args.exercise == "squat":
             from .pose_coach.exercises.squats import SquatCoach
-            return SquatCoach()
+            return SquatCoach(min_dwell=args.min_dwell)
         if args.exercise == "lunge":
             from .pose_coach.exercises.lunges import LungeCoach
-            return LungeCoach()
+            return LungeCoach(min_dwell=args.min_dwell)
         if args.exercise == "rdl":
             from .pose_coach.exercises.rdl import RDLCoach
-            return RDLCoach()
+            return RDLCoach(min_dwell=args.min_dwell)
         if args.exercise == "leg_press":
             from .pose_coach.exercises.leg_press import LegPressCoach
-            return LegPressCoach()
+            return LegPressCoach(min_dwell=args.min_dwell)
         if args.exercise == "calf_raise":
             from .pose_coach.exercises.calf_raises import CalfRaiseCoach
-            return CalfRaiseCoach()
+            return CalfRaiseCoach(min_dwell=args.min_dwell)
         if args.exercise == "pushup":
             from .pose_coach.exercises.pushups import PushupCoach
-            return PushupCoach()
+            return PushupCoach(min_dwell=args.min_dwell)
         if args.exercise == "pull_down":
             from .pose_coach.exercises.pull_downs import PullDownCoach
-            return PullDownCoach()
+            return PullDownCoach(min_dwell=args.min_dwell)
         if args.exercise == "bench_press":
             from .pose_coach.exercises.bench_press import BenchPressCoach
-            return BenchPressCoach()
+            return BenchPressCoach(min_dwell=args.min_dwell)
         if args.exercise == "bent_over_row":
             from .pose_coach.exercises.bent_over_rows import BentOverRowCoach
-            return BentOverRowCoach()
+            return BentOverRowCoach(min_dwell=args.min_dwell)
         if args.exercise == "lateral_raise":
             from .pose_coach.exercises.lateral_raises import LateralRaiseCoach
-            return LateralRaiseCoach()
+            return LateralRaiseCoach(min_dwell=args.min_dwell)
         if args.exercise == "deadlift":
             from .pose_coach.exercises.deadlift import DeadliftCoach
-            return DeadliftCoach()
+            return DeadliftCoach(min_dwell=args.min_dwell)
         if args.exercise == "box_jump":
             from .pose_coach.exercises.box_jumps import BoxJumpCoach
-            return BoxJumpCoach()
+            return BoxJumpCoach(min_dwell=args.min_dwell)
         if args.exercise == "cable_woodchopper":
             from .pose_coach.exercises.cable_woodchoppers import CableWoodchopperCoach
-            return CableWoodchopperCoach()
+            return CableWoodchopperCoach(min_dwell=args.min_dwell)
         raise ValueError("Unknown exercise")
     else:
         if args.pose == "double_biceps":
@@ -92,7 +182,6 @@ def get_coach_or_rater(args):
             from .pose_coach.poses.front_lat_spread import FrontLatSpreadRater
             return FrontLatSpreadRater()
         if args.pose == "back_double_biceps":
-            from .pose_coach.poses.double_biceps import DoubleBicepsRater
             return DoubleBicepsRater()
         if args.pose == "rear_lat_spread":
             from .pose_coach.poses.back_lat_spread import RearLatSpreadRater
@@ -118,58 +207,432 @@ def get_coach_or_rater(args):
         raise ValueError("Unknown pose")
 
 
-def main():
-    args = parse_args()
-    cap = cv2.VideoCapture(args.camera_index)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, args.width)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, args.height)
+def run_sequential(cap, processor: FrameProcessor, headless: bool = False, video: Optional[AnnotatedVideoWriter] = None):
+    fps_meter = FpsMeter()
+    renderer = OverlayRenderer()
+    timer = processor.timer
+
+    while True:
+        t = timer.now()
+        ret, frame = cap.read()
+        if not ret:
+            break
+        timer.record("capture", t)
+
+        _, landmarks_px, visibility, overlay_text = processor.process(frame)
+        if headless and video is None:
+            timer.maybe_dump()
+            continue
+
+        t = timer.now()
+        fps = fps_meter.tick()
+        output_frame = renderer.render(frame, landmarks_px, visibility, overlay_text, fps, in_place=True)
+        t = timer.record("draw", t)
+        if video is not None:
+            video.write(output_frame)
+            t = timer.record("record", t)
+        if headless:
+            timer.maybe_dump()
+            continue
+
+        cv2.imshow("Pose Coach", output_frame)
+        key = cv2.waitKey(1) & 0xFF
+        timer.record("display", t)
+        timer.maybe_dump()
+        if key == ord("q"):
+            break
+
+
+def run_pipelined(
+    cap,
+    processor: FrameProcessor,
+    queue_size: int,
+    headless: bool = False,
+    video: Optional[AnnotatedVideoWriter] = None,
+    lossless: bool = False,
+):
+    timer = processor.timer
 
-    if not cap.isOpened():
-        raise RuntimeError("Unable to open camera. Try a different --camera-index")
+    def read():
+        t = timer.now()
+        ret, frame = cap.read()
+        if ret:
+            timer.record("capture", t)
+        return ret, frame
+
+    def process(frame):
+        _, landmarks_px, visibility, overlay_text = processor.process(frame)
+        if landmarks_px is not None:
+            # The processor reuses its landmark buffers for the next frame
+            landmarks_px, visibility = landmarks_px.copy(), visibility.copy()
+        return frame, landmarks_px, visibility, overlay_text
+
+    fps_meter = FpsMeter()
+    renderer = OverlayRenderer()
+    pipeline = ThreadedPipeline(read, process, queue_size=queue_size, lossless=lossless).start()
+    try:
+        while not pipeline.finished:
+            item = pipeline.get(timeout=0.1)
+            if item is None:
+                # Keep the window responsive while waiting on the inference stage
+                if not headless and (cv2.waitKey(1) & 0xFF) == ord("q"):
+                    break
+                continue
+            if headless and video is None:
+                timer.maybe_dump()
+                continue
+            frame, landmarks_px, visibility, overlay_text = item
+            t = timer.now()
+            fps = fps_meter.tick()
+            overlay = list(overlay_text or []) + [format_pipeline_stats(pipeline.stats())]
+            output_frame = renderer.render(frame, landmarks_px, visibility, overlay, fps, in_place=True)
+            t = timer.record("draw", t)
+            if video is not None:
+                video.write(output_frame)
+                t = timer.record("record", t)
+            if headless:
+                timer.maybe_dump()
+                continue
+
+            cv2.imshow("Pose Coach", output_frame)
+            key = cv2.waitKey(1) & 0xFF
+            timer.record("display", t)
+            timer.maybe_dump()
+            if key == ord("q"):
+                break
+    finally:
+        pipeline.stop()
+    if pipeline.error is not None:
+        raise pipeline.error
+    print("Pipeline stats:", pipeline.stats())
 
-    pose = init_pose_estimator(
+
+def pose_kwargs(args) -> dict:
+    return dict(
         static_image_mode=False,
-        model_complexity=1,
+        model_complexity=1 if args.model_complexity == "auto" else int(args.model_complexity),
         smooth_landmarks=True,
         enable_segmentation=False,
         min_detection_confidence=args.min_detection_confidence,
         min_tracking_confidence=args.min_tracking_confidence,
     )
 
-    analyzer = get_coach_or_rater(args)
 
-    fps_smoothing = 0.9
-    fps = 0.0
-    last_time = time.time()
+def run_offline(args):
+    paths = expand_inputs(args.input)
+    if not paths:
+        raise RuntimeError("No input files matched --input")
+    # Fail fast on a bad --exercise/--pose before spinning up workers
+    get_coach_or_rater(args)
+    results = analyze_files(
+        paths,
+        functools.partial(get_coach_or_rater, args),
+        pose_kwargs(args),
+        args.output_dir,
+        workers=args.workers,
+        save_landmarks=args.save_landmarks,
+    )
+    print_results(results)
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
 
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = pose.process(frame_rgb)
+def run_replay(args):
+    paths = expand_inputs(args.replay)
+    if not paths:
+        raise RuntimeError("No recordings matched --replay")
+    print_results(replay_files(paths, functools.partial(get_coach_or_rater, args), args.output_dir, args.sequence))
 
-        landmarks_px, visibility = extract_landmarks(results, frame.shape)
 
-        overlay_text = analyzer.update(landmarks_px, visibility, frame.shape)
+def print_results(results):
+    for result in results:
+        if "error" in result:
+            print(f"{result['input']}: ERROR {result['error']}")
+        else:
+            print(f"{result['input']}: {result['frames']} frames, reps={result['reps']} -> {result['output']}")
 
-        # FPS
-        now = time.time()
-        inst_fps = 1.0 / max(1e-6, (now - last_time))
-        last_time = now
-        fps = fps_smoothing * fps + (1 - fps_smoothing) * inst_fps
 
-        output_frame = draw_landmarks_and_info(frame, results, overlay_text, fps)
+def build_stage_timer(args) -> StageTimer:
+    enabled = bool(args.profile or args.profile_out or args.chrome_trace)
+    timer = StageTimer(enabled=enabled, trace_events=args.trace_events if args.chrome_trace else 0)
+    if args.profile_out:
+        timer.dump_every(args.profile_out, args.profile_interval)
+    return timer
 
-        cv2.imshow("Pose Coach", output_frame)
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord("q"):
-            break
 
-    cap.release()
-    cv2.destroyAllWindows()
+def finish_stage_timer(timer: StageTimer, args) -> None:
+    if not timer.enabled:
+        return
+    timer.close()
+    if args.chrome_trace:
+        timer.write_chrome_trace(args.chrome_trace)
+    for line in format_stage_summary(timer.summary()):
+        print(line)
+
+
+def open_events(args) -> Optional[JsonlWriter]:
+    path = args.events or ("-" if args.headless else None)
+    return JsonlWriter(path) if path else None
+
+
+def open_annotated_video(args, cap) -> Optional[AnnotatedVideoWriter]:
+    if not args.record_annotated:
+        return None
+    fps = args.record_fps or cap.get(cv2.CAP_PROP_FPS)
+    if not fps or fps <= 0 or fps != fps:
+        fps = args.target_fps
+    return AnnotatedVideoWriter(args.record_annotated, fps, args.record_queue, args.record_policy)
+
+
+def close_annotated_video(video: Optional[AnnotatedVideoWriter]) -> None:
+    if video is not None:
+        video.close()
+        print("Annotated video:", video.stats())
+
+
+def interrupt_on_sigterm() -> None:
+    """Shut down on SIGTERM (e.g. from a process supervisor) the same way as on Ctrl+C."""
+    def handler(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, handler)
+
+
+def print_throughput(frames: int, detected: int, elapsed: float, writer: JsonlWriter) -> None:
+    target = "stdout" if writer.path == "-" else writer.path
+    line = (
+        f"Throughput: {frames} frames in {elapsed:.1f}s ({frames / max(elapsed, 1e-9):.1f} fps), "
+        f"{detected} with a person, {writer.written} events -> {target}"
+    )
+    if writer.error is not None:
+        line += f" ({writer.dropped} dropped: {writer.error})"
+    print(line)
+
+
+def run_multi_camera(args, sources, writer: Optional[JsonlWriter] = None):
+    """One analyzer per source; all estimators live in a shared FrameServer worker pool.
+
+    With ``writer`` every source gets its own ``FeedbackEvents``, tagged with ``source``.
+    """
+    service = IngestService()
+    # One worker serves several sources; more workers only add MediaPipe processes
+    workers = args.workers or -(-len(sources) // max(1, args.max_sessions_per_worker))
+    server = FrameServer(service, pose_kwargs(args), workers=workers, max_sessions_per_worker=args.max_sessions_per_worker)
+    name = args.exercise if args.mode == "exercise" else args.pose
+    # Frames are pickled to the workers, so send them small unless asked otherwise
+    inference_size = parse_inference_size(args.inference_size) if args.inference_size else MULTI_CAMERA_INFERENCE_SIZE
+    streams = []
+    events = []
+    view = None if args.headless else TiledView(len(sources), (args.tile_width, args.tile_height))
+    started = time.perf_counter()
+    try:
+        for source in sources:
+            cap = open_source(source, args.width, args.height)
+            analyzer = get_coach_or_rater(args)
+            if writer is not None:
+                events.append(FeedbackEvents(writer, analyzer, source=str(source)))
+            session_id = service.open(args.mode, name, analyzer, events[-1] if events else None)
+            streams.append(CameraStream(source, cap, server, session_id, inference_size))
+        for stream in streams:
+            stream.start()
+        while not all(stream.pipeline.finished for stream in streams):
+            updated = False
+            for idx, stream in enumerate(streams):
+                if stream.pipeline.error is not None:
+                    raise stream.pipeline.error
+                item = stream.pipeline.get(timeout=0)
+                if item is None:
+                    continue
+                updated = True
+                fps = stream.fps_meter.tick()
+                if view is not None:
+                    frame, feedback = item
+                    lines = [f"[{stream.source}]"] + feedback["lines"]
+                    view.update(idx, frame, feedback["landmarks"], lines, fps)
+            if view is None:
+                if not updated:
+                    time.sleep(0.005)
+                continue
+            cv2.imshow("Pose Coach", view.canvas)
+            if (cv2.waitKey(1) & 0xFF) == ord("q"):
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for stream in streams:
+            stream.stop()
+        if view is not None:
+            cv2.destroyAllWindows()
+        print("Frame server:", {k: v for k, v in server.stats().items() if not isinstance(v, dict)})
+        server.close()
+        for stream in streams:
+            summary = service.close(stream.session_id)
+            print(f"[{stream.source}] frames={summary['frames']} detected={summary['detected_frames']} reps={summary['reps']}")
+        if writer is not None:
+            writer.close()
+            frames = sum(e.frames for e in events)
+            detected = sum(e.detected_frames for e in events)
+            print_throughput(frames, detected, time.perf_counter() - started, writer)
+
+
+def run_multi_person(args, cap, writer: Optional[JsonlWriter] = None):
+    """Single inference per frame for up to --multi-person athletes, each with a stable ID and coach."""
+    if not args.pose_model:
+        raise ValueError("--multi-person needs --pose-model (a MediaPipe pose_landmarker .task file)")
+    estimator = MultiPoseEstimator(
+        args.pose_model,
+        num_poses=args.multi_person,
+        min_detection_confidence=args.min_detection_confidence,
+        min_tracking_confidence=args.min_tracking_confidence,
+    )
+    coach = MultiPersonCoach(functools.partial(get_coach_or_rater, args), max_people=args.multi_person)
+    resizer = InferenceResizer(parse_inference_size(args.inference_size), cv2.COLOR_BGR2RGB)
+    renderer = OverlayRenderer()
+    fps_meter = FpsMeter()
+    timer = build_stage_timer(args)
+    video = open_annotated_video(args, cap)
+    events = {}
+    frames = detected = 0
+    started = time.perf_counter()
+    try:
+        while True:
+            t = timer.now()
+            ret, frame = cap.read()
+            if not ret:
+                break
+            t = timer.record("capture", t)
+            poses = estimator.detect(resizer.prepare(frame))
+            t = timer.record("pose_process", t)
+            people = coach.update(poses, frame.shape)
+            t = timer.record("analyzer_update", t)
+            if writer is not None:
+                for track_id, (_, _, feedback) in people.items():
+                    person = events.get(track_id)
+                    if person is None:
+                        person = events[track_id] = FeedbackEvents(writer, coach.analyzers.get(track_id), person=track_id)
+                    person.observe(feedback, frames)
+                for track_id in [tid for tid in events if tid not in coach.analyzers]:
+                    del events[track_id]
+            frames += 1
+            detected += bool(people)
+            fps = fps_meter.tick()
+            if args.headless and video is None:
+                timer.maybe_dump()
+                continue
+
+            lines = []
+            for track_id, (landmarks_px, visibility, person_lines) in sorted(people.items()):
+                renderer.draw_skeleton(frame, landmarks_px, visibility)
+                nose = (int(landmarks_px[0, 0]), max(20, int(landmarks_px[0, 1]) - 30))
+                cv2.putText(frame, f"#{track_id}", nose, cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
+                lines.extend(f"#{track_id} {line}" for line in person_lines or [] if not line.startswith("Mode:"))
+            output_frame = renderer.render(frame, None, None, lines, fps, in_place=True)
+            t = timer.record("draw", t)
+            if video is not None:
+                video.write(output_frame)
+                t = timer.record("record", t)
+            if args.headless:
+                timer.maybe_dump()
+                continue
+            cv2.imshow("Pose Coach", output_frame)
+            key = cv2.waitKey(1) & 0xFF
+            timer.record("display", t)
+            timer.maybe_dump()
+            if key == ord("q"):
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        estimator.close()
+        cap.release()
+        close_annotated_video(video)
+        if not args.headless:
+            cv2.destroyAllWindows()
+        finish_stage_timer(timer, args)
+        if writer is not None:
+            writer.close()
+            print_throughput(frames, detected, time.perf_counter() - started, writer)
+
+
+def main():
+    args = parse_args()
+    if args.replay:
+        run_replay(args)
+        return
+    if args.input:
+        run_offline(args)
+        return
+
+    sources = parse_sources(args.camera_index)
+    if args.headless:
+        interrupt_on_sigterm()
+    writer = open_events(args)
+    # Events own stdout when streamed there; status lines and summaries go to stderr
+    to_stderr = writer is not None and writer.path == "-"
+    with contextlib.redirect_stdout(sys.stderr) if to_stderr else contextlib.nullcontext():
+        if len(sources) > 1:
+            run_multi_camera(args, sources, writer)
+            return
+        cap = open_source(sources[0], args.width, args.height)
+        if args.multi_person:
+            run_multi_person(args, cap, writer)
+        else:
+            run_single(args, cap, writer, lossless=is_file_source(sources[0]))
+
+
+def run_single(args, cap, writer: Optional[JsonlWriter] = None, lossless: bool = False):
+    """One source on this process's estimator; ``lossless`` keeps every frame of a video file in pipelined mode."""
+    if args.model_complexity == "auto":
+        kwargs = pose_kwargs(args)
+        pose = ModelComplexityController(
+            lambda complexity: init_pose_estimator(**dict(kwargs, model_complexity=complexity)),
+            target_fps=args.target_fps,
+        )
+    else:
+        pose = init_pose_estimator(**pose_kwargs(args))
+    complexity = pose if isinstance(pose, ModelComplexityController) else None
+    if args.roi:
+        pose = RoiPoseEstimator(pose, padding=args.roi_padding, max_side=args.roi_max_side)
+
+    analyzer = get_coach_or_rater(args)
+    recorder = LandmarkRecorder(args.record_landmarks) if args.record_landmarks else None
+    timer = build_stage_timer(args)
+    scheduler = AdaptiveInferenceScheduler(args.target_fps, args.max_stride) if args.adaptive_inference else None
+    events = FeedbackEvents(writer, analyzer) if writer is not None else None
+    video = open_annotated_video(args, cap)
+    processor = FrameProcessor(
+        pose,
+        analyzer,
+        timer=timer,
+        recorder=recorder,
+        scheduler=scheduler,
+        inference_size=parse_inference_size(args.inference_size),
+        events=events,
+    )
+
+    started = time.perf_counter()
+    try:
+        if args.pipelined:
+            run_pipelined(cap, processor, args.queue_size, args.headless, video, lossless)
+        else:
+            run_sequential(cap, processor, args.headless, video)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if recorder is not None:
+            recorder.close()
+        cap.release()
+        close_annotated_video(video)
+        if not args.headless:
+            cv2.destroyAllWindows()
+        finish_stage_timer(timer, args)
+        if scheduler is not None:
+            print("Adaptive inference:", scheduler.stats())
+        if complexity is not None:
+            print("Model complexity:", complexity.stats())
+        if isinstance(pose, RoiPoseEstimator):
+            print("ROI cropping:", pose.stats())
+        if writer is not None:
+            writer.close()
+            print_throughput(events.frames, events.detected_frames, time.perf_counter() - started, writer)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -31,4 +31,60 @@ def angle_between_vectors(v1: np.ndarray, v2: np.ndarray) -> float:
     dot = float(np.dot(v1, v2))
     denom = (np.linalg.norm(v1) * np.linalg.norm(v2)) + 1e-6
     cos_val = max(-1.0, min(1.0, dot / denom))
-    return math.degrees(math.acos(cos_val))
\ No newline at end of file
+    return math.degrees(math.acos(cos_val))
+
+# Vectorized kernels. These accept arrays of shape (..., 2), e.g. (T, 2) for a
+# sequence of points or (T, K, 2) for K joints over T frames, broadcast their
+# arguments against each other and return the angles with the leading shape.
+# Clamping and the 1e-6 epsilon match the scalar versions above.
+
+
+def _dot2(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0] * v[..., 0] + u[..., 1] * v[..., 1]
+
+
+def _norm2(u: np.ndarray) -> np.ndarray:
+    return np.sqrt(_dot2(u, u))
+
+
+def angles_at_points(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Vectorized ``angle_at_point``: angle ABC in degrees for every point triple."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    c = np.asarray(c, dtype=np.float64)
+    ba = a - b
+    bc = c - b
+    norm = (_norm2(ba) * _norm2(bc)) + 1e-6
+    cos_val = np.clip(_dot2(ba, bc) / norm, -1.0, 1.0)
+    return np.degrees(np.arccos(cos_val))
+
+
+def angles_between_vectors(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+    """Vectorized ``angle_between_vectors``."""
+    v1 = np.asarray(v1, dtype=np.float64)
+    v2 = np.asarray(v2, dtype=np.float64)
+    denom = (_norm2(v1) * _norm2(v2)) + 1e-6
+    cos_val = np.clip(_dot2(v1, v2) / denom, -1.0, 1.0)
+    return np.degrees(np.arccos(cos_val))
+
+
+def angles_of_vectors(v: np.ndarray) -> np.ndarray:
+    """Vectorized ``angle_of_vector``."""
+    v = np.asarray(v, dtype=np.float64)
+    return np.degrees(np.arctan2(v[..., 1], v[..., 0]))
+
+
+def horizontal_angles(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    """Vectorized ``horizontal_angle``."""
+    return np.abs(angles_of_vectors(np.asarray(p2, dtype=np.float64) - np.asarray(p1, dtype=np.float64)))
+
+
+def joint_angles(landmarks: np.ndarray, triples) -> np.ndarray:
+    """Angles for several joints at once.
+
+    landmarks is (33, 2) or (T, 33, 2); triples is a sequence of (a, b, c)
+    landmark indices. Returns (K,) or (T, K) angles ABC in degrees.
+    """
+    idx = np.asarray(triples, dtype=np.intp).reshape(-1, 3)
+    pts = np.asarray(landmarks, dtype=np.float64)
+    return angles_at_points(pts[..., idx[:, 0], :], pts[..., idx[:, 1], :], pts[..., idx[:, 2], :])
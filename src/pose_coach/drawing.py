@@ -1,25 +1,156 @@
-from typing import List, Optional
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 import cv2
+import numpy as np
 
-from .utils import mp_drawing, mp_drawing_styles
+from .utils import NUM_LANDMARKS, mp_drawing, mp_drawing_styles, mp_pose
 
+VISIBILITY_THRESHOLD = 0.5
+# Colors are BGR; OverlayRenderer swaps them for RGB frames
+WHITE_COLOR = (224, 224, 224)
+TEXT_COLOR = (0, 255, 0)
+FPS_COLOR = (255, 255, 0)
+TEXT_ORIGIN = (20, 30)
+LINE_HEIGHT = 28
 
-def draw_landmarks_and_info(frame, results, overlay_lines: Optional[list], fps: float):
-    output = frame.copy()
-    if results and results.pose_landmarks:
-        mp_drawing.draw_landmarks(
-            output,
-            results.pose_landmarks,
-            landmark_drawing_spec=mp_drawing_styles.get_default_pose_landmarks_style(),
-        )
-
-    # Draw overlay text lines
-    if overlay_lines:
-        y = 30
+
+class _TextLine:
+    """One overlay line rasterized once into a coverage mask and a solid color patch."""
+
+    __slots__ = ("top", "left", "alpha", "inv_alpha", "patch")
+
+    def __init__(self, text: str, x: int, baseline: int, color: Tuple[int, int, int]):
+        font, scale, thickness = cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2
+        (tw, th), base = cv2.getTextSize(text, font, scale, thickness)
+        self.top = baseline - th - thickness
+        self.left = x - thickness
+        mask = np.zeros((th + base + 2 * thickness, tw + 2 * thickness), dtype=np.uint8)
+        cv2.putText(mask, text, (thickness, th + thickness), font, scale, 255, thickness, cv2.LINE_AA)
+        self.alpha = mask.astype(np.float32) / 255.0
+        self.inv_alpha = 1.0 - self.alpha
+        self.patch = np.empty(mask.shape + (3,), dtype=np.uint8)
+        self.patch[:] = color
+
+    def blit(self, image: np.ndarray) -> None:
+        h, w = self.alpha.shape
+        y0, x0 = max(self.top, 0), max(self.left, 0)
+        y1, x1 = min(self.top + h, image.shape[0]), min(self.left + w, image.shape[1])
+        if y1 <= y0 or x1 <= x0:
+            return
+        ys = slice(y0 - self.top, y1 - self.top)
+        xs = slice(x0 - self.left, x1 - self.left)
+        roi = image[y0:y1, x0:x1]
+        roi[:] = cv2.blendLinear(self.patch[ys, xs], roi, self.alpha[ys, xs], self.inv_alpha[ys, xs])
+
+
+class OverlayRenderer:
+    """Draws the skeleton, overlay lines and FPS counter onto a frame.
+
+    The MediaPipe landmark style is resolved once into per-landmark colors,
+    the skeleton comes straight from the ``(33, 2)`` pixel array with a single
+    ``cv2.polylines`` call, and each overlay line is rasterized once and cached
+    by its text, so unchanged tips cost one ``cv2.blendLinear`` over their
+    bounding box instead of a ``putText``. With ``in_place=True`` the caller's
+    frame is drawn on directly instead of a copy. ``color_order`` is the
+    channel order of the frames being drawn on (``"bgr"`` for OpenCV capture,
+    ``"rgb"`` for browser frames); colors are swapped once here so no frame
+    has to be converted.
+    """
+
+    def __init__(self, draw_connections: bool = True, cache_size: int = 128, color_order: str = "bgr"):
+        if color_order not in ("bgr", "rgb"):
+            raise ValueError(f"Unknown color order: {color_order}")
+        self.color_order = color_order
+        style = mp_drawing_styles.get_default_pose_landmarks_style()
+        default = mp_drawing.DrawingSpec()
+        self.landmark_specs: List[Tuple[Tuple[int, int, int], int, int]] = []
+        for idx in range(NUM_LANDMARKS):
+            spec = style.get(mp_pose.PoseLandmark(idx), default)
+            self.landmark_specs.append((self._color(spec.color), spec.thickness, spec.circle_radius))
+        self.border_color = self._color(WHITE_COLOR)
+        self.fps_color = self._color(FPS_COLOR)
+        self.text_color = self._color(TEXT_COLOR)
+        self.connection_color = self._color(default.color)
+        self.connection_thickness = default.thickness
+        connections = np.array(sorted(mp_pose.POSE_CONNECTIONS), dtype=np.intp) if draw_connections else np.empty((0, 2), np.intp)
+        self.connections = connections
+        self.cache_size = cache_size
+        self._lines: "OrderedDict[Tuple[str, int], _TextLine]" = OrderedDict()
+
+    def render(
+        self,
+        frame: np.ndarray,
+        landmarks_px: Optional[np.ndarray],
+        visibility: Optional[np.ndarray],
+        overlay_lines: Optional[list],
+        fps: float,
+        in_place: bool = False,
+    ) -> np.ndarray:
+        output = frame if in_place else frame.copy()
+        if landmarks_px is not None:
+            self.draw_skeleton(output, landmarks_px, visibility)
+        if overlay_lines:
+            self.draw_lines(output, overlay_lines)
+        cv2.putText(output, f"FPS: {fps:.1f}", (output.shape[1] - 160, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, self.fps_color, 2)
+        return output
+
+    def _color(self, bgr) -> Tuple[int, int, int]:
+        b, g, r = bgr
+        return (r, g, b) if self.color_order == "rgb" else (b, g, r)
+
+    def draw_skeleton(self, image: np.ndarray, landmarks_px: np.ndarray, visibility: Optional[np.ndarray]) -> None:
+        h, w = image.shape[:2]
+        x = landmarks_px[:, 0]
+        y = landmarks_px[:, 1]
+        shown = (x >= 0) & (x <= w) & (y >= 0) & (y <= h)
+        if visibility is not None:
+            shown &= visibility >= VISIBILITY_THRESHOLD
+        points = np.empty((NUM_LANDMARKS, 2), dtype=np.int32)
+        np.minimum(landmarks_px[:, 0], w - 1, out=points[:, 0], casting="unsafe")
+        np.minimum(landmarks_px[:, 1], h - 1, out=points[:, 1], casting="unsafe")
+
+        if len(self.connections):
+            pairs = self.connections[shown[self.connections].all(axis=1)]
+            if len(pairs):
+                cv2.polylines(image, list(points[pairs]), False, self.connection_color, self.connection_thickness)
+
+        for idx in np.flatnonzero(shown):
+            color, thickness, radius = self.landmark_specs[idx]
+            center = (int(points[idx, 0]), int(points[idx, 1]))
+            cv2.circle(image, center, max(radius + 1, int(radius * 1.2)), self.border_color, thickness)
+            cv2.circle(image, center, radius, color, thickness)
+
+    def draw_lines(self, image: np.ndarray, overlay_lines: list) -> None:
+        y = TEXT_ORIGIN[1]
         for line in overlay_lines:
-            cv2.putText(output, line, (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2, cv2.LINE_AA)
-            y += 28
+            self._line(line, y).blit(image)
+            y += LINE_HEIGHT
+
+    def _line(self, text: str, baseline: int) -> _TextLine:
+        key = (text, baseline)
+        cached = self._lines.get(key)
+        if cached is not None:
+            self._lines.move_to_end(key)
+            return cached
+        cached = self._lines[key] = _TextLine(text, TEXT_ORIGIN[0], baseline, self.text_color)
+        if len(self._lines) > self.cache_size:
+            self._lines.popitem(last=False)
+        return cached
 
-    cv2.putText(output, f"FPS: {fps:.1f}", (output.shape[1] - 160, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-    return output
\ No newline at end of file
+
+_default_renderer: Optional[OverlayRenderer] = None
+
+
+def draw_landmarks_and_info(frame, results, overlay_lines: Optional[list], fps: float):
+    """Compatibility wrapper around a shared BGR ``OverlayRenderer``; always returns a copy."""
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = OverlayRenderer()
+    landmarks_px = visibility = None
+    if results and results.pose_landmarks:
+        h, w = frame.shape[:2]
+        landmarks = results.pose_landmarks.landmark
+        landmarks_px = np.array([(int(lm.x * w), int(lm.y * h)) for lm in landmarks], dtype=np.int32)
+        visibility = np.array([lm.visibility for lm in landmarks], dtype=np.float32)
+    return _default_renderer.render(frame, landmarks_px, visibility, overlay_lines, fps)
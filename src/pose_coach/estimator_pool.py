@@ -0,0 +1,137 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+
+class EstimatorPool:
+    """Bounded pool of pre-warmed pose estimators shared between web sessions.
+
+    A session checks an estimator out on every frame; the first checkout pins
+    it to the session so MediaPipe keeps tracking the same person across
+    frames. Sessions that stop sending frames for ``idle_timeout_s`` are
+    unpinned and their estimator is reset and reused. Once ``max_size``
+    estimators exist, new sessions wait in FIFO order instead of getting a new
+    model; ``checkout`` returns None if the wait times out, and the session
+    keeps its place in the queue for the next attempt.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int = 4,
+        prewarm: int = 1,
+        idle_timeout_s: float = 30.0,
+    ):
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.idle_timeout_s = idle_timeout_s
+        self.created = 0
+        self.evictions = 0
+        self._idle: List[Any] = []
+        self._pinned: Dict[str, Any] = {}
+        self._last_seen: Dict[str, float] = {}
+        self._waiting: deque = deque()
+        self._cond = threading.Condition()
+        for _ in range(min(prewarm, self.max_size)):
+            self._idle.append(self._create())
+
+    def checkout(self, session_id: str, timeout: float = 1.0) -> Optional[Any]:
+        """Return the estimator pinned to ``session_id``, pinning one if needed."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._last_seen[session_id] = time.monotonic()
+            estimator = self._pinned.get(session_id)
+            if estimator is not None:
+                return estimator
+            if session_id not in self._waiting:
+                self._waiting.append(session_id)
+            while True:
+                self._evict_idle()
+                if self._waiting[0] == session_id:
+                    if self._idle:
+                        estimator = self._idle.pop()
+                        # Drop the previous session's track
+                        estimator.reset()
+                        self._pin(session_id, estimator)
+                        return estimator
+                    if self.created < self.max_size:
+                        # Reserve the slot; the model loads outside the lock
+                        self.created += 1
+                        self._waiting.popleft()
+                        self._cond.notify_all()
+                        break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(min(remaining, 0.25))
+
+        try:
+            estimator = self.factory()
+        except Exception:
+            with self._cond:
+                self.created -= 1
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._pinned[session_id] = estimator
+        return estimator
+
+    def checkin(self, session_id: str) -> None:
+        """Unpin ``session_id`` (e.g. when it stops streaming) and return its estimator."""
+        with self._cond:
+            self._release(session_id)
+            self._cond.notify_all()
+
+    def queue_position(self, session_id: str) -> int:
+        """0-based position of a waiting session, or -1 if it is not queued."""
+        with self._cond:
+            try:
+                return self._waiting.index(session_id)
+            except ValueError:
+                return -1
+
+    def close(self) -> None:
+        with self._cond:
+            estimators = self._idle + list(self._pinned.values())
+            self._idle = []
+            self._pinned.clear()
+            self._waiting.clear()
+        for estimator in estimators:
+            estimator.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "estimators": self.created,
+                "idle": len(self._idle),
+                "pinned": len(self._pinned),
+                "waiting": len(self._waiting),
+                "evictions": self.evictions,
+            }
+
+    def _create(self):
+        self.created += 1
+        return self.factory()
+
+    def _pin(self, session_id: str, estimator) -> None:
+        self._waiting.popleft()
+        self._pinned[session_id] = estimator
+        # The head of the queue moved; let the next waiter check
+        self._cond.notify_all()
+
+    def _release(self, session_id: str) -> None:
+        estimator = self._pinned.pop(session_id, None)
+        if estimator is not None:
+            self._idle.append(estimator)
+        self._last_seen.pop(session_id, None)
+        if session_id in self._waiting:
+            self._waiting.remove(session_id)
+
+    def _evict_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout_s
+        stale = [sid for sid, seen in self._last_seen.items() if seen < cutoff]
+        for sid in stale:
+            if sid in self._pinned:
+                self.evictions += 1
+            self._release(sid)
@@ -0,0 +1,138 @@
+import json
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .feedback import Analyzer, Feedback
+from .sequence import rounded_rep_time
+
+
+class JsonlWriter:
+    """Writes one JSON object per line from a background thread.
+
+    ``write`` only queues the event, so the frame loop never waits on a slow
+    disk or pipe. Serialization happens on the writer thread, which writes
+    through a large buffer and flushes whenever it has caught up, so a reader
+    tailing the output sees events promptly. ``"-"`` writes to stdout.
+    """
+
+    def __init__(self, path: str = "-", buffer_size: int = 1 << 16):
+        self.path = path
+        if path == "-":
+            self._file, self._owned = sys.stdout, False
+        else:
+            self._file, self._owned = open(path, "w", encoding="utf-8", buffering=buffer_size), True
+        self.written = 0
+        self.dropped = 0
+        self.error: Optional[BaseException] = None
+        self._queue: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._write_loop, name="jsonl-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, event: Dict[str, Any]) -> None:
+        self._queue.put(event)
+
+    def close(self) -> None:
+        """Write everything still queued, then flush (and close a file we opened)."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+        if self._owned:
+            self._file.close()
+
+    def _write_loop(self) -> None:
+        dumps = json.JSONEncoder(separators=(",", ":")).encode
+        while True:
+            event = self._queue.get()
+            if event is None:
+                break
+            if self.error is not None:
+                # The reader went away (e.g. a closed pipe); keep draining so
+                # producers never block, but stop writing
+                self.dropped += 1
+                continue
+            try:
+                self._file.write(dumps(event) + "\n")
+                self.written += 1
+                if self._queue.empty():
+                    self._file.flush()
+            except (OSError, ValueError) as exc:
+                self.error = exc
+                self.dropped += 1
+        if self.error is None:
+            try:
+                self._file.flush()
+            except (OSError, ValueError) as exc:
+                self.error = exc
+
+
+class FeedbackEvents:
+    """Turns one athlete's per-frame ``Feedback`` into change events.
+
+    Emits ``person`` when a detection starts or stops, ``phase`` on every
+    phase change, ``rep`` for each counted rep (with its timing when the
+    analyzer has a ``RepCounter``) and ``faults`` whenever the set of form
+    faults changes. ``fields`` are added to every event, e.g. a person ID.
+    Only cached fault names are used, so no overlay text is ever built.
+    """
+
+    def __init__(
+        self,
+        writer: JsonlWriter,
+        analyzer: Optional[Analyzer] = None,
+        clock: Callable[[], float] = time.time,
+        **fields: Any,
+    ):
+        self.writer = writer
+        self.analyzer = analyzer
+        self.clock = clock
+        self.fields = fields
+        self.frames = 0
+        self.detected_frames = 0
+        self.events = 0
+        self.reps: Optional[int] = None
+        self._detected: Optional[bool] = None
+        self._phase: Optional[str] = None
+        self._faults = 0
+
+    def observe(self, feedback: Feedback, frame: Optional[int] = None) -> None:
+        if frame is None:
+            frame = self.frames
+        self.frames += 1
+        detected = feedback.detected
+        if detected:
+            self.detected_frames += 1
+        if detected != self._detected:
+            self._detected = detected
+            self._emit("person", frame, detected=detected)
+        if feedback.phase is not None and feedback.phase != self._phase:
+            self._phase = feedback.phase
+            self._emit("phase", frame, phase=feedback.phase, reps=feedback.reps)
+        if feedback.reps is not None:
+            if self.reps is not None and feedback.reps > self.reps:
+                self._emit_rep(feedback, frame)
+            self.reps = feedback.reps
+        if detected and feedback.faults != self._faults:
+            names = feedback.kind.fault_names
+            previous, self._faults = self._faults, feedback.faults
+            payload = dict(
+                faults=names(feedback.faults),
+                raised=names(feedback.faults & ~previous),
+                cleared=names(previous & ~feedback.faults),
+            )
+            if feedback.score is not None:
+                payload["score"] = feedback.score
+            self._emit("faults", frame, **payload)
+
+    def _emit_rep(self, feedback: Feedback, frame: int) -> None:
+        counter = getattr(self.analyzer, "counter", None)
+        timing = rounded_rep_time(counter.rep_times[-1]) if counter is not None and counter.rep_times else {}
+        timing.pop("rep", None)
+        self._emit("rep", frame, reps=feedback.reps, phase=feedback.phase, **timing)
+
+    def _emit(self, kind: str, frame: int, **payload: Any) -> None:
+        self.events += 1
+        self.writer.write(dict(event=kind, frame=frame, time=round(self.clock(), 3), **self.fields, **payload))
@@ -1,9 +1,4 @@
-from typing import List
-
-import numpy as np
-
-from ..feedback import Analyzer
-from ..angles import angle_at_point, angle_between_vectors
+from ..feedback import FormFault, RepCoach, all_clear, tip
 
 # Landmarks
 LEFT_SHOULDER = 11
@@ -14,75 +9,62 @@ LEFT_WRIST = 15
 RIGHT_WRIST = 16
 LEFT_HIP = 23
 RIGHT_HIP = 24
-LEFT_KNEE = 25
-RIGHT_KNEE = 26
-
-
-class BarbellRowCoach(Analyzer):
-    def __init__(self):
-        self.reps = 0
-        self.state = "down"  # bar down -> pull up
-
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Exercise - Barbell Row"]
-        if landmarks_px is None:
-            tips.append("No person detected. Step back and ensure full body in frame.")
-            tips.append(f"Reps: {self.reps}")
-            return tips
-
-        left_side_vis = float(visibility[LEFT_ELBOW]) if visibility is not None else 0.0
-        right_side_vis = float(visibility[RIGHT_ELBOW]) if visibility is not None else 0.0
-        use_left = left_side_vis >= right_side_vis
-
-        if use_left:
-            shoulder = landmarks_px[LEFT_SHOULDER].astype(float)
-            elbow = landmarks_px[LEFT_ELBOW].astype(float)
-            wrist = landmarks_px[LEFT_WRIST].astype(float)
-            hip = landmarks_px[LEFT_HIP].astype(float)
-            knee = landmarks_px[LEFT_KNEE].astype(float)
-            other_shoulder = landmarks_px[RIGHT_SHOULDER].astype(float)
-        else:
-            shoulder = landmarks_px[RIGHT_SHOULDER].astype(float)
-            elbow = landmarks_px[RIGHT_ELBOW].astype(float)
-            wrist = landmarks_px[RIGHT_WRIST].astype(float)
-            hip = landmarks_px[RIGHT_HIP].astype(float)
-            knee = landmarks_px[RIGHT_KNEE].astype(float)
-            other_shoulder = landmarks_px[LEFT_SHOULDER].astype(float)
-
-        # Hip hinge: torso angle vs horizontal. We approximate torso vector as shoulder->hip
-        torso_vec = hip - shoulder
-        horizontal_vec = np.array([1.0, 0.0])
-        torso_angle_from_horizontal = angle_between_vectors(torso_vec, horizontal_vec)
-        # Neutral hinge typically ~ 20-45 deg above horizontal (i.e., torso leaned forward)
-        hip_hinge_ok = 20 <= torso_angle_from_horizontal <= 60
-
-        # Neutral spine: shoulders roughly level (small shoulder-to-shoulder slope)
-        shoulder_slope = abs(other_shoulder[1] - shoulder[1]) / (abs(other_shoulder[0] - shoulder[0]) + 1e-6)
-        neutral_spine = shoulder_slope < 0.4
-
-        # Elbow path: wrist under elbow at top; vertical pull
-        elbow_angle = angle_at_point(shoulder, elbow, wrist)
-        bar_up = elbow_angle < 70
-        bar_down = elbow_angle > 140
-        if self.state == "down" and bar_up:
-            self.state = "up"
-            self.reps += 1
-        elif self.state == "up" and bar_down:
-            self.state = "down"
-
-        # Wrist under elbow check
-        wrist_under_elbow = abs(wrist[0] - elbow[0]) < 0.4 * np.linalg.norm(elbow - shoulder)
-
-        tips.append(f"Reps: {self.reps} | Phase: {self.state}")
-
-        if not hip_hinge_ok:
-            tips.append("Hinge more at the hips; keep torso ~30-45° to the floor.")
-        if not neutral_spine:
-            tips.append("Keep spine neutral; avoid twisting or rounding.")
-        if not wrist_under_elbow:
-            tips.append("Pull elbows back; keep wrist under elbow for a straight path.")
-
-        if hip_hinge_ok and neutral_spine and wrist_under_elbow:
-            tips.append("Nice rows! Strong positioning.")
 
-        return tips
\ No newline at end of file
+LEFT_SIDE = (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST, LEFT_HIP, RIGHT_SHOULDER)
+RIGHT_SIDE = (RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST, RIGHT_HIP, LEFT_SHOULDER)
+
+
+class BarbellRowFault(FormFault):
+    NO_HINGE = 1
+    SPINE_TWIST = 2
+    ELBOW_PATH = 4
+
+
+class BarbellRowCoach(RepCoach):
+    TRANSITIONS = {"down": [("bar_up", "up")], "up": [("bar_down", "down")]}
+    COUNT_PHASE = "up"
+    START_PHASE = "down"
+    THRESHOLDS = {"bar_up": 70, "bar_down": 140}
+    TEMPO = {"concentric": "down", "eccentric": "up"}
+    TITLE = "Mode: Exercise - Barbell Row"
+    NO_PERSON = "No person detected. Step back and ensure full body in frame."
+    FAULTS = BarbellRowFault
+    CHECKS = {
+        BarbellRowFault.NO_HINGE: "hip_hinge_ok",
+        BarbellRowFault.SPINE_TWIST: "neutral_spine",
+        BarbellRowFault.ELBOW_PATH: "wrist_under_elbow",
+    }
+    TIPS = (
+        tip(BarbellRowFault.NO_HINGE, "Hinge more at the hips; keep torso ~30-45° to the floor."),
+        tip(BarbellRowFault.SPINE_TWIST, "Keep spine neutral; avoid twisting or rounding."),
+        tip(BarbellRowFault.ELBOW_PATH, "Pull elbows back; keep wrist under elbow for a straight path."),
+        all_clear("Nice rows! Strong positioning."),
+    )
+
+    def measure(self, f) -> dict:
+        use_left = f.vis(LEFT_ELBOW) >= f.vis(RIGHT_ELBOW)
+
+        def side(points):
+            shoulder, elbow, wrist, hip, other_shoulder = points
+            # Hip hinge: torso angle vs horizontal. We approximate torso vector as shoulder->hip
+            torso_angle_from_horizontal = f.axis_angle(shoulder, hip, "right")
+
+            # Neutral spine: shoulders roughly level (small shoulder-to-shoulder slope)
+            shoulder_slope = abs(f.dy(shoulder, other_shoulder)) / (abs(f.dx(shoulder, other_shoulder)) + 1e-6)
+
+            # Elbow path: wrist under elbow at top; vertical pull
+            elbow_angle = f.angle(shoulder, elbow, wrist)
+            return {
+                "elbow_angle": elbow_angle,
+                # Neutral hinge typically ~ 20-45 deg above horizontal (i.e., torso leaned forward)
+                "hip_hinge_ok": (20 <= torso_angle_from_horizontal) & (torso_angle_from_horizontal <= 60),
+                "neutral_spine": shoulder_slope < 0.4,
+                "bar_up": elbow_angle < self.thresholds["bar_up"],
+                "bar_down": elbow_angle > self.thresholds["bar_down"],
+                # Wrist under elbow check
+                "wrist_under_elbow": abs(f.dx(elbow, wrist)) < 0.4 * f.segment_length(shoulder, elbow),
+            }
+
+        m = f.select(use_left, side, LEFT_SIDE, RIGHT_SIDE)
+        m["use_left"] = use_left
+        return m
@@ -1,68 +1,36 @@
-from typing import List
-
-import numpy as np
-
-from ..feedback import Analyzer
-from ..angles import angle_between_vectors, angle_at_point
-
-LEFT_SHOULDER = 11
-RIGHT_SHOULDER = 12
-LEFT_ELBOW = 13
-RIGHT_ELBOW = 14
-LEFT_WRIST = 15
-RIGHT_WRIST = 16
-LEFT_HIP = 23
-RIGHT_HIP = 24
-
-
-class BentOverRowCoach(Analyzer):
-    def __init__(self):
-        self.reps = 0
-        self.state = "down"
-
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Exercise - Bent-over Row"]
-        if landmarks_px is None:
-            tips.append("No person detected.")
-            tips.append(f"Reps: {self.reps}")
-            return tips
-
-        ls = landmarks_px[LEFT_SHOULDER].astype(float)
-        rs = landmarks_px[RIGHT_SHOULDER].astype(float)
-        le = landmarks_px[LEFT_ELBOW].astype(float)
-        re = landmarks_px[RIGHT_ELBOW].astype(float)
-        lw = landmarks_px[LEFT_WRIST].astype(float)
-        rw = landmarks_px[RIGHT_WRIST].astype(float)
-        lh = landmarks_px[LEFT_HIP].astype(float)
-        rh = landmarks_px[RIGHT_HIP].astype(float)
-
-        shoulder = (ls + rs) / 2.0
-        elbow = (le + re) / 2.0
-        wrist = (lw + rw) / 2.0
-        hip = (lh + rh) / 2.0
-
-        torso_vec = hip - shoulder
-        torso_angle_from_horizontal = angle_between_vectors(torso_vec, np.array([1.0, 0.0]))
-        hinge_ok = 20 <= torso_angle_from_horizontal <= 60
-
-        elbow_angle = angle_at_point(shoulder, elbow, wrist)
-        at_top = elbow_angle < 70
-        at_bottom = elbow_angle > 140
-
-        if self.state == "down" and at_top:
-            self.state = "up"
-            self.reps += 1
-        elif self.state == "up" and at_bottom:
-            self.state = "down"
-
-        wrist_under_elbow = abs(wrist[0] - elbow[0]) < 0.4 * np.linalg.norm(elbow - shoulder)
-
-        tips.append(f"Reps: {self.reps} | Phase: {self.state}")
-        if not hinge_ok:
-            tips.append("Hinge more at hips; torso ~30-45° to floor.")
-        if not wrist_under_elbow:
-            tips.append("Keep bar under elbows; pull to lower ribs.")
-        if hinge_ok and wrist_under_elbow:
-            tips.append("Strong rows. Squeeze lats at top.")
-
-        return tips
\ No newline at end of file
+from ..feedback import FormFault, RepCoach, all_clear, tip
+
+
+class BentOverRowFault(FormFault):
+    NO_HINGE = 1
+    ELBOW_PATH = 2
+
+
+class BentOverRowCoach(RepCoach):
+    TRANSITIONS = {"down": [("at_top", "up")], "up": [("at_bottom", "down")]}
+    COUNT_PHASE = "up"
+    START_PHASE = "down"
+    THRESHOLDS = {"at_top": 70, "at_bottom": 140}
+    TEMPO = {"concentric": "down", "eccentric": "up"}
+    TITLE = "Mode: Exercise - Bent-over Row"
+    FAULTS = BentOverRowFault
+    CHECKS = {
+        BentOverRowFault.NO_HINGE: "hinge_ok",
+        BentOverRowFault.ELBOW_PATH: "wrist_under_elbow",
+    }
+    TIPS = (
+        tip(BentOverRowFault.NO_HINGE, "Hinge more at hips; torso ~30-45° to floor."),
+        tip(BentOverRowFault.ELBOW_PATH, "Keep bar under elbows; pull to lower ribs."),
+        all_clear("Strong rows. Squeeze lats at top."),
+    )
+
+    def measure(self, f) -> dict:
+        torso_angle_from_horizontal = f.axis_angle("shoulder", "hip", "right")
+        elbow_angle = f.angle("shoulder", "elbow", "wrist")
+        return {
+            "elbow_angle": elbow_angle,
+            "hinge_ok": (20 <= torso_angle_from_horizontal) & (torso_angle_from_horizontal <= 60),
+            "at_top": elbow_angle < self.thresholds["at_top"],
+            "at_bottom": elbow_angle > self.thresholds["at_bottom"],
+            "wrist_under_elbow": abs(f.x("wrist") - f.x("elbow")) < 0.4 * f.segment_length("shoulder", "elbow"),
+        }
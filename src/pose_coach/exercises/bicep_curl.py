@@ -1,9 +1,4 @@
-from typing import List
-
-import numpy as np
-
-from ..feedback import Analyzer
-from ..angles import angle_at_point
+from ..feedback import Feedback, FormFault, RepCoach, all_clear, tip
 
 # MediaPipe landmark indices for readability
 LEFT_SHOULDER = 11
@@ -15,78 +10,73 @@ RIGHT_WRIST = 16
 LEFT_HIP = 23
 RIGHT_HIP = 24
 
-
-class BicepCurlCoach(Analyzer):
-    def __init__(self):
-        self.reps = 0
-        self.state = "down"  # down -> up
+LEFT_ARM = (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST, LEFT_HIP)
+RIGHT_ARM = (RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST, RIGHT_HIP)
+
+
+class BicepCurlFault(FormFault):
+    ELBOW_DRIFT = 1
+    SHOULDER_SWING = 2
+    PARTIAL_ROM = 4
+
+
+class BicepCurlCoach(RepCoach):
+    TRANSITIONS = {"down": [("at_top", "up")], "up": [("at_bottom", "down")]}
+    COUNT_PHASE = "up"
+    START_PHASE = "down"
+    THRESHOLDS = {"at_bottom": 150, "at_top": 50}
+    TEMPO = {"concentric": "down", "eccentric": "up"}
+    TITLE = "Mode: Exercise - Bicep Curl"
+    NO_PERSON = "No person detected. Step back and ensure full body in frame."
+    FAULTS = BicepCurlFault
+    CHECKS = {
+        BicepCurlFault.ELBOW_DRIFT: "elbow_stable",
+        BicepCurlFault.SHOULDER_SWING: "shoulder_stable",
+        BicepCurlFault.PARTIAL_ROM: "rom_ok",
+    }
+    TIPS = (
+        tip(BicepCurlFault.ELBOW_DRIFT, "Keep your elbow close; avoid drifting forward/back."),
+        tip(BicepCurlFault.SHOULDER_SWING, "Avoid swinging shoulders; isolate the biceps."),
+        tip(BicepCurlFault.PARTIAL_ROM, "Use full range: extend at bottom and squeeze at top."),
+        all_clear("Great form! Keep it up."),
+    )
+
+    def __init__(self, thresholds=None, min_dwell=None):
+        super().__init__(thresholds, min_dwell)
         self.side_hint = "auto"
 
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Exercise - Bicep Curl"]
-        if landmarks_px is None:
-            tips.append("No person detected. Step back and ensure full body in frame.")
-            tips.append(f"Reps: {self.reps}")
-            return tips
-
+    def measure(self, f) -> dict:
         # Choose side with better visibility
-        left_vis = float(visibility[LEFT_ELBOW]) if visibility is not None else 0.0
-        right_vis = float(visibility[RIGHT_ELBOW]) if visibility is not None else 0.0
-        use_left = left_vis >= right_vis
-
-        if use_left:
-            shoulder, elbow, wrist, hip = (
-                landmarks_px[LEFT_SHOULDER],
-                landmarks_px[LEFT_ELBOW],
-                landmarks_px[LEFT_WRIST],
-                landmarks_px[LEFT_HIP],
-            )
-            side = "Left"
-        else:
-            shoulder, elbow, wrist, hip = (
-                landmarks_px[RIGHT_SHOULDER],
-                landmarks_px[RIGHT_ELBOW],
-                landmarks_px[RIGHT_WRIST],
-                landmarks_px[RIGHT_HIP],
-            )
-            side = "Right"
-
-        # Angles
-        elbow_angle = angle_at_point(shoulder.astype(float), elbow.astype(float), wrist.astype(float))
-        shoulder_angle = angle_at_point(hip.astype(float), shoulder.astype(float), elbow.astype(float))
-
-        # Rep counting thresholds
-        at_bottom = elbow_angle > 150
-        at_top = elbow_angle < 50
-
-        if self.state == "down" and at_top:
-            self.state = "up"
-            self.reps += 1
-        elif self.state == "up" and at_bottom:
-            self.state = "down"
-
-        # Form checks
-        # 1) Elbow should stay near torso: shoulder-elbow vertical alignment (x-distance small compared to upper arm length)
-        upper_arm_len = np.linalg.norm(shoulder - elbow) + 1e-6
-        elbow_torso_dx = abs(elbow[0] - shoulder[0])
-        elbow_stable = elbow_torso_dx < 0.6 * upper_arm_len
-
-        # 2) Shoulder should remain stable (avoid swinging): shoulder angle shouldn't exceed ~60 deg at top
-        shoulder_stable = shoulder_angle < 70
-
-        # 3) Full ROM: At bottom, elbow_angle should exceed 150; at top, below 50
-        rom_ok = at_top or at_bottom
-
-        tips.append(f"Side: {side} | Reps: {self.reps} | Phase: {self.state}")
-
-        if not elbow_stable:
-            tips.append("Keep your elbow close; avoid drifting forward/back.")
-        if not shoulder_stable:
-            tips.append("Avoid swinging shoulders; isolate the biceps.")
-        if not rom_ok:
-            tips.append("Use full range: extend at bottom and squeeze at top.")
-
-        if elbow_stable and shoulder_stable and rom_ok:
-            tips.append("Great form! Keep it up.")
-
-        return tips
\ No newline at end of file
+        use_left = f.vis(LEFT_ELBOW) >= f.vis(RIGHT_ELBOW)
+
+        def arm(points):
+            shoulder, elbow, wrist, hip = points
+            elbow_angle = f.angle(shoulder, elbow, wrist)
+
+            # Rep counting thresholds
+            at_bottom = elbow_angle > self.thresholds["at_bottom"]
+            at_top = elbow_angle < self.thresholds["at_top"]
+
+            # Form checks
+            # 1) Elbow should stay near torso: shoulder-elbow vertical alignment (x-distance small compared to upper arm length)
+            upper_arm_len = f.segment_length(elbow, shoulder) + 1e-6
+            elbow_torso_dx = abs(f.dx(shoulder, elbow))
+
+            return {
+                "elbow_angle": elbow_angle,
+                "at_bottom": at_bottom,
+                "at_top": at_top,
+                "elbow_stable": elbow_torso_dx < 0.6 * upper_arm_len,
+                # 2) Shoulder should remain stable (avoid swinging): shoulder angle shouldn't exceed ~60 deg at top
+                "shoulder_stable": f.angle(hip, shoulder, elbow) < 70,
+                # 3) Full ROM: At bottom, elbow_angle should exceed 150; at top, below 50
+                "rom_ok": at_top | at_bottom,
+            }
+
+        m = f.select(use_left, arm, LEFT_ARM, RIGHT_ARM)
+        m["use_left"] = use_left
+        return m
+
+    @classmethod
+    def status_line(cls, feedback: Feedback) -> str:
+        return f"Side: {feedback.side} | Reps: {feedback.reps} | Phase: {feedback.phase}"
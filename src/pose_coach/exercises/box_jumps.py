@@ -1,49 +1,50 @@
-from typing import List
-
 import numpy as np
 
-from ..feedback import Analyzer
+from ..feedback import FormFault, RepCoach, always, tip
+
+
+class BoxJumpFault(FormFault):
+    STIFF_LANDING = 1
 
-LEFT_ANKLE = 27
-RIGHT_ANKLE = 28
-LEFT_KNEE = 25
-RIGHT_KNEE = 26
 
+class BoxJumpCoach(RepCoach):
+    TRANSITIONS = {"ground": [("airborne", "air")], "air": [("landed", "ground")]}
+    COUNT_PHASE = "ground"
+    START_PHASE = "ground"
+    THRESHOLDS = {"airborne": 8}
+    TITLE = "Mode: Exercise - Box Jump"
+    REP_LABEL = "Jumps"
+    FAULTS = BoxJumpFault
+    CHECKS = {
+        BoxJumpFault.STIFF_LANDING: "knee_bend_on_landing",
+    }
+    TIPS = (
+        tip(BoxJumpFault.STIFF_LANDING, "Absorb landing by bending knees and hips."),
+        always("Land softly on entire foot; avoid stiff knees."),
+    )
 
-class BoxJumpCoach(Analyzer):
-    def __init__(self):
-        self.jumps = 0
-        self.state = "ground"
+    def __init__(self, thresholds=None, min_dwell=None):
+        super().__init__(thresholds, min_dwell)
         self.ground_y = None
 
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Exercise - Box Jump"]
-        if landmarks_px is None:
-            tips.append("No person detected.")
-            tips.append(f"Jumps: {self.jumps}")
-            return tips
-
-        la = landmarks_px[LEFT_ANKLE].astype(float)
-        ra = landmarks_px[RIGHT_ANKLE].astype(float)
-        lk = landmarks_px[LEFT_KNEE].astype(float)
-        rk = landmarks_px[RIGHT_KNEE].astype(float)
-
-        ankle_y = (la[1] + ra[1]) / 2.0
-        if self.ground_y is None or ankle_y > self.ground_y:
-            self.ground_y = ankle_y
-
-        airborne = ankle_y < self.ground_y - 8
-
-        if self.state == "ground" and airborne:
-            self.state = "air"
-        elif self.state == "air" and not airborne:
-            self.state = "ground"
-            self.jumps += 1
-
-        knee_bend_on_landing = (lk[1] + rk[1]) / 2.0 < self.ground_y - 12
-
-        tips.append(f"Jumps: {self.jumps} | Phase: {self.state}")
-        if not knee_bend_on_landing:
-            tips.append("Absorb landing by bending knees and hips.")
-        tips.append("Land softly on entire foot; avoid stiff knees.")
-        return tips
\ No newline at end of file
+    @property
+    def jumps(self) -> int:
+        return self.counter.reps
+
+    def measure(self, f) -> dict:
+        ankle_y = f.y("ankle")
+        # Ground level is the lowest ankle position seen so far
+        if f.single:
+            if self.ground_y is None or ankle_y > self.ground_y:
+                self.ground_y = ankle_y
+            ground_y = self.ground_y
+        else:
+            seen = ankle_y if self.ground_y is None else np.maximum(ankle_y, self.ground_y)
+            ground_y = np.maximum.accumulate(seen)
+            self.ground_y = float(ground_y[-1])
+
+        return {
+            "airborne": ankle_y < ground_y - self.thresholds["airborne"],
+            "landed": ankle_y >= ground_y - self.thresholds["airborne"],
+            "knee_bend_on_landing": f.y("knee") < ground_y - 12,
+        }
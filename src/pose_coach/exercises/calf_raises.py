@@ -1,43 +1,31 @@
-from typing import List
-
-import numpy as np
-
-from ..feedback import Analyzer
-
-LEFT_ANKLE = 27
-RIGHT_ANKLE = 28
-
-
-class CalfRaiseCoach(Analyzer):
-    def __init__(self):
-        self.reps = 0
-        self.state = "down"
+from ..feedback import RepCoach, always
+
+
+class CalfRaiseCoach(RepCoach):
+    TRANSITIONS = {"down": [("at_top", "up")], "up": [("at_bottom", "down")]}
+    COUNT_PHASE = "up"
+    START_PHASE = "down"
+    THRESHOLDS = {"at_top": 12, "at_bottom": 4}
+    TEMPO = {"concentric": "down", "eccentric": "up"}
+    TITLE = "Mode: Exercise - Calf Raise"
+    NO_PERSON = "No person detected. Ensure lower body in frame."
+    TIPS = (
+        always("Go up on toes fully; pause and lower slowly."),
+    )
+
+    def __init__(self, thresholds=None, min_dwell=None):
+        super().__init__(thresholds, min_dwell)
         self.baseline_y = None
 
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Exercise - Calf Raise"]
-        if landmarks_px is None:
-            tips.append("No person detected. Ensure lower body in frame.")
-            tips.append(f"Reps: {self.reps}")
-            return tips
-
-        la = landmarks_px[LEFT_ANKLE].astype(float)
-        ra = landmarks_px[RIGHT_ANKLE].astype(float)
-        ankle_y = ((la[1] + ra[1]) / 2.0)
-
+    def measure(self, f) -> dict:
+        ankle_y = f.y("ankle")
         if self.baseline_y is None:
-            self.baseline_y = ankle_y
+            # The first detected frame sets the resting heel height
+            self.baseline_y = ankle_y if f.single else float(ankle_y[0])
 
         rise = self.baseline_y - ankle_y
-        at_top = rise > 12
-        at_bottom = rise < 4
-
-        if self.state == "down" and at_top:
-            self.state = "up"
-            self.reps += 1
-        elif self.state == "up" and at_bottom:
-            self.state = "down"
-
-        tips.append(f"Reps: {self.reps} | Phase: {self.state}")
-        tips.append("Go up on toes fully; pause and lower slowly.")
-        return tips
\ No newline at end of file
+        return {
+            "rise": rise,
+            "at_top": rise > self.thresholds["at_top"],
+            "at_bottom": rise < self.thresholds["at_bottom"],
+        }
@@ -1,59 +1,37 @@
-from typing import List
-
-import numpy as np
-
-from ..feedback import Analyzer
-from ..angles import angle_between_vectors
-
-LEFT_SHOULDER = 11
-RIGHT_SHOULDER = 12
-LEFT_HIP = 23
-RIGHT_HIP = 24
-LEFT_KNEE = 25
-RIGHT_KNEE = 26
-
-
-class DeadliftCoach(Analyzer):
-    def __init__(self):
-        self.reps = 0
-        self.state = "down"
-
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Exercise - Deadlift"]
-        if landmarks_px is None:
-            tips.append("No person detected. Ensure full body in frame.")
-            tips.append(f"Reps: {self.reps}")
-            return tips
-
-        ls = landmarks_px[LEFT_SHOULDER].astype(float)
-        rs = landmarks_px[RIGHT_SHOULDER].astype(float)
-        lh = landmarks_px[LEFT_HIP].astype(float)
-        rh = landmarks_px[RIGHT_HIP].astype(float)
-        lk = landmarks_px[LEFT_KNEE].astype(float)
-        rk = landmarks_px[RIGHT_KNEE].astype(float)
-
-        shoulder = (ls + rs) / 2.0
-        hip = (lh + rh) / 2.0
-        knee = (lk + rk) / 2.0
-
-        back_vec = shoulder - hip
-        thigh_vec = knee - hip
-        back_from_vertical = angle_between_vectors(back_vec, np.array([0.0, -1.0]))
-        hip_above_knee = hip[1] < knee[1]
-
-        at_top = back_from_vertical < 15 and hip_above_knee
-        at_bottom = back_from_vertical > 45
-
-        if self.state == "down" and at_top:
-            self.state = "up"
-            self.reps += 1
-        elif self.state == "up" and at_bottom:
-            self.state = "down"
-
-        tips.append(f"Reps: {self.reps} | Phase: {self.state}")
-        if back_from_vertical > 35:
-            tips.append("Keep back flat; brace core and pack lats.")
-        if hip[1] > shoulder[1]:
-            tips.append("Hips and shoulders should rise together.")
-        tips.append("Keep the bar close; push the floor away.")
-        return tips
\ No newline at end of file
+from ..feedback import FormFault, RepCoach, always, tip
+
+
+class DeadliftFault(FormFault):
+    BACK_ROUNDED = 1
+    HIPS_RISE_EARLY = 2
+
+
+class DeadliftCoach(RepCoach):
+    TRANSITIONS = {"down": [("at_top", "up")], "up": [("at_bottom", "down")]}
+    COUNT_PHASE = "up"
+    START_PHASE = "down"
+    THRESHOLDS = {"at_top": 15, "at_bottom": 45}
+    TEMPO = {"concentric": "down", "eccentric": "up"}
+    TITLE = "Mode: Exercise - Deadlift"
+    NO_PERSON = "No person detected. Ensure full body in frame."
+    FAULTS = DeadliftFault
+    CHECKS = {
+        DeadliftFault.BACK_ROUNDED: "back_flat",
+        DeadliftFault.HIPS_RISE_EARLY: "hips_rise_with_shoulders",
+    }
+    TIPS = (
+        tip(DeadliftFault.BACK_ROUNDED, "Keep back flat; brace core and pack lats."),
+        tip(DeadliftFault.HIPS_RISE_EARLY, "Hips and shoulders should rise together."),
+        always("Keep the bar close; push the floor away."),
+    )
+
+    def measure(self, f) -> dict:
+        back_from_vertical = f.axis_angle("hip", "shoulder", "up")
+        hip_above_knee = f.y("hip") < f.y("knee")
+        return {
+            "back_from_vertical": back_from_vertical,
+            "at_top": (back_from_vertical < self.thresholds["at_top"]) & hip_above_knee,
+            "at_bottom": back_from_vertical > self.thresholds["at_bottom"],
+            "back_flat": back_from_vertical <= 35,
+            "hips_rise_with_shoulders": f.y("hip") <= f.y("shoulder"),
+        }
@@ -0,0 +1,166 @@
+import math
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+import numpy as np
+
+from .angles import angles_at_points, angles_between_vectors
+
+# Named midpoints of left/right landmark pairs
+MIDPOINTS: Dict[str, Tuple[int, int]] = {
+    "shoulder": (11, 12),
+    "elbow": (13, 14),
+    "wrist": (15, 16),
+    "hip": (23, 24),
+    "knee": (25, 26),
+    "ankle": (27, 28),
+}
+
+# Reference directions in image coordinates (y grows downwards)
+AXES: Dict[str, Tuple[float, float]] = {
+    "up": (0.0, -1.0),
+    "down": (0.0, 1.0),
+    "right": (1.0, 0.0),
+}
+
+Point = Union[int, str]
+
+
+class PoseFeatures:
+    """Derived quantities of a pose, computed on first access and cached.
+
+    Points are addressed by landmark index or by a ``MIDPOINTS`` name such as
+    ``"hip"``. Landmarks may be one frame ``(33, 2)`` or a sequence
+    ``(T, 33, 2)``. For a frame every accessor returns Python floats (points
+    and vectors are ``(x, y)`` tuples); for a sequence it returns arrays with a
+    leading ``T`` axis. Checks written with ``x``/``y``/``angle``/... therefore
+    run unchanged on either. The scalar path repeats the vectorized kernels'
+    arithmetic step for step, including ``np.arccos`` (which can differ from
+    ``math.acos`` in the last bit), so per-frame and batch values are
+    bit-identical.
+
+    Build one per frame and pass it to every analyzer that looks at that frame.
+    """
+
+    __slots__ = ("landmarks", "visibility", "frame_shape", "single", "_cache")
+
+    def __init__(self, landmarks_px: np.ndarray, visibility: Optional[np.ndarray] = None, frame_shape=None):
+        self.landmarks = landmarks_px
+        self.visibility = visibility
+        self.frame_shape = frame_shape
+        self.single = landmarks_px.ndim == 2
+        self._cache: Dict[Hashable, object] = {}
+
+    def point(self, p: Point):
+        """Landmark or named midpoint as floats: ``(x, y)`` or ``(T, 2)``."""
+        value = self._cache.get(p)
+        if value is None:
+            if isinstance(p, str):
+                left, right = MIDPOINTS[p]
+                l, r = self.point(left), self.point(right)
+                if self.single:
+                    value = ((l[0] + r[0]) / 2.0, (l[1] + r[1]) / 2.0)
+                else:
+                    value = (l + r) / 2.0
+            elif self.single:
+                x, y = self.landmarks[p].tolist()
+                value = (float(x), float(y))
+            else:
+                value = self.landmarks[:, p, :].astype(float)
+            self._cache[p] = value
+        return value
+
+    def x(self, p: Point):
+        value = self.point(p)
+        return value[0] if self.single else value[:, 0]
+
+    def y(self, p: Point):
+        value = self.point(p)
+        return value[1] if self.single else value[:, 1]
+
+    def vis(self, i: int):
+        """Visibility of landmark ``i``; 0.0 when the caller passed none."""
+        if self.visibility is None:
+            return 0.0 if self.single else np.zeros(len(self.landmarks))
+        return float(self.visibility[i]) if self.single else self.visibility[:, i]
+
+    def select(self, mask, measure: Callable[[Any], Dict[str, Any]], first, second) -> Dict[str, Any]:
+        """``measure(first)`` where ``mask`` holds, else ``measure(second)``.
+
+        Used for side-dependent checks: a frame only measures the chosen
+        side, a sequence measures both and picks per frame.
+        """
+        if self.single:
+            return measure(first if mask else second)
+        a, b = measure(first), measure(second)
+        return {key: np.where(mask, a[key], b[key]) for key in a}
+
+    def vector(self, a: Point, b: Point):
+        """Vector from ``a`` to ``b``."""
+        key = ("vector", a, b)
+        value = self._cache.get(key)
+        if value is None:
+            pa, pb = self.point(a), self.point(b)
+            if self.single:
+                value = (pb[0] - pa[0], pb[1] - pa[1])
+            else:
+                value = pb - pa
+            self._cache[key] = value
+        return value
+
+    def dx(self, a: Point, b: Point):
+        """Horizontal component of ``a -> b``."""
+        value = self.vector(a, b)
+        return value[0] if self.single else value[:, 0]
+
+    def dy(self, a: Point, b: Point):
+        """Vertical component of ``a -> b`` (positive is downwards)."""
+        value = self.vector(a, b)
+        return value[1] if self.single else value[:, 1]
+
+    def angle(self, a: Point, b: Point, c: Point):
+        """Angle ABC in degrees at ``b``."""
+        key = ("angle", a, b, c)
+        value = self._cache.get(key)
+        if value is None:
+            if self.single:
+                ax, ay = self.point(a)
+                bx, by = self.point(b)
+                cx, cy = self.point(c)
+                value = _angle_2d(ax - bx, ay - by, cx - bx, cy - by)
+            else:
+                value = angles_at_points(self.point(a), self.point(b), self.point(c))
+            self._cache[key] = value
+        return value
+
+    def axis_angle(self, a: Point, b: Point, axis: str):
+        """Angle in degrees between the vector ``a -> b`` and an ``AXES`` direction."""
+        key = ("axis", a, b, axis)
+        value = self._cache.get(key)
+        if value is None:
+            if self.single:
+                vx, vy = self.vector(a, b)
+                value = _angle_2d(vx, vy, *AXES[axis])
+            else:
+                value = angles_between_vectors(self.vector(a, b), np.array(AXES[axis]))
+            self._cache[key] = value
+        return value
+
+    def segment_length(self, a: Point, b: Point):
+        """Euclidean distance between ``a`` and ``b``."""
+        key = ("length", a, b)
+        value = self._cache.get(key)
+        if value is None:
+            v = self.vector(a, b)
+            if self.single:
+                value = math.sqrt(v[0] * v[0] + v[1] * v[1])
+            else:
+                value = np.sqrt(v[:, 0] * v[:, 0] + v[:, 1] * v[:, 1])
+            self._cache[key] = value
+        return value
+
+
+def _angle_2d(ux: float, uy: float, vx: float, vy: float) -> float:
+    # Same operation order as angles._dot2/_norm2 so the result matches the kernels bit for bit
+    norm = (math.sqrt(ux * ux + uy * uy) * math.sqrt(vx * vx + vy * vy)) + 1e-6
+    cos_val = max(-1.0, min(1.0, (ux * vx + uy * vy) / norm))
+    return math.degrees(float(np.arccos(cos_val)))
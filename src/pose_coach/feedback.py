@@ -1,15 +1,282 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+import time
+from abc import ABC
+from contextlib import contextmanager
+from enum import IntFlag
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type
 
 import numpy as np
 
+from .features import PoseFeatures
+from .reps import RepCounter, Transitions
+from .sequence import SequenceAnalysis
+
+
+class FormFault(IntFlag):
+    """Base for each analyzer's form-fault flags."""
+
+
+# Overlay tip table entries: (fault mask, text when any masked fault is set,
+# text otherwise). Masks are plain ints so the per-frame path never does enum
+# arithmetic.
+Tip = Tuple[int, Optional[str], Optional[str]]
+
+
+def tip(fault: FormFault, text: str) -> Tip:
+    """Show ``text`` while ``fault`` (or any of several OR-ed faults) is present."""
+    return (int(fault), text, None)
+
+
+def either(fault: FormFault, text: str, otherwise: str) -> Tip:
+    return (int(fault), text, otherwise)
+
+
+def always(text: str) -> Tip:
+    return (0, None, text)
+
+
+def all_clear(text: str) -> Tip:
+    """Show ``text`` when no fault at all is present."""
+    return (-1, None, text)
+
+
+class Feedback:
+    """One analyzer's verdict on one frame: numbers and a fault bitmask.
+
+    Nothing is formatted until the text is asked for. Form tips come from the
+    analyzer's ``TIPS`` table and are cached per fault set, so headless
+    consumers that read ``reps``/``phase``/``score``/``faults`` never build a
+    string. Iterating yields the overlay lines, so code written against the
+    old ``List[str]`` result of ``update()`` keeps working.
+    """
+
+    __slots__ = ("kind", "detected", "reps", "phase", "score", "faults", "side", "_lines")
+
+    def __init__(
+        self,
+        kind: Type["Analyzer"],
+        detected: bool = True,
+        reps: Optional[int] = None,
+        phase: Optional[str] = None,
+        score: Optional[int] = None,
+        faults: int = 0,
+        side: Optional[str] = None,
+    ):
+        self.kind = kind
+        self.detected = detected
+        self.reps = reps
+        self.phase = phase
+        self.score = score
+        self.faults = faults
+        self.side = side
+        self._lines: Optional[List[str]] = None
+
+    @property
+    def fault_flags(self) -> FormFault:
+        return self.kind.FAULTS(self.faults)
+
+    def fault_names(self) -> List[str]:
+        return self.kind.fault_names(self.faults)
+
+    def tips(self) -> Tuple[str, ...]:
+        """Form tips only, without the title and status lines."""
+        if not self.detected:
+            return (self.kind.NO_PERSON,)
+        return self.kind.tip_lines(self.faults)
+
+    def lines(self) -> List[str]:
+        """Overlay text: title, status, then tips. Built once per result."""
+        if self._lines is None:
+            self._lines = self.kind.format_lines(self)
+        return self._lines
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "detected": self.detected,
+            "reps": self.reps,
+            "phase": self.phase,
+            "score": self.score,
+            "faults": self.fault_names(),
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.lines())
+
+    def __len__(self) -> int:
+        return len(self.lines())
+
+    def __getitem__(self, index):
+        return self.lines()[index]
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            f"Feedback({self.kind.__name__}, detected={self.detected}, reps={self.reps}, "
+            f"phase={self.phase!r}, score={self.score}, faults={self.fault_names()})"
+        )
+
 
 class Analyzer(ABC):
-    @abstractmethod
-    def update(self, landmarks_px: Optional[np.ndarray], visibility: Optional[np.ndarray], frame_shape) -> list:
-        """Process landmarks and return text lines to render on screen."""
+    # Exercise coaches describe their rep state machine here; see ``RepCoach``
+    TRANSITIONS: Transitions = {}
+    COUNT_PHASE: Optional[str] = None
+
+    # Overlay text. ``CHECKS`` maps each fault to the ``measure`` check whose
+    # failure raises it; ``TIPS`` lists the tip lines in display order.
+    TITLE = ""
+    NO_PERSON = "No person detected."
+    FAULTS: Type[FormFault] = FormFault
+    CHECKS: Dict[FormFault, str] = {}
+    TIPS: Sequence[Tip] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._checks = tuple((int(fault), key) for fault, key in cls.CHECKS.items())
+        cls._tip_cache: Dict[int, Tuple[str, ...]] = {}
+        cls._name_cache: Dict[int, List[str]] = {}
+
+    def update(
+        self,
+        landmarks_px: Optional[np.ndarray],
+        visibility: Optional[np.ndarray],
+        frame_shape,
+        features: Optional[PoseFeatures] = None,
+    ) -> Feedback:
+        """Process landmarks and return this frame's ``Feedback``.
+
+        ``features`` is the frame's shared ``PoseFeatures``; callers running
+        several analyzers on one frame pass the same object to each so angles
+        and midpoints are computed once. When omitted it is built on demand.
+        """
+        if landmarks_px is None:
+            return self.feedback()
+        return self.feedback(self.measure(self.frame_features(landmarks_px, visibility, frame_shape, features)))
+
+    def measure(self, f: PoseFeatures) -> Dict[str, Any]:
+        """Per-frame signals and form checks, including the ``TRANSITIONS`` signals.
+
+        Must only use operations that work on both a single frame's floats and
+        a sequence's arrays (``&``/``|`` instead of ``and``/``or``, no chained
+        comparisons). Coaches with per-stream baselines advance them here.
+        """
         raise NotImplementedError
 
+    def analyze_sequence(
+        self,
+        landmarks_px: np.ndarray,
+        visibility: Optional[np.ndarray] = None,
+        timestamps: Optional[np.ndarray] = None,
+        frame_shape=(720, 1280, 3),
+        detected: Optional[np.ndarray] = None,
+    ) -> SequenceAnalysis:
+        """Analyze ``(T, 33, 2)`` pixel landmarks in one vectorized pass.
+
+        Frames with ``detected`` False are skipped exactly like ``update(None, ...)``
+        skips them. ``signals["faults"]`` holds each frame's ``Feedback.faults``. Exercise coaches continue from and advance their
+        ``RepCounter``, so results match feeding the same frames to ``update``
+        one at a time, and consecutive chunks can be analyzed in turn.
+        """
+        landmarks_px = np.asarray(landmarks_px)
+        n = len(landmarks_px)
+        detected = np.ones(n, dtype=bool) if detected is None else np.asarray(detected, dtype=bool)
+        valid = np.flatnonzero(detected)
+        measured: Dict[str, np.ndarray] = {}
+        if len(valid):
+            vis = None if visibility is None else np.asarray(visibility)[valid]
+            f = PoseFeatures(landmarks_px[valid], vis, frame_shape)
+            measured = {key: np.broadcast_to(value, (len(valid),)) for key, value in self.measure(f).items()}
+        signals = {}
+        for key, value in measured.items():
+            full = np.zeros(n, dtype=value.dtype)
+            full[valid] = value
+            signals[key] = full
+        if self._checks:
+            faults = np.zeros(n, dtype=np.int64)
+            if len(valid):
+                for bit, key in self._checks:
+                    faults[valid[~measured[key].astype(bool)]] |= bit
+            signals["faults"] = faults
+        if not self.TRANSITIONS:
+            return SequenceAnalysis(detected, timestamps, signals)
+
+        counter: RepCounter = self.counter
+        start_phase, start_reps, timed = counter.phase, counter.reps, len(counter.rep_times)
+        times = None if timestamps is None else np.asarray(timestamps, dtype=float)[valid]
+        changes = [(int(valid[i]), phase) for i, phase in counter.run(measured, times)] if len(valid) else []
+        marks = np.zeros(n, dtype=np.intp)
+        counted = np.zeros(n, dtype=np.intp)
+        for frame, phase in changes:
+            marks[frame] = 1
+            counted[frame] = phase == self.COUNT_PHASE
+        names = np.array([start_phase] + [phase for _, phase in changes])
+        phases = names[np.cumsum(marks)]
+        reps = start_reps + np.cumsum(counted)
+        return SequenceAnalysis(
+            detected, timestamps, signals, phases, reps, changes, np.flatnonzero(counted), counter.rep_times[timed:]
+        )
+
+    def fault_mask(self, m: Mapping[str, Any]) -> int:
+        """Bitmask of the ``CHECKS`` that failed in one frame's ``measure`` result."""
+        faults = 0
+        for bit, key in self._checks:
+            if not m[key]:
+                faults |= bit
+        return faults
+
+    def feedback(self, m: Optional[Mapping[str, Any]] = None) -> Feedback:
+        """Wrap one frame's ``measure`` result (None without a detection)."""
+        if m is None:
+            return Feedback(type(self), False)
+        score = m.get("score")
+        return Feedback(type(self), True, score=None if score is None else int(score), faults=self.fault_mask(m))
+
+    @classmethod
+    def tip_lines(cls, faults: int) -> Tuple[str, ...]:
+        lines = cls._tip_cache.get(faults)
+        if lines is None:
+            chosen = (when_set if faults & mask else otherwise for mask, when_set, otherwise in cls.TIPS)
+            lines = cls._tip_cache[faults] = tuple(text for text in chosen if text is not None)
+        return lines
+
+    @classmethod
+    def fault_names(cls, faults: int) -> List[str]:
+        names = cls._name_cache.get(faults)
+        if names is None:
+            names = cls._name_cache[faults] = [fault.name for fault in cls.FAULTS if fault & faults]
+        return names
+
+    @classmethod
+    def status_line(cls, feedback: Feedback) -> str:
+        return f"Score: {feedback.score}/100"
+
+    @classmethod
+    def format_lines(cls, feedback: Feedback) -> List[str]:
+        lines = [cls.TITLE]
+        if not feedback.detected:
+            lines.append(cls.NO_PERSON)
+            if feedback.reps is not None:
+                lines.append(cls.rep_line(feedback))
+            return lines
+        lines.append(cls.status_line(feedback))
+        lines.extend(cls.tip_lines(feedback.faults))
+        return lines
+
+    @classmethod
+    def rep_line(cls, feedback: Feedback) -> str:
+        return f"Reps: {feedback.reps}"
+
+    @staticmethod
+    def frame_features(
+        landmarks_px: np.ndarray,
+        visibility: Optional[np.ndarray],
+        frame_shape,
+        features: Optional[PoseFeatures] = None,
+    ) -> PoseFeatures:
+        if features is not None:
+            return features
+        return PoseFeatures(landmarks_px, visibility, frame_shape)
+
     @staticmethod
     def is_visible(visibility: Optional[np.ndarray], indices: List[int], threshold: float = 0.5) -> bool:
         if visibility is None:
@@ -23,4 +290,97 @@ class Analyzer(ABC):
         try:
             return landmarks_px[indices]
         except Exception:
-            return None
\ No newline at end of file
+            return None
+
+
+@contextmanager
+def media_clock(analyzer) -> Iterator[List[float]]:
+    """Time ``analyzer``'s reps by media time instead of the wall clock.
+
+    Yields a one-element list; set ``[0]`` to each frame's timestamp before
+    passing the frame to ``update``. Analyzers without a ``clock`` are left alone.
+    """
+    current = [0.0]
+    timed = hasattr(analyzer, "clock")
+    if timed:
+        own_clock = vars(analyzer).get("clock")
+        analyzer.clock = lambda: current[0]
+    try:
+        yield current
+    finally:
+        if timed and own_clock is None:
+            del analyzer.clock
+        elif timed:
+            analyzer.clock = own_clock
+
+
+class RepCoach(Analyzer):
+    """Exercise coach whose reps are counted by a ``RepCounter``.
+
+    Subclasses declare ``TRANSITIONS`` over signals returned by ``measure``,
+    the phase a rep is counted on (``COUNT_PHASE``), the enter/exit
+    ``THRESHOLDS`` those signals compare against and which phases make up the
+    rep ``TEMPO``. ``thresholds`` overrides some of the defaults and
+    ``min_dwell`` requires a phase to be held that many frames before leaving it.
+    Rep times come from ``clock``, which ``media_clock`` replaces with a
+    video's or recording's timestamps.
+    """
+
+    START_PHASE = "up"
+    THRESHOLDS: Dict[str, float] = {}
+    TEMPO: Dict[str, str] = {}
+    MIN_DWELL = 1
+    REP_LABEL = "Reps"
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, thresholds: Optional[Mapping[str, float]] = None, min_dwell: Optional[int] = None):
+        self.thresholds = dict(self.THRESHOLDS, **(thresholds or {}))
+        self.counter = RepCounter(
+            self.TRANSITIONS,
+            self.START_PHASE,
+            self.COUNT_PHASE,
+            self.MIN_DWELL if min_dwell is None else min_dwell,
+            self.TEMPO,
+        )
+
+    @property
+    def state(self) -> str:
+        return self.counter.phase
+
+    @property
+    def reps(self) -> int:
+        return self.counter.reps
+
+    def update(
+        self,
+        landmarks_px: Optional[np.ndarray],
+        visibility: Optional[np.ndarray],
+        frame_shape,
+        features: Optional[PoseFeatures] = None,
+    ) -> Feedback:
+        """Measure the frame, advance the rep counter and return the ``Feedback``."""
+        if landmarks_px is None:
+            return self.feedback()
+        m = self.measure(self.frame_features(landmarks_px, visibility, frame_shape, features))
+        self.count(m)
+        return self.feedback(m)
+
+    def count(self, m: Mapping[str, Any]) -> Optional[str]:
+        """Feed one frame's ``measure`` result to the counter."""
+        return self.counter.step(m, self.clock())
+
+    def feedback(self, m: Optional[Mapping[str, Any]] = None) -> Feedback:
+        counter = self.counter
+        if m is None:
+            return Feedback(type(self), False, counter.reps, counter.phase)
+        use_left = m.get("use_left")
+        side = None if use_left is None else "Left" if use_left else "Right"
+        return Feedback(type(self), True, counter.reps, counter.phase, faults=self.fault_mask(m), side=side)
+
+    @classmethod
+    def rep_line(cls, feedback: Feedback) -> str:
+        return f"{cls.REP_LABEL}: {feedback.reps}"
+
+    @classmethod
+    def status_line(cls, feedback: Feedback) -> str:
+        return f"{cls.REP_LABEL}: {feedback.reps} | Phase: {feedback.phase}"
@@ -0,0 +1,304 @@
+import multiprocessing as mp
+import queue
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .ingest import IngestService
+from .profiling import StageHistogram
+from .utils import init_pose_estimator
+
+
+def _worker_main(pose_kwargs: Dict[str, Any], inbox, outbox, max_sessions: int) -> None:
+    """Estimator process: one MediaPipe ``Pose`` per session, least recently used closed first.
+
+    Each inbox message is a list of ``(request_id, session_id, frame_rgb)``;
+    the reply is a list of ``(request_id, normalized (33, 3) | None, latency_s, error)``
+    in the same order, so a session's frames come back in submission order.
+    ``error`` is None, or the message of the exception that frame raised.
+    """
+    estimators: "OrderedDict[str, Any]" = OrderedDict()
+    while True:
+        batch = inbox.get()
+        if batch is None:
+            break
+        replies = []
+        for request_id, session_id, frame in batch:
+            if frame is None:
+                # Session closed: free its estimator
+                pose = estimators.pop(session_id, None)
+                if pose is not None:
+                    pose.close()
+                continue
+            start = time.perf_counter()
+            try:
+                pose = estimators.get(session_id)
+                if pose is None:
+                    pose = estimators[session_id] = init_pose_estimator(**pose_kwargs)
+                    if len(estimators) > max_sessions:
+                        estimators.popitem(last=False)[1].close()
+                else:
+                    estimators.move_to_end(session_id)
+                start = time.perf_counter()
+                results = pose.process(frame)
+                normalized = None
+                if results.pose_landmarks is not None:
+                    normalized = np.array(
+                        [(lm.x, lm.y, lm.visibility) for lm in results.pose_landmarks.landmark],
+                        dtype=np.float32,
+                    )
+            except Exception as exc:
+                # The estimator's tracking state is suspect after a failure; start afresh next frame
+                broken = estimators.pop(session_id, None)
+                if broken is not None:
+                    try:
+                        broken.close()
+                    except Exception:
+                        pass
+                replies.append((request_id, None, time.perf_counter() - start, f"{type(exc).__name__}: {exc}"))
+                continue
+            replies.append((request_id, normalized, time.perf_counter() - start, None))
+        if replies:
+            outbox.put(replies)
+    for pose in estimators.values():
+        pose.close()
+
+
+class FrameServer:
+    """Micro-batches frames from many sessions onto a pool of estimator processes.
+
+    ``submit`` enqueues an RGB frame for a session and returns a ``Future``.
+    A batcher thread collects submissions for up to ``batch_window_s`` (or
+    ``max_batch`` frames) and sends each worker its share as one message, so
+    inter-process overhead is paid per batch rather than per frame. Sessions
+    are pinned to a worker by hash so MediaPipe tracking stays continuous and
+    per-session order is preserved. Results are routed to the session's
+    analyzer in ``service`` and the future resolves to that frame's feedback
+    dict (see ``IngestService.feed``) plus the normalized ``landmarks``.
+
+    Each session keeps its own MediaPipe ``Pose`` in its worker, because one
+    estimator's tracking state cannot be shared between streams. A worker holds
+    at most ``max_sessions_per_worker`` of them (roughly 100 MB each for the full
+    model), closing the least recently used; a session whose estimator was
+    closed gets a fresh one, losing its tracking, so size the pool so that
+    ``workers * max_sessions_per_worker`` covers the active sessions. ``stats()`` reports how many each
+    worker holds. If a frame fails in a worker, or a worker process exits, the
+    affected futures fail with ``RuntimeError`` instead of never resolving.
+    """
+
+    REAP_INTERVAL_S = 0.5
+
+    def __init__(
+        self,
+        service: IngestService,
+        pose_kwargs: Dict[str, Any],
+        workers: int = 2,
+        batch_window_s: float = 0.005,
+        max_batch: int = 16,
+        max_sessions_per_worker: int = 4,
+    ):
+        self.service = service
+        self.batch_window_s = batch_window_s
+        self.max_batch = max_batch
+        self.max_sessions_per_worker = max_sessions_per_worker
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.batches = 0
+        self.dispatched = 0
+        self.queue_wait = StageHistogram()
+        self.inference = StageHistogram()
+        self.end_to_end = StageHistogram()
+        self._incoming: "queue.Queue[Optional[Tuple]]" = queue.Queue()
+        self._pending: Dict[int, Tuple[Future, str, float, tuple, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._started = time.perf_counter()
+        self._dead: Set[int] = set()
+        self._last_reap = self._started
+        self._outbox = mp.Queue()
+        self._inboxes = [mp.Queue() for _ in range(max(1, workers))]
+        self._sessions: List[Set[str]] = [set() for _ in self._inboxes]
+        self._workers = [
+            mp.Process(
+                target=_worker_main,
+                args=(pose_kwargs, inbox, self._outbox, max_sessions_per_worker),
+                name=f"pose-worker-{i}",
+                daemon=True,
+            )
+            for i, inbox in enumerate(self._inboxes)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._batcher = threading.Thread(target=self._batch_loop, name="frame-batcher", daemon=True)
+        self._collector = threading.Thread(target=self._collect_loop, name="frame-collector", daemon=True)
+        self._batcher.start()
+        self._collector.start()
+
+    def submit(
+        self,
+        session_id: str,
+        frame_rgb: np.ndarray,
+        timestamp: Optional[float] = None,
+        frame_shape: Optional[tuple] = None,
+    ) -> Future:
+        """Queue a frame; ``frame_shape`` is the size the analyzer should see if the frame was downscaled.
+
+        The frame is pickled to the worker asynchronously, so it must not be
+        modified until the returned future resolves.
+        """
+        future: Future = Future()
+        with self._lock:
+            request_id = self._next_id
+            self._next_id += 1
+            self.submitted += 1
+            self._sessions[self._worker_for(session_id)].add(session_id)
+            self._pending[request_id] = (
+                future,
+                session_id,
+                time.perf_counter(),
+                frame_shape or frame_rgb.shape,
+                timestamp,
+            )
+        self._incoming.put((request_id, session_id, frame_rgb))
+        return future
+
+    def close_session(self, session_id: str) -> None:
+        """Release the session's estimator in its worker."""
+        with self._lock:
+            self._sessions[self._worker_for(session_id)].discard(session_id)
+        self._incoming.put((-1, session_id, None))
+
+    def close(self) -> None:
+        self._incoming.put(None)
+        self._batcher.join()
+        for inbox in self._inboxes:
+            inbox.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5.0)
+        self._outbox.put(None)
+        self._collector.join()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = time.perf_counter() - self._started
+            return {
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "in_flight": len(self._pending),
+                "batches": self.batches,
+                "mean_batch": round(self.dispatched / self.batches, 2) if self.batches else 0.0,
+                "throughput_fps": round(self.completed / elapsed, 1) if elapsed > 0 else 0.0,
+                "max_sessions_per_worker": self.max_sessions_per_worker,
+                "estimators_per_worker": [min(len(s), self.max_sessions_per_worker) for s in self._sessions],
+                "dead_workers": sorted(self._dead),
+                "queue_wait": self.queue_wait.summary(),
+                "inference": self.inference.summary(),
+                "end_to_end": self.end_to_end.summary(),
+            }
+
+    def _worker_for(self, session_id: str) -> int:
+        return zlib.crc32(session_id.encode("utf-8")) % len(self._inboxes)
+
+    def _batch_loop(self) -> None:
+        while True:
+            item = self._incoming.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.perf_counter() + self.batch_window_s
+            stop = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._incoming.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: List[Tuple]) -> None:
+        per_worker: Dict[int, List[Tuple]] = {}
+        lost: List[Future] = []
+        now = time.perf_counter()
+        with self._lock:
+            for request_id, session_id, frame in batch:
+                idx = self._worker_for(session_id)
+                if idx in self._dead:
+                    pending = self._pending.pop(request_id, None)
+                    if pending is not None:
+                        lost.append(pending[0])
+                    continue
+                pending = self._pending.get(request_id)
+                if pending is not None:
+                    self.dispatched += 1
+                    self.queue_wait.add((now - pending[2]) * 1e6)
+                per_worker.setdefault(idx, []).append((request_id, session_id, frame))
+            self.batches += 1
+            self.failed += len(lost)
+        for future in lost:
+            future.set_exception(RuntimeError("Pose worker exited"))
+        for idx, items in per_worker.items():
+            self._inboxes[idx].put(items)
+
+    def _reap_workers(self) -> None:
+        """Fail the outstanding futures of every worker process that has exited."""
+        self._last_reap = time.perf_counter()
+        exited = {idx for idx, worker in enumerate(self._workers) if idx not in self._dead and not worker.is_alive()}
+        if not exited:
+            return
+        with self._lock:
+            self._dead |= exited
+            lost = [rid for rid, pending in self._pending.items() if self._worker_for(pending[1]) in exited]
+            futures = [self._pending.pop(rid)[0] for rid in lost]
+            self.failed += len(futures)
+        for future in futures:
+            future.set_exception(RuntimeError("Pose worker exited"))
+
+    def _collect_loop(self) -> None:
+        while True:
+            if time.perf_counter() - self._last_reap >= self.REAP_INTERVAL_S:
+                self._reap_workers()
+            try:
+                replies = self._outbox.get(timeout=self.REAP_INTERVAL_S)
+            except queue.Empty:
+                continue
+            if replies is None:
+                return
+            for request_id, normalized, latency, error in replies:
+                with self._lock:
+                    pending = self._pending.pop(request_id, None)
+                if pending is None:
+                    # Already failed when its worker was reaped
+                    continue
+                future, session_id, submitted_at, shape, timestamp = pending
+                if error is not None:
+                    future.set_exception(RuntimeError(f"Pose worker failed: {error}"))
+                    with self._lock:
+                        self.failed += 1
+                    continue
+                frame = {"timestamp": timestamp, "landmarks": normalized}
+                try:
+                    feedback = self.service.feed(session_id, {"frame_shape": shape[:2], "frames": [frame]})[0]
+                    feedback["landmarks"] = normalized
+                except Exception as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(feedback)
+                with self._lock:
+                    self.completed += 1
+                    self.inference.add(latency * 1e6)
+                    self.end_to_end.add((time.perf_counter() - submitted_at) * 1e6)
@@ -0,0 +1,175 @@
+import math
+import threading
+import time
+import uuid
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .offline import SessionSummary
+from .registry import EXERCISES, POSES
+from .utils import NUM_LANDMARKS, LandmarkBuffers
+
+DEFAULT_FRAME_SHAPE = (720, 1280)
+MAX_FRAME_SIDE = 16384
+# Normalized x/y may stray a little outside the frame for off-screen joints
+COORDINATE_RANGE = (-1.0, 2.0)
+
+
+class IngestSession:
+    """One athlete's analyzer fed with client-side landmarks, optionally streaming ``FeedbackEvents``."""
+
+    def __init__(self, mode: str, name: str, analyzer, events=None):
+        self.mode = mode
+        self.name = name
+        self.analyzer = analyzer
+        self.events = events
+        self.buffers = LandmarkBuffers()
+        self.summary = SessionSummary()
+        self.lock = threading.Lock()
+        self.last_seen = time.monotonic()
+
+
+class IngestService:
+    """Routes batches of client-estimated landmarks to per-session analyzers.
+
+    Clients run pose estimation themselves and send normalized ``(33, 3)``
+    x/y/visibility arrays (``None`` when nobody was detected) together with the
+    frame size the analyzers should see. No MediaPipe or image data is
+    involved, so a single process can serve many sessions. Sessions idle for
+    ``idle_timeout_s`` are dropped when new ones are opened.
+    """
+
+    def __init__(self, max_sessions: int = 1000, idle_timeout_s: float = 300.0):
+        self.max_sessions = max_sessions
+        self.idle_timeout_s = idle_timeout_s
+        self.frames = 0
+        self.evictions = 0
+        self._sessions: Dict[str, IngestSession] = {}
+        self._lock = threading.Lock()
+
+    def open(self, mode: str, name: str, analyzer=None, events=None) -> str:
+        """Open a session running the registered analyzer for ``name``, or ``analyzer`` when given.
+
+        ``events`` (a ``FeedbackEvents``) observes every frame the session analyzes.
+        """
+        if analyzer is None:
+            registry = dict(EXERCISES) if mode == "exercise" else dict(POSES) if mode == "pose" else None
+            if registry is None:
+                raise ValueError(f"Unknown mode: {mode}")
+            cls = registry.get(name)
+            if cls is None:
+                raise ValueError(f"Unknown {mode}: {name}")
+            analyzer = cls()
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._evict_idle()
+            if len(self._sessions) >= self.max_sessions:
+                raise RuntimeError("Too many open sessions")
+            self._sessions[session_id] = IngestSession(mode, name, analyzer, events)
+        return session_id
+
+    def close(self, session_id: str) -> Dict[str, Any]:
+        """Drop a session and return its ``SessionSummary`` as a dict."""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            raise KeyError(session_id)
+        with session.lock:
+            return dict(session.summary.to_dict(), mode=session.mode, name=session.name)
+
+    def feed(self, session_id: str, batch: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run one batch through the session's analyzer and return per-frame feedback.
+
+        ``batch`` is ``{"frame_shape": [h, w], "frames": [{"timestamp": t,
+        "landmarks": [[x, y, visibility] * 33] | null}, ...]}``; ``landmarks``
+        may also be a flat list of 99 floats. x/y must lie within
+        ``COORDINATE_RANGE`` and visibility within [0, 1]; any malformed input
+        raises ``ValueError`` before the analyzer sees any of the batch.
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+        if session is None:
+            raise KeyError(session_id)
+        if not isinstance(batch, dict):
+            raise ValueError("batch must be an object")
+        try:
+            shape = tuple(int(v) for v in batch.get("frame_shape") or DEFAULT_FRAME_SHAPE)[:2]
+        except (TypeError, ValueError):
+            raise ValueError("frame_shape must be [height, width]") from None
+        if len(shape) != 2 or min(shape) <= 0 or max(shape) > MAX_FRAME_SIDE:
+            raise ValueError(f"frame_shape must be [height, width] with sides up to {MAX_FRAME_SIDE}")
+        frames = batch.get("frames")
+        if not isinstance(frames, list) or not all(isinstance(f, dict) for f in frames):
+            raise ValueError("frames must be a list of objects")
+        # Validate the whole batch before any of it reaches the analyzer
+        arrays = []
+        timestamps = []
+        for frame in frames:
+            timestamp = frame.get("timestamp")
+            if timestamp is not None:
+                try:
+                    timestamp = float(timestamp)
+                except (TypeError, ValueError):
+                    raise ValueError("timestamp must be a number") from None
+                if not math.isfinite(timestamp):
+                    raise ValueError("timestamp must be finite")
+            timestamps.append(timestamp)
+            landmarks = frame.get("landmarks")
+            if landmarks is None:
+                arrays.append(None)
+                continue
+            try:
+                values = np.asarray(landmarks, dtype=np.float32)
+            except (TypeError, ValueError):
+                raise ValueError("landmarks must be numbers") from None
+            if values.size != NUM_LANDMARKS * 3:
+                raise ValueError(f"landmarks must hold {NUM_LANDMARKS} x/y/visibility triples")
+            values = values.reshape(NUM_LANDMARKS, 3)
+            # NaN fails both comparisons, so it is rejected here too
+            low, high = COORDINATE_RANGE
+            if not ((values[:, :2] >= low) & (values[:, :2] <= high)).all():
+                raise ValueError(f"landmark x/y must be within [{low:g}, {high:g}]")
+            if not ((values[:, 2] >= 0.0) & (values[:, 2] <= 1.0)).all():
+                raise ValueError("landmark visibility must be within [0, 1]")
+            arrays.append(values)
+
+        results = []
+        with session.lock:
+            session.last_seen = time.monotonic()
+            analyzer = session.analyzer
+            buffers = session.buffers
+            for timestamp, values in zip(timestamps, arrays):
+                if values is None:
+                    landmarks_px = visibility = None
+                else:
+                    buffers.normalized[:] = values
+                    buffers.rescale(shape)
+                    landmarks_px, visibility = buffers.pixels, buffers.visibility
+                feedback = analyzer.update(landmarks_px, visibility, shape)
+                session.summary.add(analyzer, feedback, landmarks_px is not None, timestamp)
+                if session.events is not None:
+                    session.events.observe(feedback)
+                results.append({
+                    "timestamp": timestamp,
+                    "detected": feedback.detected,
+                    "reps": feedback.reps,
+                    "phase": feedback.phase,
+                    "score": feedback.score,
+                    "faults": feedback.fault_names(),
+                    "tips": list(feedback.tips()),
+                    "lines": list(feedback),
+                })
+        with self._lock:
+            self.frames += len(frames)
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"sessions": len(self._sessions), "frames": self.frames, "evictions": self.evictions}
+
+    def _evict_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout_s
+        for session_id in [sid for sid, s in self._sessions.items() if s.last_seen < cutoff]:
+            del self._sessions[session_id]
+            self.evictions += 1
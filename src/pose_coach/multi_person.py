@@ -0,0 +1,161 @@
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import mediapipe as mp
+import numpy as np
+
+from .feedback import Analyzer
+from .utils import NUM_LANDMARKS, LandmarkBuffers
+
+
+class MultiPoseEstimator:
+    """MediaPipe Tasks ``PoseLandmarker`` detecting up to ``num_poses`` people per frame.
+
+    The legacy ``mp.solutions.pose`` graph only tracks one person, so this uses
+    the Tasks API in VIDEO mode, which needs a ``pose_landmarker_*.task`` model
+    file. ``detect`` returns all poses of a frame as one normalized
+    ``(P, 33, 3)`` x/y/visibility array from a single inference.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        num_poses: int = 4,
+        min_detection_confidence: float = 0.5,
+        min_presence_confidence: float = 0.5,
+        min_tracking_confidence: float = 0.5,
+    ):
+        from mediapipe.tasks.python import vision
+        from mediapipe.tasks.python.core.base_options import BaseOptions
+
+        options = vision.PoseLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.VIDEO,
+            num_poses=num_poses,
+            min_pose_detection_confidence=min_detection_confidence,
+            min_pose_presence_confidence=min_presence_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+        )
+        self.landmarker = vision.PoseLandmarker.create_from_options(options)
+        self._last_ts_ms = -1
+
+    def detect(self, frame_rgb: np.ndarray, timestamp_ms: Optional[int] = None) -> np.ndarray:
+        if timestamp_ms is None:
+            timestamp_ms = int(time.monotonic() * 1000)
+        # VIDEO mode requires strictly increasing timestamps
+        timestamp_ms = max(timestamp_ms, self._last_ts_ms + 1)
+        self._last_ts_ms = timestamp_ms
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(frame_rgb))
+        result = self.landmarker.detect_for_video(image, timestamp_ms)
+        poses = np.zeros((len(result.pose_landmarks), NUM_LANDMARKS, 3), dtype=np.float32)
+        for p, landmarks in enumerate(result.pose_landmarks):
+            poses[p] = [(lm.x, lm.y, lm.visibility or 0.0) for lm in landmarks]
+        return poses
+
+    def close(self) -> None:
+        self.landmarker.close()
+
+
+class PoseTracker:
+    """Greedy keypoint tracker that keeps stable IDs for people across frames.
+
+    The cost of pairing a track with a detection is the mean distance between
+    landmarks visible in both, divided by the track's bounding-box diagonal.
+    Pairs are matched cheapest-first up to ``max_cost``; unmatched detections
+    start new tracks, and tracks unseen for ``max_missing`` frames are evicted.
+    """
+
+    def __init__(self, max_missing: int = 15, max_cost: float = 0.5, visibility_threshold: float = 0.3):
+        self.max_missing = max_missing
+        self.max_cost = max_cost
+        self.visibility_threshold = visibility_threshold
+        self.tracks: Dict[int, np.ndarray] = {}
+        self.missing: Dict[int, int] = {}
+        self._next_id = 1
+
+    def update(self, poses: np.ndarray) -> Tuple[List[Tuple[int, int]], List[int]]:
+        """Match ``(P, 33, 3)`` detections; returns ``([(track_id, pose_idx)], evicted_ids)``."""
+        track_ids = list(self.tracks)
+        matches: List[Tuple[int, int]] = []
+        used_tracks = set()
+        used_poses = set()
+        if track_ids and len(poses):
+            costs = self._costs(np.stack([self.tracks[t] for t in track_ids]), poses)
+            for flat in np.argsort(costs, axis=None):
+                ti, pi = divmod(int(flat), len(poses))
+                if costs[ti, pi] > self.max_cost:
+                    break
+                if ti in used_tracks or pi in used_poses:
+                    continue
+                used_tracks.add(ti)
+                used_poses.add(pi)
+                matches.append((track_ids[ti], pi))
+
+        for track_id, pi in matches:
+            self.tracks[track_id] = poses[pi].copy()
+            self.missing[track_id] = 0
+        for pi in range(len(poses)):
+            if pi not in used_poses:
+                track_id = self._next_id
+                self._next_id += 1
+                self.tracks[track_id] = poses[pi].copy()
+                self.missing[track_id] = 0
+                matches.append((track_id, pi))
+
+        evicted = []
+        for ti, track_id in enumerate(track_ids):
+            if ti in used_tracks:
+                continue
+            self.missing[track_id] += 1
+            if self.missing[track_id] > self.max_missing:
+                del self.tracks[track_id]
+                del self.missing[track_id]
+                evicted.append(track_id)
+        return matches, evicted
+
+    def _costs(self, tracks: np.ndarray, poses: np.ndarray) -> np.ndarray:
+        # (T, 1, 33, 2) - (1, P, 33, 2)
+        dist = np.linalg.norm(tracks[:, None, :, :2] - poses[None, :, :, :2], axis=-1)
+        both = (tracks[:, None, :, 2] >= self.visibility_threshold) & (poses[None, :, :, 2] >= self.visibility_threshold)
+        counts = both.sum(axis=-1)
+        mean = np.where(counts > 0, (dist * both).sum(axis=-1) / np.maximum(counts, 1), np.inf)
+        xy = tracks[..., :2]
+        diag = np.linalg.norm(xy.max(axis=1) - xy.min(axis=1), axis=-1)
+        return mean / np.maximum(diag, 1e-3)[:, None]
+
+
+class MultiPersonCoach:
+    """One analyzer per tracked person, created on first sight and dropped on eviction."""
+
+    def __init__(self, analyzer_factory: Callable[[], Analyzer], tracker: Optional[PoseTracker] = None, max_people: int = 8):
+        self.analyzer_factory = analyzer_factory
+        self.tracker = tracker if tracker is not None else PoseTracker()
+        self.max_people = max_people
+        self.analyzers: Dict[int, Analyzer] = {}
+        self.buffers: Dict[int, LandmarkBuffers] = {}
+
+    def update(self, poses: np.ndarray, frame_shape) -> Dict[int, Tuple[np.ndarray, np.ndarray, list]]:
+        """Run each matched person's analyzer; returns ``{track_id: (landmarks_px, visibility, lines)}``.
+
+        Tracks missing from this frame are not updated, so a brief occlusion
+        does not reset anyone's rep state. The returned arrays are per-person
+        buffers that are overwritten on the next call.
+        """
+        matches, evicted = self.tracker.update(poses)
+        for track_id in evicted:
+            self.analyzers.pop(track_id, None)
+            self.buffers.pop(track_id, None)
+        out = {}
+        for track_id, pi in matches:
+            analyzer = self.analyzers.get(track_id)
+            if analyzer is None:
+                if len(self.analyzers) >= self.max_people:
+                    continue
+                analyzer = self.analyzers[track_id] = self.analyzer_factory()
+                self.buffers[track_id] = LandmarkBuffers()
+            buffers = self.buffers[track_id]
+            buffers.normalized[:] = poses[pi]
+            buffers.rescale(frame_shape)
+            lines = analyzer.update(buffers.pixels, buffers.visibility, frame_shape)
+            out[track_id] = (buffers.pixels, buffers.visibility, lines)
+        return out
@@ -0,0 +1,120 @@
+import math
+import os
+import time
+from typing import List, Optional, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+
+from .drawing import OverlayRenderer
+from .frame_server import FrameServer
+from .pipeline import FpsMeter, InferenceResizer, ThreadedPipeline
+from .utils import LandmarkBuffers
+
+Source = Union[int, str]
+
+# Inference frames sent to the frame server: (width, height), width 0 keeps the aspect
+# ratio. MediaPipe scales its input down to 256 px anyway, so 360 px loses little
+# while cutting the bytes pickled per 720p frame by three quarters.
+MULTI_CAMERA_INFERENCE_SIZE = (0, 360)
+
+
+def parse_sources(values: Sequence[str]) -> List[Source]:
+    """Webcam indices become ints; anything else is a file path or stream URL."""
+    return [int(v) if str(v).isdigit() else v for v in values]
+
+
+def is_file_source(source: Source) -> bool:
+    """True for a video file on disk, as opposed to a webcam index or stream URL."""
+    return not isinstance(source, int) and os.path.isfile(source)
+
+
+def open_source(source: Source, width: int, height: int) -> cv2.VideoCapture:
+    cap = cv2.VideoCapture(source)
+    if isinstance(source, int):
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    if not cap.isOpened():
+        raise RuntimeError(f"Unable to open source {source!r}")
+    return cap
+
+
+class CameraStream:
+    """One capture source feeding a shared ``FrameServer`` through its own pipeline.
+
+    Capture and the round trip to the estimator pool run on the stream's
+    ``ThreadedPipeline`` threads, so a slow camera or worker never stalls the
+    others. Video files are paced at their native frame rate so they behave
+    like a live camera. A frame whose result takes longer than
+    ``result_timeout`` seconds raises ``TimeoutError`` rather than hanging the
+    stream.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        cap: cv2.VideoCapture,
+        server: FrameServer,
+        session_id: str,
+        inference_size: Optional[Tuple[int, int]] = None,
+        result_timeout: float = 10.0,
+    ):
+        self.source = source
+        self.cap = cap
+        self.server = server
+        self.session_id = session_id
+        self.result_timeout = result_timeout
+        self.resizer = InferenceResizer(inference_size, cv2.COLOR_BGR2RGB)
+        self.fps_meter = FpsMeter()
+        fps = cap.get(cv2.CAP_PROP_FPS) if not isinstance(source, int) else 0.0
+        self._interval = 1.0 / fps if fps and fps > 0 else 0.0
+        self._next_due = 0.0
+        self.pipeline = ThreadedPipeline(self._read, self._process)
+
+    def start(self) -> "CameraStream":
+        self.pipeline.start()
+        return self
+
+    def stop(self) -> None:
+        self.pipeline.stop()
+        self.cap.release()
+
+    def _read(self):
+        if self._interval:
+            now = time.perf_counter()
+            if self._next_due > now:
+                time.sleep(self._next_due - now)
+            self._next_due = max(now, self._next_due) + self._interval
+        return self.cap.read()
+
+    def _process(self, frame):
+        # The resizer buffer is reused, which is safe because we wait for the result
+        frame_rgb = self.resizer.prepare(frame)
+        feedback = self.server.submit(self.session_id, frame_rgb, time.time(), frame.shape)
+        feedback = feedback.result(timeout=self.result_timeout)
+        return frame, feedback
+
+
+class TiledView:
+    """Composes per-stream frames and overlays into one preallocated grid image."""
+
+    def __init__(self, count: int, tile_size: Tuple[int, int] = (640, 360)):
+        self.cols = max(1, math.ceil(math.sqrt(count)))
+        self.rows = max(1, math.ceil(count / self.cols))
+        self.tile_w, self.tile_h = tile_size
+        self.canvas = np.zeros((self.rows * self.tile_h, self.cols * self.tile_w, 3), dtype=np.uint8)
+        self.renderer = OverlayRenderer()
+        self._tile = np.empty((self.tile_h, self.tile_w, 3), dtype=np.uint8)
+        self._buffers = LandmarkBuffers()
+
+    def update(self, idx: int, frame: np.ndarray, landmarks: Optional[np.ndarray], lines: Optional[list], fps: float) -> None:
+        cv2.resize(frame, (self.tile_w, self.tile_h), dst=self._tile, interpolation=cv2.INTER_AREA)
+        landmarks_px = visibility = None
+        if landmarks is not None:
+            self._buffers.normalized[:] = landmarks
+            self._buffers.rescale(self._tile.shape)
+            landmarks_px, visibility = self._buffers.pixels, self._buffers.visibility
+        self.renderer.render(self._tile, landmarks_px, visibility, lines, fps, in_place=True)
+        row, col = divmod(idx, self.cols)
+        y, x = row * self.tile_h, col * self.tile_w
+        self.canvas[y:y + self.tile_h, x:x + self.tile_w] = self._tile
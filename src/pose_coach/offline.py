@@ -0,0 +1,300 @@
+import glob
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import cv2
+
+from .feedback import Analyzer, Feedback, media_clock
+from .pipeline import FrameProcessor
+from .recording import LandmarkRecorder, LandmarkRecording
+from .sequence import rounded_rep_time
+from .utils import init_pose_estimator
+
+# Status lines change every rep/score and would drown out the real form tips
+STATUS_PREFIXES = ("Mode:", "Reps:", "Jumps:", "Side:", "Score:")
+
+
+def expand_inputs(patterns: Iterable[str]) -> List[str]:
+    """Expand globs, keep plain paths as given and drop duplicates while preserving order."""
+    paths: List[str] = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def analyzer_reps(analyzer: Analyzer) -> Optional[int]:
+    for attr in ("reps", "jumps"):
+        value = getattr(analyzer, attr, None)
+        if value is not None:
+            return int(value)
+    return None
+
+
+def split_feedback(lines: Union[Feedback, list, None]) -> Tuple[List[str], Optional[int]]:
+    """Separate form tips from status lines; also returns the "Score: N/100" value if present."""
+    if isinstance(lines, Feedback):
+        return list(lines.tips()), lines.score
+    tips: List[str] = []
+    score = None
+    for line in lines or []:
+        if line.startswith("Score:"):
+            try:
+                score = int(line.split(":", 1)[1].split("/", 1)[0])
+            except ValueError:
+                pass
+        elif not line.startswith(STATUS_PREFIXES):
+            tips.append(line)
+    return tips, score
+
+
+class SessionSummary:
+    """Accumulates rep counts, a phase timeline and tip frequencies for one stream."""
+
+    def __init__(self, fps: float = 0.0):
+        self.fps = fps
+        self.frames = 0
+        self.detected_frames = 0
+        self.tip_counts: Counter = Counter()
+        self.fault_counts: Counter = Counter()
+        self.phases: List[Dict] = []
+        self.scores: List[int] = []
+        self.reps: Optional[int] = None
+        self.rep_times: Optional[List[Dict]] = None
+
+    def timestamp(self, frame_idx: int) -> Optional[float]:
+        if self.fps <= 0:
+            return None
+        return round(frame_idx / self.fps, 3)
+
+    def add(self, analyzer: Analyzer, tips: Union[Feedback, list, None], detected: bool, timestamp: Optional[float] = None) -> None:
+        frame_idx = self.frames
+        if timestamp is None:
+            timestamp = self.timestamp(frame_idx)
+        else:
+            timestamp = round(timestamp, 3)
+        self.frames += 1
+        if detected:
+            self.detected_frames += 1
+        self.reps = analyzer_reps(analyzer)
+        counter = getattr(analyzer, "counter", None)
+        if counter is not None:
+            self.rep_times = counter.rep_times
+
+        phase = getattr(analyzer, "state", None)
+        if phase is not None:
+            if self.phases and self.phases[-1]["phase"] == phase:
+                self.phases[-1]["end_frame"] = frame_idx
+                self.phases[-1]["end_time"] = timestamp
+            else:
+                self.phases.append({
+                    "phase": phase,
+                    "start_frame": frame_idx,
+                    "end_frame": frame_idx,
+                    "start_time": timestamp,
+                    "end_time": timestamp,
+                })
+
+        form_tips, score = split_feedback(tips)
+        if score is not None:
+            self.scores.append(score)
+        for line in form_tips:
+            self.tip_counts[line] += 1
+        if isinstance(tips, Feedback) and tips.faults:
+            self.fault_counts.update(tips.fault_names())
+
+    def to_dict(self) -> Dict:
+        result = {
+            "frames": self.frames,
+            "detected_frames": self.detected_frames,
+            "fps": self.fps,
+            "reps": self.reps,
+            "phase_timeline": self.phases,
+            "tip_frequencies": {
+                tip: {"frames": n, "ratio": round(n / max(1, self.frames), 4)}
+                for tip, n in self.tip_counts.most_common()
+            },
+            "fault_frequencies": {
+                fault: {"frames": n, "ratio": round(n / max(1, self.frames), 4)}
+                for fault, n in self.fault_counts.most_common()
+            },
+        }
+        if self.rep_times is not None:
+            result["rep_times"] = [rounded_rep_time(rep) for rep in self.rep_times]
+        if self.scores:
+            result["score"] = {
+                "mean": round(sum(self.scores) / len(self.scores), 2),
+                "max": max(self.scores),
+                "min": min(self.scores),
+            }
+        return result
+
+
+def analyze_video(path: str, analyzer: Analyzer, pose, record_path: Optional[str] = None) -> Dict:
+    """Run one video file through ``pose`` and ``analyzer`` as fast as it decodes.
+
+    With ``record_path`` the landmarks are also saved as a landmark recording so
+    later threshold changes can be re-checked with ``replay_recording``. Reps
+    are timed in video time (frames when the frame rate is unknown), matching
+    the ``phase_timeline``.
+    """
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Unable to open video file: {path}")
+    summary = SessionSummary(fps=float(cap.get(cv2.CAP_PROP_FPS) or 0.0))
+    recorder = LandmarkRecorder(record_path) if record_path else None
+    processor = FrameProcessor(pose, analyzer, recorder=recorder)
+    try:
+        with media_clock(analyzer) as current:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                timestamp = summary.timestamp(summary.frames)
+                current[0] = float(summary.frames) if timestamp is None else summary.frames / summary.fps
+                _, landmarks_px, _, tips = processor.process(frame, timestamp or 0.0)
+                summary.add(analyzer, tips, landmarks_px is not None)
+    finally:
+        cap.release()
+        if recorder is not None:
+            recorder.close()
+    result = summary.to_dict()
+    result["input"] = path
+    result["analyzer"] = type(analyzer).__name__
+    if record_path:
+        result["landmarks"] = record_path
+    return result
+
+
+def replay_recording(path: str, analyzer: Analyzer, sequence: bool = False) -> Dict:
+    """Re-run ``analyzer`` over a landmark recording without touching MediaPipe.
+
+    With ``sequence`` the whole recording goes through ``analyze_sequence``
+    instead of frame-by-frame ``update``: same reps and phases, reported as rep
+    boundaries and per-check pass rates rather than tip text.
+    """
+    recording = LandmarkRecording(path)
+    if sequence:
+        result = recording.analyze(analyzer).to_dict()
+    else:
+        summary = SessionSummary()
+        recording.replay(analyzer, lambda ts, tips, detected: summary.add(analyzer, tips, detected, ts))
+        result = summary.to_dict()
+    result["input"] = path
+    result["analyzer"] = type(analyzer).__name__
+    return result
+
+
+# One MediaPipe Pose per worker process, created by the pool initializer
+_worker_pose = None
+
+
+def _init_worker(pose_kwargs: Dict) -> None:
+    global _worker_pose
+    _worker_pose = init_pose_estimator(**pose_kwargs)
+
+
+def _analyze_in_worker(path: str, analyzer_factory: Callable[[], Analyzer], record_path: Optional[str] = None) -> Dict:
+    # Clear tracking state left over from the previous file
+    _worker_pose.reset()
+    return analyze_video(path, analyzer_factory(), _worker_pose, record_path)
+
+
+def output_path_for(path: str, output_dir: str, used: set, suffix: str = "") -> str:
+    """``<output_dir>/<stem><suffix>.json``, numbered so names within one run never collide."""
+    stem = os.path.splitext(os.path.basename(path))[0] or "video"
+    name = stem
+    n = 1
+    while name in used:
+        n += 1
+        name = f"{stem}-{n}"
+    used.add(name)
+    return os.path.join(output_dir, f"{name}{suffix}.json")
+
+
+def analyze_files(
+    paths: List[str],
+    analyzer_factory: Callable[[], Analyzer],
+    pose_kwargs: Dict,
+    output_dir: str,
+    workers: int = 0,
+    save_landmarks: bool = False,
+) -> List[Dict]:
+    """Analyze every file, fanning out over a process pool, and write one JSON per file.
+
+    ``analyzer_factory`` must be picklable; each file gets a fresh analyzer.
+    With ``save_landmarks`` a ``<name>.landmarks.npy`` recording is written next
+    to each JSON. Failures are recorded in the returned list instead of
+    aborting the batch.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths)))
+    used: set = set()
+    out_paths = {path: output_path_for(path, output_dir, used) for path in paths}
+    record_paths = {
+        path: (os.path.splitext(out)[0] + ".landmarks.npy") if save_landmarks else None
+        for path, out in out_paths.items()
+    }
+    results: List[Dict] = []
+
+    def finish(path: str, result: Dict) -> None:
+        result["output"] = out_paths[path]
+        with open(out_paths[path], "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        results.append(result)
+
+    if workers == 1:
+        _init_worker(pose_kwargs)
+        for path in paths:
+            try:
+                finish(path, _analyze_in_worker(path, analyzer_factory, record_paths[path]))
+            except Exception as exc:
+                finish(path, {"input": path, "error": str(exc)})
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pose_kwargs,)) as pool:
+        futures = {pool.submit(_analyze_in_worker, path, analyzer_factory, record_paths[path]): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                finish(path, future.result())
+            except Exception as exc:
+                finish(path, {"input": path, "error": str(exc)})
+    order = {path: i for i, path in enumerate(paths)}
+    results.sort(key=lambda r: order[r["input"]])
+    return results
+
+
+def replay_files(
+    paths: List[str],
+    analyzer_factory: Callable[[], Analyzer],
+    output_dir: str,
+    sequence: bool = False,
+) -> List[Dict]:
+    """Replay landmark recordings through fresh analyzers and write one JSON per file.
+
+    Results go to ``<stem>.replay.json`` so the ``--input`` analysis the
+    recording came from (``<stem>.json``, often in the same directory) is kept.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    used: set = set()
+    results: List[Dict] = []
+    for path in paths:
+        out_path = output_path_for(path.replace(".landmarks", ""), output_dir, used, ".replay")
+        try:
+            result = replay_recording(path, analyzer_factory(), sequence)
+        except Exception as exc:
+            result = {"input": path, "error": str(exc)}
+        result["output"] = out_path
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        results.append(result)
+    return results
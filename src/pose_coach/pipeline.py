@@ -0,0 +1,382 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .profiling import StageTimer
+from .utils import LandmarkBuffers, extract_landmarks, results_from_normalized
+
+
+class DropOldestQueue:
+    """Bounded FIFO that evicts the oldest item instead of blocking the producer.
+
+    Consumers always see the most recent items; every eviction is counted in
+    ``dropped`` so callers can report how far a stage is falling behind. With
+    ``block=True`` the producer waits for room instead, for sources such as
+    video files where every item must be processed.
+    """
+
+    def __init__(self, maxsize: int = 1, block: bool = False):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.block = block
+        self.dropped = 0
+        self._items = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def put(self, item) -> None:
+        with self._cond:
+            if self.block:
+                while len(self._items) >= self.maxsize and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    self.dropped += 1
+                    return
+            elif len(self._items) >= self.maxsize:
+                self._items.popleft()
+                self.dropped += 1
+            self._items.append(item)
+            self._cond.notify_all()
+
+    def get(self, timeout: Optional[float] = None):
+        """Return the oldest queued item, or None on timeout / after close()."""
+        with self._cond:
+            if not self._items and not self._closed:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            if self.block:
+                # Wake a producer waiting for room
+                self._cond.notify_all()
+            return item
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._items)
+
+
+class LatestFrameSlot:
+    """Latest-frame-wins mailbox for request/response streaming (one per session).
+
+    Every arriving frame goes through ``serve()``. Only one call per session
+    runs ``process`` at a time; a call that finds it busy parks its frame and
+    returns at once instead of waiting, so superseded frames never hold a
+    server worker that another session could use. The running call picks up
+    the newest parked frame when it finishes (at most ``catch_up`` of them),
+    and every parked frame replaced by a newer one is counted in ``dropped``.
+    """
+
+    def __init__(self, catch_up: int = 1):
+        self.catch_up = catch_up
+        self.dropped = 0
+        self.processed = 0
+        self._pending: Any = None
+        self._has_pending = False
+        self._running = False
+        self._lock = threading.Lock()
+
+    def serve(self, item: Any, process: Callable[[Any], Any], default: Any = None) -> Any:
+        """Run ``process`` on the newest frame and return its result, or ``default`` if another call has it."""
+        with self._lock:
+            if self._has_pending:
+                self.dropped += 1
+            self._pending, self._has_pending = item, True
+            if self._running:
+                return default
+            self._running = True
+        result = default
+        try:
+            for _ in range(1 + self.catch_up):
+                with self._lock:
+                    if not self._has_pending:
+                        break
+                    item, self._pending, self._has_pending = self._pending, None, False
+                    self.processed += 1
+                result = process(item)
+        finally:
+            with self._lock:
+                # A frame parked during the last run waits for the next serve()
+                self._running = False
+        return result
+
+
+class ThreadedPipeline:
+    """Capture -> inference -> render pipeline connected by drop-oldest queues.
+
+    ``read_fn`` returns ``(ok, frame)`` like ``cv2.VideoCapture.read`` and runs on
+    the capture thread. ``process_fn(frame)`` runs on the inference thread and its
+    return value is handed to the renderer through ``get()``, which is meant to be
+    called from the main thread (OpenCV's HighGUI is not thread-safe).
+    ``lossless`` makes capture wait for the inference stage instead of dropping
+    frames, which suits video files (reps would be missed otherwise) but not live
+    cameras.
+    """
+
+    def __init__(
+        self,
+        read_fn: Callable,
+        process_fn: Callable[[Any], Any],
+        queue_size: int = 1,
+        lossless: bool = False,
+    ):
+        self.read_fn = read_fn
+        self.process_fn = process_fn
+        self.capture_queue = DropOldestQueue(queue_size, block=lossless)
+        self.render_queue = DropOldestQueue(queue_size)
+        self.captured = 0
+        self.inferred = 0
+        self.rendered = 0
+        self.error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="pose-capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="pose-inference", daemon=True),
+        ]
+
+    def start(self) -> "ThreadedPipeline":
+        for t in self._threads:
+            t.start()
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        self.capture_queue.close()
+        self.render_queue.close()
+        for t in self._threads:
+            if t.is_alive():
+                t.join(timeout)
+
+    @property
+    def finished(self) -> bool:
+        """True once the stream ended (or stop() was called) and every result was consumed."""
+        return self.render_queue.closed and len(self.render_queue) == 0
+
+    def get(self, timeout: Optional[float] = 0.5):
+        """Return the newest processed payload, or None if nothing is ready yet."""
+        item = self.render_queue.get(timeout)
+        if item is not None:
+            self.rendered += 1
+        return item
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "captured": self.captured,
+            "inferred": self.inferred,
+            "rendered": self.rendered,
+            "capture_queue_depth": len(self.capture_queue),
+            "render_queue_depth": len(self.render_queue),
+            # Frames the inference stage never saw / results the renderer never showed
+            "capture_dropped": self.capture_queue.dropped,
+            "inference_dropped": self.render_queue.dropped,
+        }
+
+    def _capture_loop(self) -> None:
+        try:
+            while not self._stop.is_set():
+                ok, frame = self.read_fn()
+                if not ok:
+                    break
+                self.captured += 1
+                self.capture_queue.put(frame)
+        except BaseException as exc:  # surfaced to the caller through self.error
+            self.error = exc
+        finally:
+            self.capture_queue.close()
+
+    def _inference_loop(self) -> None:
+        try:
+            while not self._stop.is_set():
+                frame = self.capture_queue.get(timeout=0.1)
+                if frame is None:
+                    if self.capture_queue.closed:
+                        break
+                    continue
+                payload = self.process_fn(frame)
+                self.inferred += 1
+                self.render_queue.put(payload)
+        except BaseException as exc:
+            self.error = exc
+        finally:
+            self.render_queue.close()
+
+
+def format_pipeline_stats(stats: Dict[str, int]) -> str:
+    return (
+        f"Queues cap/inf: {stats['capture_queue_depth']}/{stats['render_queue_depth']} | "
+        f"Dropped cap/inf: {stats['capture_dropped']}/{stats['inference_dropped']}"
+    )
+
+
+class FpsMeter:
+    """Exponentially smoothed frames-per-second estimate."""
+
+    def __init__(self, smoothing: float = 0.9):
+        self.smoothing = smoothing
+        self.fps = 0.0
+        self._last = time.time()
+
+    def tick(self) -> float:
+        now = time.time()
+        inst_fps = 1.0 / max(1e-6, (now - self._last))
+        self._last = now
+        self.fps = self.smoothing * self.fps + (1 - self.smoothing) * inst_fps
+        return self.fps
+
+
+def parse_inference_size(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse ``"WxH"`` or a bare height such as ``"480"``; None/``"full"`` means no resize.
+
+    A bare height keeps the frame's aspect ratio and is returned as ``(0, height)``.
+    """
+    if value is None or str(value).lower() in ("", "full", "none"):
+        return None
+    value = str(value).lower()
+    if "x" in value:
+        w, h = value.split("x", 1)
+        size = (int(w), int(h))
+    else:
+        size = (0, int(value))
+    if size[1] <= 0 or size[0] < 0:
+        raise ValueError(f"Invalid inference size: {value}")
+    return size
+
+
+class InferenceResizer:
+    """Produces the frame MediaPipe sees, at ``size`` rather than capture resolution.
+
+    The downscale and the optional color conversion are written into buffers
+    that are reused while the capture size stays the same, so the per-frame
+    cost is two passes over the small image and no allocation. Landmarks come
+    back normalized, so ``extract_landmarks`` with the display frame's shape
+    already yields display-resolution pixels. Frames no larger than ``size``
+    are only color-converted.
+    """
+
+    def __init__(self, size: Optional[Tuple[int, int]] = None, color_code: Optional[int] = None):
+        self.size = size
+        self.color_code = color_code
+        self._source_shape = None
+        self._target: Optional[Tuple[int, int]] = None
+        self._resized: Optional[np.ndarray] = None
+        self._converted: Optional[np.ndarray] = None
+
+    def _target_for(self, shape) -> Optional[Tuple[int, int]]:
+        if self.size is None:
+            return None
+        h, w = shape[:2]
+        tw, th = self.size
+        if tw == 0:
+            tw = max(1, int(round(w * th / float(h))))
+        if tw >= w and th >= h:
+            return None
+        return tw, th
+
+    def prepare(self, frame: np.ndarray) -> np.ndarray:
+        if frame.shape != self._source_shape:
+            self._source_shape = frame.shape
+            self._target = self._target_for(frame.shape)
+            self._resized = None
+            self._converted = None
+        image = frame
+        if self._target is not None:
+            if self._resized is None:
+                tw, th = self._target
+                self._resized = np.empty((th, tw) + frame.shape[2:], dtype=frame.dtype)
+            cv2.resize(frame, self._target, dst=self._resized, interpolation=cv2.INTER_AREA)
+            image = self._resized
+        if self.color_code is not None:
+            if self._converted is None:
+                self._converted = np.empty_like(image)
+            cv2.cvtColor(image, self.color_code, dst=self._converted)
+            image = self._converted
+        return image
+
+
+class FrameProcessor:
+    """Runs a BGR frame through color conversion, pose estimation, landmark
+    extraction and the analyzer, timing each stage on ``timer``.
+
+    Shared by the sequential, pipelined and offline loops so every mode
+    measures and records frames the same way. ``inference_size`` (see
+    ``parse_inference_size``) runs MediaPipe on a downscaled copy while
+    landmarks, drawing and the analyzer stay in capture resolution.
+    ``color_order`` is the channel order of incoming frames; ``"rgb"`` frames
+    go to MediaPipe without any conversion. Every result is passed to
+    ``events`` (a ``FeedbackEvents``) when one is attached.
+    """
+
+    def __init__(
+        self,
+        pose,
+        analyzer,
+        timer: Optional[StageTimer] = None,
+        recorder=None,
+        scheduler=None,
+        inference_size: Optional[Tuple[int, int]] = None,
+        color_order: str = "bgr",
+        events=None,
+    ):
+        self.pose = pose
+        self.analyzer = analyzer
+        self.timer = timer if timer is not None else StageTimer(enabled=False)
+        self.recorder = recorder
+        self.scheduler = scheduler
+        self.events = events
+        self.buffers = LandmarkBuffers()
+        self.resizer = InferenceResizer(inference_size, cv2.COLOR_BGR2RGB if color_order == "bgr" else None)
+
+    def process(self, frame, timestamp: Optional[float] = None):
+        """Return ``(results, landmarks_px, visibility, overlay_lines)`` for one frame.
+
+        With an ``AdaptiveInferenceScheduler`` attached, skipped frames get
+        extrapolated landmarks and a stand-in ``results`` for drawing.
+        """
+        timer = self.timer
+        scheduler = self.scheduler
+        if scheduler is not None and not scheduler.begin_frame():
+            t = timer.now()
+            if scheduler.predict(self.buffers, frame.shape):
+                landmarks_px, visibility = self.buffers.pixels, self.buffers.visibility
+                results = results_from_normalized(self.buffers.normalized)
+            else:
+                landmarks_px, visibility, results = None, None, None
+            t = timer.record("predict_landmarks", t)
+        else:
+            t = timer.now()
+            frame_rgb = self.resizer.prepare(frame)
+            t = timer.record("prepare_frame", t)
+            results = self.pose.process(frame_rgb)
+            t_infer = timer.record("pose_process", t)
+            landmarks_px, visibility = extract_landmarks(results, frame.shape, self.buffers)
+            if scheduler is not None:
+                scheduler.keyframe(
+                    (t_infer - t) / 1e9,
+                    self.buffers.normalized if landmarks_px is not None else None,
+                )
+            t = timer.record("extract_landmarks", t_infer)
+        if self.recorder is not None:
+            self.recorder.write_buffers(
+                time.time() if timestamp is None else timestamp,
+                frame.shape,
+                self.buffers if landmarks_px is not None else None,
+            )
+        overlay_lines = self.analyzer.update(landmarks_px, visibility, frame.shape)
+        timer.record("analyzer_update", t)
+        if self.events is not None:
+            self.events.observe(overlay_lines)
+        return results, landmarks_px, visibility, overlay_lines
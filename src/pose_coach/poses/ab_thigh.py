@@ -1,9 +1,4 @@
-from typing import List
-
-import numpy as np
-
-from ..feedback import Analyzer
-from ..angles import angle_at_point
+from ..feedback import Analyzer, FormFault, all_clear, tip
 
 LEFT_SHOULDER = 11
 RIGHT_SHOULDER = 12
@@ -15,41 +10,35 @@ LEFT_KNEE = 25
 RIGHT_KNEE = 26
 
 
-class AbdominalsAndThighsRater(Analyzer):
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Pose - Abdominals and Thighs"]
-        if landmarks_px is None:
-            tips.append("No person detected.")
-            return tips
-
-        ls = landmarks_px[LEFT_SHOULDER].astype(float)
-        rs = landmarks_px[RIGHT_SHOULDER].astype(float)
-        le = landmarks_px[LEFT_ELBOW].astype(float)
-        re = landmarks_px[RIGHT_ELBOW].astype(float)
-        lh = landmarks_px[LEFT_HIP].astype(float)
-        rh = landmarks_px[RIGHT_HIP].astype(float)
-        lk = landmarks_px[LEFT_KNEE].astype(float)
-        rk = landmarks_px[RIGHT_KNEE].astype(float)
-
-        elbows_out = abs(le[0] - ls[0]) > 0.2 * abs(rs[0] - ls[0]) and abs(re[0] - rs[0]) > 0.2 * abs(rs[0] - ls[0])
-        knee_locked = abs(lk[1] - rk[1]) < 0.05 * frame_shape[0]
-        hip_level = abs(lh[1] - rh[1]) < 0.05 * frame_shape[0]
+class AbdominalsAndThighsFault(FormFault):
+    ELBOWS_IN = 1
+    SOFT_KNEES = 2
+    HIPS_UNEVEN = 4
 
-        score = 0
-        if elbows_out:
-            score += 35
-        if knee_locked:
-            score += 30
-        if hip_level:
-            score += 35
 
-        tips.append(f"Score: {score}/100")
-        if not elbows_out:
-            tips.append("Flare elbows to frame the abs.")
-        if not knee_locked:
-            tips.append("Flex quads and lock knees gently.")
-        if not hip_level:
-            tips.append("Square hips to the front.")
-        if score >= 90:
-            tips.append("Sharp abs and thigh pose! Hold steady.")
-        return tips
\ No newline at end of file
+class AbdominalsAndThighsRater(Analyzer):
+    TITLE = "Mode: Pose - Abdominals and Thighs"
+    FAULTS = AbdominalsAndThighsFault
+    CHECKS = {
+        AbdominalsAndThighsFault.ELBOWS_IN: "elbows_out",
+        AbdominalsAndThighsFault.SOFT_KNEES: "knee_locked",
+        AbdominalsAndThighsFault.HIPS_UNEVEN: "hip_level",
+    }
+    TIPS = (
+        tip(AbdominalsAndThighsFault.ELBOWS_IN, "Flare elbows to frame the abs."),
+        tip(AbdominalsAndThighsFault.SOFT_KNEES, "Flex quads and lock knees gently."),
+        tip(AbdominalsAndThighsFault.HIPS_UNEVEN, "Square hips to the front."),
+        all_clear("Sharp abs and thigh pose! Hold steady."),
+    )
+
+    def measure(self, f) -> dict:
+        shoulder_width = abs(f.x(RIGHT_SHOULDER) - f.x(LEFT_SHOULDER))
+        elbows_out = (abs(f.x(LEFT_ELBOW) - f.x(LEFT_SHOULDER)) > 0.2 * shoulder_width) & (abs(f.x(RIGHT_ELBOW) - f.x(RIGHT_SHOULDER)) > 0.2 * shoulder_width)
+        knee_locked = abs(f.y(LEFT_KNEE) - f.y(RIGHT_KNEE)) < 0.05 * f.frame_shape[0]
+        hip_level = abs(f.y(LEFT_HIP) - f.y(RIGHT_HIP)) < 0.05 * f.frame_shape[0]
+        return {
+            "elbows_out": elbows_out,
+            "knee_locked": knee_locked,
+            "hip_level": hip_level,
+            "score": 35 * elbows_out + 30 * knee_locked + 35 * hip_level,
+        }
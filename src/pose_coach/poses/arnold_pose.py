@@ -1,9 +1,6 @@
-from typing import List
-
 import numpy as np
 
-from ..feedback import Analyzer
-from ..angles import angle_at_point
+from ..feedback import Analyzer, FormFault, all_clear, tip
 
 LEFT_SHOULDER = 11
 RIGHT_SHOULDER = 12
@@ -15,66 +12,57 @@ LEFT_HIP = 23
 RIGHT_HIP = 24
 
 
-class ArnoldPoseRater(Analyzer):
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Pose - Arnold"]
-        if landmarks_px is None:
-            tips.append("No person detected. Step back and ensure upper body in frame.")
-            return tips
+class ArnoldPoseFault(FormFault):
+    ARM_POSITION = 1
+    SHOULDERS_UNEVEN = 2
+    ELBOWS_IN = 4
 
-        ls = landmarks_px[LEFT_SHOULDER].astype(float)
-        rs = landmarks_px[RIGHT_SHOULDER].astype(float)
-        le = landmarks_px[LEFT_ELBOW].astype(float)
-        re = landmarks_px[RIGHT_ELBOW].astype(float)
-        lw = landmarks_px[LEFT_WRIST].astype(float)
-        rw = landmarks_px[RIGHT_WRIST].astype(float)
-        lh = landmarks_px[LEFT_HIP].astype(float)
-        rh = landmarks_px[RIGHT_HIP].astype(float)
 
+class ArnoldPoseRater(Analyzer):
+    TITLE = "Mode: Pose - Arnold"
+    NO_PERSON = "No person detected. Step back and ensure upper body in frame."
+    FAULTS = ArnoldPoseFault
+    CHECKS = {
+        ArnoldPoseFault.ARM_POSITION: "arnold_arms",
+        ArnoldPoseFault.SHOULDERS_UNEVEN: "symmetry",
+        ArnoldPoseFault.ELBOWS_IN: "elbows_out",
+    }
+    TIPS = (
+        tip(ArnoldPoseFault.ARM_POSITION, "Lift one arm overhead; flex the other across torso (~90-110°)."),
+        tip(ArnoldPoseFault.SHOULDERS_UNEVEN, "Keep shoulders level for a clean look."),
+        tip(ArnoldPoseFault.ELBOWS_IN, "Flare elbows slightly to enhance silhouette."),
+        all_clear("Iconic! Great Arnold pose."),
+    )
+
+    def measure(self, f) -> dict:
         # Approximate: one arm overhead, other flexed across torso (simplified)
         # Check left arm overhead: elbow above shoulder and wrist above elbow
-        left_overhead = (le[1] < ls[1]) and (lw[1] < le[1])
-        right_overhead = (re[1] < rs[1]) and (rw[1] < re[1])
+        left_overhead = (f.y(LEFT_ELBOW) < f.y(LEFT_SHOULDER)) & (f.y(LEFT_WRIST) < f.y(LEFT_ELBOW))
+        right_overhead = (f.y(RIGHT_ELBOW) < f.y(RIGHT_SHOULDER)) & (f.y(RIGHT_WRIST) < f.y(RIGHT_ELBOW))
 
         # Flexed arm: elbow bent ~90-120 deg
-        left_elbow_angle = angle_at_point(ls, le, lw)
-        right_elbow_angle = angle_at_point(rs, re, rw)
-        left_flexed = 70 <= left_elbow_angle <= 120
-        right_flexed = 70 <= right_elbow_angle <= 120
+        left_elbow_angle = f.angle(LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST)
+        right_elbow_angle = f.angle(RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST)
+        left_flexed = (70 <= left_elbow_angle) & (left_elbow_angle <= 120)
+        right_flexed = (70 <= right_elbow_angle) & (right_elbow_angle <= 120)
 
         # Choose configuration that best matches Arnold pose
         # Case A: left overhead, right flexed; Case B: right overhead, left flexed
-        case_a = left_overhead and right_flexed
-        case_b = right_overhead and left_flexed
-
-        score = 0
-        if case_a or case_b:
-            score = 70
-        if (left_overhead and left_flexed) or (right_overhead and right_flexed):
-            # If the same arm is both overhead and flexed, it's less ideal
-            score = max(score, 40)
+        arnold_arms = (left_overhead & right_flexed) | (right_overhead & left_flexed)
+        # If the same arm is both overhead and flexed, it's less ideal
+        same_arm = (left_overhead & left_flexed) | (right_overhead & right_flexed)
 
         # Symmetry: shoulder heights relatively level
-        symmetry = abs(ls[1] - rs[1]) < 0.1 * np.linalg.norm(ls - lh)
-        if symmetry:
-            score += 15
+        symmetry = abs(f.y(LEFT_SHOULDER) - f.y(RIGHT_SHOULDER)) < 0.1 * f.segment_length(LEFT_HIP, LEFT_SHOULDER)
 
         # Elbow positions relative to torso width
-        torso_width = abs(rs[0] - ls[0]) + 1e-6
-        elbows_out = (abs(le[0] - ls[0]) > 0.3 * torso_width) and (abs(re[0] - rs[0]) > 0.3 * torso_width)
-        if elbows_out:
-            score += 15
-
-        score = min(100, score)
-
-        tips.append(f"Score: {score}/100")
-        if not (case_a or case_b):
-            tips.append("Lift one arm overhead; flex the other across torso (~90-110°).")
-        if not symmetry:
-            tips.append("Keep shoulders level for a clean look.")
-        if not elbows_out:
-            tips.append("Flare elbows slightly to enhance silhouette.")
-        if score >= 90:
-            tips.append("Iconic! Great Arnold pose.")
+        torso_width = abs(f.x(RIGHT_SHOULDER) - f.x(LEFT_SHOULDER)) + 1e-6
+        elbows_out = (abs(f.x(LEFT_ELBOW) - f.x(LEFT_SHOULDER)) > 0.3 * torso_width) & (abs(f.x(RIGHT_ELBOW) - f.x(RIGHT_SHOULDER)) > 0.3 * torso_width)
 
-        return tips
\ No newline at end of file
+        score = np.maximum(70 * arnold_arms, 40 * same_arm) + 15 * symmetry + 15 * elbows_out
+        return {
+            "arnold_arms": arnold_arms,
+            "symmetry": symmetry,
+            "elbows_out": elbows_out,
+            "score": np.minimum(score, 100),
+        }
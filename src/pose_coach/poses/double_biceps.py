@@ -1,9 +1,6 @@
-from typing import List
-
 import numpy as np
 
-from ..feedback import Analyzer
-from ..angles import angle_at_point
+from ..feedback import Analyzer, FormFault, all_clear, tip
 
 LEFT_SHOULDER = 11
 RIGHT_SHOULDER = 12
@@ -15,61 +12,57 @@ LEFT_HIP = 23
 RIGHT_HIP = 24
 
 
-class DoubleBicepsRater(Analyzer):
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Pose - Double Biceps"]
-        if landmarks_px is None:
-            tips.append("No person detected. Step back and ensure upper body in frame.")
-            return tips
+class DoubleBicepsFault(FormFault):
+    LEFT_ELBOW_LOW = 1
+    RIGHT_ELBOW_LOW = 2
+    LEFT_FLEX = 4
+    RIGHT_FLEX = 8
+    ASYMMETRIC = 16
+
 
-        ls = landmarks_px[LEFT_SHOULDER].astype(float)
-        rs = landmarks_px[RIGHT_SHOULDER].astype(float)
-        le = landmarks_px[LEFT_ELBOW].astype(float)
-        re = landmarks_px[RIGHT_ELBOW].astype(float)
-        lw = landmarks_px[LEFT_WRIST].astype(float)
-        rw = landmarks_px[RIGHT_WRIST].astype(float)
-        lh = landmarks_px[LEFT_HIP].astype(float)
-        rh = landmarks_px[RIGHT_HIP].astype(float)
+class DoubleBicepsRater(Analyzer):
+    TITLE = "Mode: Pose - Double Biceps"
+    NO_PERSON = "No person detected. Step back and ensure upper body in frame."
+    FAULTS = DoubleBicepsFault
+    CHECKS = {
+        DoubleBicepsFault.LEFT_ELBOW_LOW: "left_elbow_level",
+        DoubleBicepsFault.RIGHT_ELBOW_LOW: "right_elbow_level",
+        DoubleBicepsFault.LEFT_FLEX: "left_flex_ok",
+        DoubleBicepsFault.RIGHT_FLEX: "right_flex_ok",
+        DoubleBicepsFault.ASYMMETRIC: "symmetry",
+    }
+    TIPS = (
+        tip(DoubleBicepsFault.LEFT_ELBOW_LOW | DoubleBicepsFault.RIGHT_ELBOW_LOW, "Lift elbows to shoulder height."),
+        tip(DoubleBicepsFault.LEFT_FLEX | DoubleBicepsFault.RIGHT_FLEX, "Flex elbows ~90-110° and squeeze biceps."),
+        tip(DoubleBicepsFault.ASYMMETRIC, "Match left/right spread for symmetry."),
+        all_clear("Great pose! Hold and breathe."),
+    )
 
+    def measure(self, f) -> dict:
         # Target: arms up and out, elbows roughly at shoulder level, elbows ~90-120 deg
-        left_elbow_angle = angle_at_point(ls, le, lw)
-        right_elbow_angle = angle_at_point(rs, re, rw)
+        left_elbow_angle = f.angle(LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST)
+        right_elbow_angle = f.angle(RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST)
 
         # Elbow height relative to shoulder
-        left_elbow_level = abs(le[1] - ls[1]) < 0.12 * np.linalg.norm(ls - lh)
-        right_elbow_level = abs(re[1] - rs[1]) < 0.12 * np.linalg.norm(rs - rh)
+        left_elbow_level = abs(f.y(LEFT_ELBOW) - f.y(LEFT_SHOULDER)) < 0.12 * f.segment_length(LEFT_HIP, LEFT_SHOULDER)
+        right_elbow_level = abs(f.y(RIGHT_ELBOW) - f.y(RIGHT_SHOULDER)) < 0.12 * f.segment_length(RIGHT_HIP, RIGHT_SHOULDER)
 
         # Symmetry: horizontal distances of elbows from shoulders
-        left_span = abs(le[0] - ls[0])
-        right_span = abs(re[0] - rs[0])
-        symmetry = abs(left_span - right_span) / (max(1.0, (left_span + right_span) / 2.0)) < 0.25
+        left_span = abs(f.x(LEFT_ELBOW) - f.x(LEFT_SHOULDER))
+        right_span = abs(f.x(RIGHT_ELBOW) - f.x(RIGHT_SHOULDER))
+        symmetry = abs(left_span - right_span) / np.maximum(1.0, (left_span + right_span) / 2.0) < 0.25
 
         # Elbow flexion score
-        left_flex_ok = 70 <= left_elbow_angle <= 120
-        right_flex_ok = 70 <= right_elbow_angle <= 120
+        left_flex_ok = (70 <= left_elbow_angle) & (left_elbow_angle <= 120)
+        right_flex_ok = (70 <= right_elbow_angle) & (right_elbow_angle <= 120)
 
         # Composite score
-        score = 0
-        if left_elbow_level:
-            score += 25
-        if right_elbow_level:
-            score += 25
-        if left_flex_ok:
-            score += 25
-        if right_flex_ok:
-            score += 25
-        if symmetry:
-            score += 10
-        score = min(100, score)
-
-        tips.append(f"Score: {score}/100")
-        if not left_elbow_level or not right_elbow_level:
-            tips.append("Lift elbows to shoulder height.")
-        if not left_flex_ok or not right_flex_ok:
-            tips.append("Flex elbows ~90-110° and squeeze biceps.")
-        if not symmetry:
-            tips.append("Match left/right spread for symmetry.")
-        if left_elbow_level and right_elbow_level and left_flex_ok and right_flex_ok and symmetry:
-            tips.append("Great pose! Hold and breathe.")
-
-        return tips
\ No newline at end of file
+        score = 25 * left_elbow_level + 25 * right_elbow_level + 25 * left_flex_ok + 25 * right_flex_ok + 10 * symmetry
+        return {
+            "left_elbow_level": left_elbow_level,
+            "right_elbow_level": right_elbow_level,
+            "left_flex_ok": left_flex_ok,
+            "right_flex_ok": right_flex_ok,
+            "symmetry": symmetry,
+            "score": np.minimum(score, 100),
+        }
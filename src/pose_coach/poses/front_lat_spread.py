@@ -1,8 +1,4 @@
-from typing import List
-
-import numpy as np
-
-from ..feedback import Analyzer
+from ..feedback import Analyzer, FormFault, all_clear, tip
 
 LEFT_SHOULDER = 11
 RIGHT_SHOULDER = 12
@@ -14,38 +10,34 @@ LEFT_HIP = 23
 RIGHT_HIP = 24
 
 
-class FrontLatSpreadRater(Analyzer):
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Pose - Front Lat Spread"]
-        if landmarks_px is None:
-            tips.append("No person detected.")
-            return tips
-
-        ls = landmarks_px[LEFT_SHOULDER].astype(float)
-        rs = landmarks_px[RIGHT_SHOULDER].astype(float)
-        le = landmarks_px[LEFT_ELBOW].astype(float)
-        re = landmarks_px[RIGHT_ELBOW].astype(float)
-        lh = landmarks_px[LEFT_HIP].astype(float)
-        rh = landmarks_px[RIGHT_HIP].astype(float)
-
-        shoulder_width = abs(rs[0] - ls[0])
-        elbow_flare_left = abs(le[0] - ls[0]) > 0.4 * shoulder_width
-        elbow_flare_right = abs(re[0] - rs[0]) > 0.4 * shoulder_width
-        elbows_level = abs(le[1] - re[1]) < 0.08 * frame_shape[0]
+class FrontLatSpreadFault(FormFault):
+    LEFT_ELBOW_IN = 1
+    RIGHT_ELBOW_IN = 2
+    ELBOWS_UNEVEN = 4
 
-        score = 0
-        if elbow_flare_left:
-            score += 30
-        if elbow_flare_right:
-            score += 30
-        if elbows_level:
-            score += 40
 
-        tips.append(f"Score: {score}/100")
-        if not elbow_flare_left or not elbow_flare_right:
-            tips.append("Flare elbows to widen lats.")
-        if not elbows_level:
-            tips.append("Keep elbows at even height.")
-        if score >= 90:
-            tips.append("Impressive width! Hold the spread.")
-        return tips
\ No newline at end of file
+class FrontLatSpreadRater(Analyzer):
+    TITLE = "Mode: Pose - Front Lat Spread"
+    FAULTS = FrontLatSpreadFault
+    CHECKS = {
+        FrontLatSpreadFault.LEFT_ELBOW_IN: "elbow_flare_left",
+        FrontLatSpreadFault.RIGHT_ELBOW_IN: "elbow_flare_right",
+        FrontLatSpreadFault.ELBOWS_UNEVEN: "elbows_level",
+    }
+    TIPS = (
+        tip(FrontLatSpreadFault.LEFT_ELBOW_IN | FrontLatSpreadFault.RIGHT_ELBOW_IN, "Flare elbows to widen lats."),
+        tip(FrontLatSpreadFault.ELBOWS_UNEVEN, "Keep elbows at even height."),
+        all_clear("Impressive width! Hold the spread."),
+    )
+
+    def measure(self, f) -> dict:
+        shoulder_width = abs(f.x(RIGHT_SHOULDER) - f.x(LEFT_SHOULDER))
+        elbow_flare_left = abs(f.x(LEFT_ELBOW) - f.x(LEFT_SHOULDER)) > 0.4 * shoulder_width
+        elbow_flare_right = abs(f.x(RIGHT_ELBOW) - f.x(RIGHT_SHOULDER)) > 0.4 * shoulder_width
+        elbows_level = abs(f.y(LEFT_ELBOW) - f.y(RIGHT_ELBOW)) < 0.08 * f.frame_shape[0]
+        return {
+            "elbow_flare_left": elbow_flare_left,
+            "elbow_flare_right": elbow_flare_right,
+            "elbows_level": elbows_level,
+            "score": 30 * elbow_flare_left + 30 * elbow_flare_right + 40 * elbows_level,
+        }
@@ -1,8 +1,6 @@
-from typing import List
-
 import numpy as np
 
-from ..feedback import Analyzer
+from ..feedback import Analyzer, FormFault, all_clear, tip
 
 LEFT_SHOULDER = 11
 RIGHT_SHOULDER = 12
@@ -10,33 +8,31 @@ LEFT_ELBOW = 13
 RIGHT_ELBOW = 14
 
 
-class MostMuscularRater(Analyzer):
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Pose - Most Muscular"]
-        if landmarks_px is None:
-            tips.append("No person detected.")
-            return tips
-
-        ls = landmarks_px[LEFT_SHOULDER].astype(float)
-        rs = landmarks_px[RIGHT_SHOULDER].astype(float)
-        le = landmarks_px[LEFT_ELBOW].astype(float)
-        re = landmarks_px[RIGHT_ELBOW].astype(float)
+class MostMuscularFault(FormFault):
+    ELBOWS_OUT = 1
+    TOO_UPRIGHT = 2
 
-        shoulder_center_x = ((ls + rs) / 2.0)[0]
-        elbows_in = abs(le[0] - shoulder_center_x) < 0.2 * abs(rs[0] - ls[0]) and abs(re[0] - shoulder_center_x) < 0.2 * abs(rs[0] - ls[0])
-        shoulders_forward = ((ls + rs) / 2.0)[1] < min(ls[1], rs[1]) + 0.05 * frame_shape[0]
 
-        score = 0
-        if elbows_in:
-            score += 60
-        if shoulders_forward:
-            score += 40
-
-        tips.append(f"Score: {score}/100")
-        if not elbows_in:
-            tips.append("Bring elbows in to crunch the chest and traps.")
-        if not shoulders_forward:
-            tips.append("Lean slightly forward and contract hard.")
-        if score >= 90:
-            tips.append("Beast mode! Hold the most muscular.")
-        return tips
\ No newline at end of file
+class MostMuscularRater(Analyzer):
+    TITLE = "Mode: Pose - Most Muscular"
+    FAULTS = MostMuscularFault
+    CHECKS = {
+        MostMuscularFault.ELBOWS_OUT: "elbows_in",
+        MostMuscularFault.TOO_UPRIGHT: "shoulders_forward",
+    }
+    TIPS = (
+        tip(MostMuscularFault.ELBOWS_OUT, "Bring elbows in to crunch the chest and traps."),
+        tip(MostMuscularFault.TOO_UPRIGHT, "Lean slightly forward and contract hard."),
+        all_clear("Beast mode! Hold the most muscular."),
+    )
+
+    def measure(self, f) -> dict:
+        shoulder_center_x = f.x("shoulder")
+        shoulder_width = abs(f.x(RIGHT_SHOULDER) - f.x(LEFT_SHOULDER))
+        elbows_in = (abs(f.x(LEFT_ELBOW) - shoulder_center_x) < 0.2 * shoulder_width) & (abs(f.x(RIGHT_ELBOW) - shoulder_center_x) < 0.2 * shoulder_width)
+        shoulders_forward = f.y("shoulder") < np.minimum(f.y(LEFT_SHOULDER), f.y(RIGHT_SHOULDER)) + 0.05 * f.frame_shape[0]
+        return {
+            "elbows_in": elbows_in,
+            "shoulders_forward": shoulders_forward,
+            "score": 60 * elbows_in + 40 * shoulders_forward,
+        }
@@ -1,8 +1,4 @@
-from typing import List
-
-import numpy as np
-
-from ..feedback import Analyzer
+from ..feedback import Analyzer, FormFault, all_clear, tip
 
 LEFT_SHOULDER = 11
 RIGHT_SHOULDER = 12
@@ -10,37 +6,34 @@ LEFT_HIP = 23
 RIGHT_HIP = 24
 
 
-class QuarterTurnsRater(Analyzer):
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Pose - Quarter Turns"]
-        if landmarks_px is None:
-            tips.append("No person detected.")
-            return tips
-
-        ls = landmarks_px[LEFT_SHOULDER].astype(float)
-        rs = landmarks_px[RIGHT_SHOULDER].astype(float)
-        lh = landmarks_px[LEFT_HIP].astype(float)
-        rh = landmarks_px[RIGHT_HIP].astype(float)
-
-        shoulders_level = abs(ls[1] - rs[1]) < 0.05 * frame_shape[0]
-        hips_level = abs(lh[1] - rh[1]) < 0.05 * frame_shape[0]
-        torso_upright = abs(((ls + rs) / 2.0)[0] - ((lh + rh) / 2.0)[0]) < 0.06 * frame_shape[1]
+class QuarterTurnsFault(FormFault):
+    SHOULDERS_UNEVEN = 1
+    HIPS_UNEVEN = 2
+    LEANING = 4
 
-        score = 0
-        if shoulders_level:
-            score += 35
-        if hips_level:
-            score += 35
-        if torso_upright:
-            score += 30
 
-        tips.append(f"Score: {score}/100")
-        if not shoulders_level:
-            tips.append("Level your shoulders.")
-        if not hips_level:
-            tips.append("Square and level hips.")
-        if not torso_upright:
-            tips.append("Stand tall; avoid leaning.")
-        if score >= 90:
-            tips.append("Clean quarter turn. Hold steady.")
-        return tips
\ No newline at end of file
+class QuarterTurnsRater(Analyzer):
+    TITLE = "Mode: Pose - Quarter Turns"
+    FAULTS = QuarterTurnsFault
+    CHECKS = {
+        QuarterTurnsFault.SHOULDERS_UNEVEN: "shoulders_level",
+        QuarterTurnsFault.HIPS_UNEVEN: "hips_level",
+        QuarterTurnsFault.LEANING: "torso_upright",
+    }
+    TIPS = (
+        tip(QuarterTurnsFault.SHOULDERS_UNEVEN, "Level your shoulders."),
+        tip(QuarterTurnsFault.HIPS_UNEVEN, "Square and level hips."),
+        tip(QuarterTurnsFault.LEANING, "Stand tall; avoid leaning."),
+        all_clear("Clean quarter turn. Hold steady."),
+    )
+
+    def measure(self, f) -> dict:
+        shoulders_level = abs(f.y(LEFT_SHOULDER) - f.y(RIGHT_SHOULDER)) < 0.05 * f.frame_shape[0]
+        hips_level = abs(f.y(LEFT_HIP) - f.y(RIGHT_HIP)) < 0.05 * f.frame_shape[0]
+        torso_upright = abs(f.x("shoulder") - f.x("hip")) < 0.06 * f.frame_shape[1]
+        return {
+            "shoulders_level": shoulders_level,
+            "hips_level": hips_level,
+            "torso_upright": torso_upright,
+            "score": 35 * shoulders_level + 35 * hips_level + 30 * torso_upright,
+        }
@@ -1,9 +1,4 @@
-from typing import List
-
-import numpy as np
-
-from ..feedback import Analyzer
-from ..angles import angle_at_point
+from ..feedback import Analyzer, FormFault, all_clear, tip
 
 LEFT_SHOULDER = 11
 RIGHT_SHOULDER = 12
@@ -15,38 +10,31 @@ LEFT_HIP = 23
 RIGHT_HIP = 24
 
 
-class SideTricepsRater(Analyzer):
-    def update(self, landmarks_px, visibility, frame_shape) -> list:
-        tips: List[str] = ["Mode: Pose - Side Triceps"]
-        if landmarks_px is None:
-            tips.append("No person detected.")
-            return tips
-
-        ls = landmarks_px[LEFT_SHOULDER].astype(float)
-        rs = landmarks_px[RIGHT_SHOULDER].astype(float)
-        le = landmarks_px[LEFT_ELBOW].astype(float)
-        re = landmarks_px[RIGHT_ELBOW].astype(float)
-        lw = landmarks_px[LEFT_WRIST].astype(float)
-        rw = landmarks_px[RIGHT_WRIST].astype(float)
-        lh = landmarks_px[LEFT_HIP].astype(float)
-        rh = landmarks_px[RIGHT_HIP].astype(float)
-
-        elbow_angle_left = angle_at_point(ls, le, lw)
-        elbow_angle_right = angle_at_point(rs, re, rw)
-        extended = elbow_angle_left > 150 or elbow_angle_right > 150
-        elbow_near_torso = abs(((le + re) / 2.0)[0] - ((ls + rs) / 2.0)[0]) < 0.12 * frame_shape[1]
+class SideTricepsFault(FormFault):
+    ARM_BENT = 1
+    ELBOW_AWAY = 2
 
-        score = 0
-        if extended:
-            score += 60
-        if elbow_near_torso:
-            score += 40
 
-        tips.append(f"Score: {score}/100")
-        if not extended:
-            tips.append("Extend the arm to showcase triceps definition.")
-        if not elbow_near_torso:
-            tips.append("Keep elbow close to torso for a tight pose.")
-        if score >= 90:
-            tips.append("Sharp side triceps! Hold steady.")
-        return tips
\ No newline at end of file
+class SideTricepsRater(Analyzer):
+    TITLE = "Mode: Pose - Side Triceps"
+    FAULTS = SideTricepsFault
+    CHECKS = {
+        SideTricepsFault.ARM_BENT: "extended",
+        SideTricepsFault.ELBOW_AWAY: "elbow_near_torso",
+    }
+    TIPS = (
+        tip(SideTricepsFault.ARM_BENT, "Extend the arm to showcase triceps definition."),
+        tip(SideTricepsFault.ELBOW_AWAY, "Keep elbow close to torso for a tight pose."),
+        all_clear("Sharp side triceps! Hold steady."),
+    )
+
+    def measure(self, f) -> dict:
+        elbow_angle_left = f.angle(LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST)
+        elbow_angle_right = f.angle(RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST)
+        extended = (elbow_angle_left > 150) | (elbow_angle_right > 150)
+        elbow_near_torso = abs(f.x("elbow") - f.x("shoulder")) < 0.12 * f.frame_shape[1]
+        return {
+            "extended": extended,
+            "elbow_near_torso": elbow_near_torso,
+            "score": 60 * extended + 40 * elbow_near_torso,
+        }
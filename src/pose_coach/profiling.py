@@ -0,0 +1,173 @@
+import bisect
+import csv
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Histogram bucket upper edges in microseconds: 1us .. 10s, 20 buckets per decade
+BUCKET_EDGES_US = [10 ** (i / 20.0) for i in range(0, 141)]
+
+
+class StageHistogram:
+    """Log-bucketed latency histogram with exact count/sum/min/max."""
+
+    __slots__ = ("counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_EDGES_US) + 1)
+        self.count = 0
+        self.total_us = 0.0
+        self.min_us = float("inf")
+        self.max_us = 0.0
+
+    def add(self, us: float) -> None:
+        self.counts[bisect.bisect_left(BUCKET_EDGES_US, us)] += 1
+        self.count += 1
+        self.total_us += us
+        if us < self.min_us:
+            self.min_us = us
+        if us > self.max_us:
+            self.max_us = us
+
+    def percentile(self, q: float) -> float:
+        """Upper bucket edge below which ``q`` percent of samples fall."""
+        if not self.count:
+            return 0.0
+        target = self.count * q / 100.0
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return min(BUCKET_EDGES_US[i], self.max_us) if i < len(BUCKET_EDGES_US) else self.max_us
+        return self.max_us
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_us": round(self.total_us / self.count, 1) if self.count else 0.0,
+            "min_us": round(self.min_us, 1) if self.count else 0.0,
+            "p50_us": round(self.percentile(50), 1),
+            "p90_us": round(self.percentile(90), 1),
+            "p99_us": round(self.percentile(99), 1),
+            "max_us": round(self.max_us, 1),
+        }
+
+
+class StageTimer:
+    """Per-stage latency histograms for the frame loop.
+
+    Stages are timed by chaining timestamps so each boundary costs one clock read::
+
+        t = timer.now()
+        ret, frame = cap.read()
+        t = timer.record("capture", t)
+
+    Safe to share between the pipeline threads. With ``trace_events`` > 0 the
+    most recent spans are also kept for ``write_chrome_trace``. A disabled timer
+    still returns timestamps but stores nothing.
+    """
+
+    def __init__(self, enabled: bool = True, trace_events: int = 0):
+        self.enabled = enabled
+        self.histograms: Dict[str, StageHistogram] = {}
+        self._events = deque(maxlen=trace_events) if trace_events else None
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._dump_path: Optional[str] = None
+        self._dump_interval_ns = 0
+        self._last_dump_ns = self._origin_ns
+
+    now = staticmethod(time.perf_counter_ns)
+
+    def record(self, stage: str, start_ns: int, end_ns: Optional[int] = None) -> int:
+        """Add ``end - start`` to ``stage`` and return ``end`` for chaining."""
+        if end_ns is None:
+            end_ns = time.perf_counter_ns()
+        if not self.enabled:
+            return end_ns
+        us = (end_ns - start_ns) / 1000.0
+        with self._lock:
+            hist = self.histograms.get(stage)
+            if hist is None:
+                hist = self.histograms[stage] = StageHistogram()
+            hist.add(us)
+            if self._events is not None:
+                self._events.append((stage, start_ns, end_ns, threading.get_ident()))
+        return end_ns
+
+    @contextmanager
+    def measure(self, stage: str):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(stage, start)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: hist.summary() for name, hist in self.histograms.items()}
+
+    def dump(self, path: str) -> None:
+        """Write the summary as CSV (``.csv``) or JSON (anything else)."""
+        summary = self.summary()
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8", newline="") as f:
+            if path.endswith(".csv"):
+                fields = ["stage", "count", "mean_us", "min_us", "p50_us", "p90_us", "p99_us", "max_us"]
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                for stage, row in summary.items():
+                    writer.writerow(dict(stage=stage, **row))
+            else:
+                json.dump({"elapsed_s": round((time.perf_counter_ns() - self._origin_ns) / 1e9, 3), "stages": summary}, f, indent=2)
+        # Atomic replace so a reader never sees a half-written periodic dump
+        os.replace(tmp, path)
+
+    def dump_every(self, path: str, interval_s: float) -> None:
+        """Make ``maybe_dump()`` rewrite ``path`` at most every ``interval_s`` seconds."""
+        self._dump_path = path
+        self._dump_interval_ns = int(interval_s * 1e9)
+
+    def maybe_dump(self) -> None:
+        if not self._dump_path:
+            return
+        now = time.perf_counter_ns()
+        if now - self._last_dump_ns >= self._dump_interval_ns:
+            self._last_dump_ns = now
+            self.dump(self._dump_path)
+
+    def close(self) -> None:
+        """Write the final periodic dump, if one was configured."""
+        if self._dump_path:
+            self.dump(self._dump_path)
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write the retained spans in Chrome trace format (chrome://tracing, Perfetto)."""
+        with self._lock:
+            events = list(self._events or [])
+        pid = os.getpid()
+        trace: List[Dict] = []
+        for stage, start_ns, end_ns, tid in events:
+            trace.append({
+                "name": stage,
+                "ph": "X",
+                "ts": (start_ns - self._origin_ns) / 1000.0,
+                "dur": (end_ns - start_ns) / 1000.0,
+                "pid": pid,
+                "tid": tid,
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+
+def format_stage_summary(summary: Dict[str, Dict[str, float]]) -> List[str]:
+    lines = [f"{'stage':<20}{'count':>8}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'max us':>10}"]
+    for stage, row in summary.items():
+        lines.append(
+            f"{stage:<20}{row['count']:>8}{row['mean_us']:>10.1f}{row['p50_us']:>10.1f}{row['p99_us']:>10.1f}{row['max_us']:>10.1f}"
+        )
+    return lines
@@ -0,0 +1,193 @@
+import os
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from .feedback import media_clock
+from .utils import NUM_LANDMARKS, LandmarkBuffers
+
+# One fixed-size record per frame. Landmarks are stored in MediaPipe's normalized
+# image space so replay reproduces exactly the int32 pixels extract_landmarks
+# produced live.
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("frame_shape", "<u2", (3,)),
+    ("detected", "u1"),
+    ("normalized", "<f4", (NUM_LANDMARKS, 2)),
+    ("visibility", "<f4", (NUM_LANDMARKS,)),
+])
+
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+_COUNT_WIDTH = 20
+
+
+def _npy_header(count: int) -> bytes:
+    """Build a version 1.0 .npy header whose length does not depend on ``count``.
+
+    The shape is zero-padded to a fixed width so the header can be rewritten in
+    place once the final record count is known.
+    """
+    descr = np.lib.format.dtype_to_descr(RECORD_DTYPE)
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%s,), }" % (descr, str(count).rjust(_COUNT_WIDTH))
+    total = len(_NPY_MAGIC) + 2 + len(header) + 1
+    header += " " * ((64 - total % 64) % 64) + "\n"
+    return _NPY_MAGIC + len(header).to_bytes(2, "little") + header.encode("latin1")
+
+
+class LandmarkRecorder:
+    """Append per-frame landmarks to a ``.npy`` file of ``RECORD_DTYPE`` records.
+
+    Records are staged in a small in-memory block and written out when it
+    fills. The header is finalised on ``close()``; files cut short by a crash
+    are still readable because ``LandmarkRecording`` sizes itself from the file
+    length.
+    """
+
+    def __init__(self, path: str, block_size: int = 256):
+        self.path = path
+        self.count = 0
+        self._block = np.zeros(block_size, dtype=RECORD_DTYPE)
+        self._pending = 0
+        self._file = open(path, "wb")
+        self._file.write(_npy_header(0))
+
+    def write(
+        self,
+        timestamp: float,
+        frame_shape,
+        normalized: Optional[np.ndarray] = None,
+        visibility: Optional[np.ndarray] = None,
+    ) -> None:
+        """Record one frame; ``normalized`` is (33, 2) or (33, 3) with x, y[, visibility]."""
+        rec = self._block[self._pending]
+        rec["timestamp"] = timestamp
+        rec["frame_shape"] = tuple(frame_shape[:3]) + (0,) * (3 - len(frame_shape[:3]))
+        if normalized is None:
+            rec["detected"] = 0
+            rec["normalized"] = 0.0
+            rec["visibility"] = 0.0
+        else:
+            rec["detected"] = 1
+            rec["normalized"] = normalized[:, :2]
+            if visibility is None:
+                visibility = normalized[:, 2]
+            rec["visibility"] = visibility
+        self._pending += 1
+        self.count += 1
+        if self._pending == len(self._block):
+            self.flush()
+
+    def write_buffers(self, timestamp: float, frame_shape, buffers: Optional[LandmarkBuffers]) -> None:
+        """Record the frame held in ``buffers``, or a missed detection if None."""
+        self.write(timestamp, frame_shape, None if buffers is None else buffers.normalized)
+
+    def flush(self) -> None:
+        if self._pending:
+            self._file.write(self._block[: self._pending].tobytes())
+            self._pending = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.seek(0)
+        self._file.write(_npy_header(self.count))
+        self._file.close()
+
+    def __enter__(self) -> "LandmarkRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _read_header(f) -> Tuple[np.dtype, int]:
+    version = np.lib.format.read_magic(f)
+    if version != (1, 0):
+        raise ValueError(f"Unsupported landmark recording version: {version}")
+    _, _, dtype = np.lib.format.read_array_header_1_0(f)
+    return dtype, f.tell()
+
+
+class LandmarkRecording:
+    """Memory-mapped, read-only view of a landmark recording.
+
+    Only the pages actually touched are read, so replaying an hour of footage
+    does not load the whole file into RAM.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            dtype, offset = _read_header(f)
+        if dtype != RECORD_DTYPE:
+            raise ValueError(f"{path} is not a landmark recording")
+        count = (os.path.getsize(path) - offset) // RECORD_DTYPE.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=offset, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.records["timestamp"]
+
+    def frames(self, chunk_size: int = 4096) -> Iterator[Tuple[float, Optional[np.ndarray], Optional[np.ndarray], tuple]]:
+        """Yield ``(timestamp, landmarks_px, visibility, frame_shape)`` for every frame.
+
+        ``landmarks_px``/``visibility`` are None for frames without a detection.
+        The map is decoded one chunk at a time, vectorized over the chunk.
+        """
+        for start in range(0, len(self.records), chunk_size):
+            stop = start + chunk_size
+            pixels, visibility, detected = self.pixel_landmarks(start, stop)
+            chunk = self.records[start:stop]
+            timestamps = chunk["timestamp"].tolist()
+            shapes = [tuple(s) if s[2] else tuple(s[:2]) for s in chunk["frame_shape"].tolist()]
+            for i, timestamp in enumerate(timestamps):
+                if detected[i]:
+                    yield timestamp, pixels[i], visibility[i], shapes[i]
+                else:
+                    yield timestamp, None, None, shapes[i]
+
+    def pixel_landmarks(self, start: int = 0, stop: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(landmarks_px (T, 33, 2) int32, visibility (T, 33), detected (T,))`` for a slice."""
+        recs = self.records[start:stop]
+        shapes = recs["frame_shape"].astype(np.float64)
+        scale = np.stack([shapes[:, 1], shapes[:, 0]], axis=-1)[:, None, :]
+        pixels = (recs["normalized"].astype(np.float64) * scale).astype(np.int32)
+        return pixels, np.array(recs["visibility"]), recs["detected"].astype(bool)
+
+    def replay(self, analyzer, on_frame=None) -> int:
+        """Feed every recorded frame to ``analyzer.update``.
+
+        ``on_frame(timestamp, tips, detected)`` is called after each update.
+        Coaches with a ``clock`` time their reps by the recorded timestamps.
+        Returns the number of frames replayed.
+        """
+        n = 0
+        with media_clock(analyzer) as current:
+            for timestamp, landmarks_px, visibility, shape in self.frames():
+                current[0] = timestamp
+                tips = analyzer.update(landmarks_px, visibility, shape)
+                if on_frame is not None:
+                    on_frame(timestamp, tips, landmarks_px is not None)
+                n += 1
+        return n
+
+    def analyze(self, analyzer, start: int = 0, stop: Optional[int] = None):
+        """Run ``analyzer.analyze_sequence`` over a slice in one vectorized pass.
+
+        A recording holds a single source, so the first frame's shape is used
+        for the whole slice.
+        """
+        pixels, visibility, detected = self.pixel_landmarks(start, stop)
+        recs = self.records[start:stop]
+        shape = tuple(recs["frame_shape"][0].tolist()) if len(recs) else (0, 0, 0)
+        if len(shape) == 3 and not shape[2]:
+            shape = shape[:2]
+        return analyzer.analyze_sequence(pixels, visibility, np.array(recs["timestamp"]), shape, detected)
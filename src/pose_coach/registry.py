@@ -0,0 +1,58 @@
+from .exercises.bicep_curl import BicepCurlCoach
+from .exercises.barbell_row import BarbellRowCoach
+from .exercises.squats import SquatCoach
+from .exercises.lunges import LungeCoach
+from .exercises.rdl import RDLCoach
+from .exercises.leg_press import LegPressCoach
+from .exercises.calf_raises import CalfRaiseCoach
+from .exercises.pushups import PushupCoach
+from .exercises.pull_downs import PullDownCoach
+from .exercises.bench_press import BenchPressCoach
+from .exercises.bent_over_rows import BentOverRowCoach
+from .exercises.lateral_raises import LateralRaiseCoach
+from .exercises.deadlift import DeadliftCoach
+from .exercises.box_jumps import BoxJumpCoach
+from .exercises.cable_woodchoppers import CableWoodchopperCoach
+from .poses.double_biceps import DoubleBicepsRater
+from .poses.arnold_pose import ArnoldPoseRater
+from .poses.quarter_turns import QuarterTurnsRater
+from .poses.front_lat_spread import FrontLatSpreadRater
+from .poses.back_lat_spread import RearLatSpreadRater
+from .poses.side_chest import SideChestRater
+from .poses.side_triceps import SideTricepsRater
+from .poses.ab_thigh import AbdominalsAndThighsRater
+from .poses.most_muscular import MostMuscularRater
+from .poses.vacuum import VacuumPoseRater
+from .poses.moon_pose import MoonPoseRater
+
+
+EXERCISES = [
+    ("bicep_curl", BicepCurlCoach),
+    ("barbell_row", BarbellRowCoach),
+    ("squat", SquatCoach),
+    ("lunge", LungeCoach),
+    ("rdl", RDLCoach),
+    ("leg_press", LegPressCoach),
+    ("calf_raise", CalfRaiseCoach),
+    ("pushup", PushupCoach),
+    ("pull_down", PullDownCoach),
+    ("bench_press", BenchPressCoach),
+    ("bent_over_row", BentOverRowCoach),
+    ("lateral_raise", LateralRaiseCoach),
+    ("deadlift", DeadliftCoach),
+    ("box_jump", BoxJumpCoach),
+    ("cable_woodchopper", CableWoodchopperCoach),
+]
+POSES = [
+    ("double_biceps", DoubleBicepsRater),
+    ("arnold", ArnoldPoseRater),
+    ("quarter_turns", QuarterTurnsRater),
+    ("front_lat_spread", FrontLatSpreadRater),
+    ("rear_lat_spread", RearLatSpreadRater),
+    ("side_chest", SideChestRater),
+    ("side_triceps", SideTricepsRater),
+    ("ab_thigh", AbdominalsAndThighsRater),
+    ("most_muscular", MostMuscularRater),
+    ("vacuum", VacuumPoseRater),
+    ("moon_pose", MoonPoseRater),
+]
@@ -0,0 +1,126 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# {phase: [(signal, next_phase), ...]}: from ``phase`` the first listed signal
+# that is true on a frame moves the machine to its ``next_phase``
+Transitions = Dict[str, Sequence[Tuple[str, str]]]
+
+
+class RepCounter:
+    """Hysteresis phase machine that counts and times reps.
+
+    Phases change on boolean signals (``at_top``/``at_bottom`` and friends)
+    computed by the coach from its enter/exit thresholds; a rep is counted on
+    every entry into ``count_phase``. A phase must be held for ``min_dwell``
+    frames before it can be left, which filters single-frame jitter around a
+    threshold (``1`` reproduces a plain threshold machine).
+
+    ``step`` advances one frame; ``run`` advances over whole ``(T,)`` signal
+    arrays and gives exactly the same result, including when streaming and
+    vectorized calls are mixed. Each counted rep appends a timing record to
+    ``rep_times``: its start/end time, the time spent in each phase, the
+    ``tempo`` phases under their names (e.g. ``eccentric``/``concentric``)
+    and ``time_under_tension``. A rep starts where the previous one ended,
+    or at the first frame seen for the first rep.
+    """
+
+    def __init__(
+        self,
+        transitions: Transitions,
+        phase: str,
+        count_phase: Optional[str],
+        min_dwell: int = 1,
+        tempo: Optional[Mapping[str, str]] = None,
+    ):
+        self.transitions = {p: tuple(options) for p, options in transitions.items()}
+        self.start_phase = phase
+        self.count_phase = count_phase
+        self.min_dwell = max(1, int(min_dwell))
+        self.tempo = dict(tempo or {})
+        self.reset()
+
+    def reset(self) -> None:
+        self.phase = self.start_phase
+        self.reps = 0
+        self.frames = 0
+        # Frames since the current phase was entered, saturating at min_dwell
+        self.dwell = self.min_dwell
+        self.rep_times: List[Dict[str, Any]] = []
+        self._rep_start: Optional[float] = None
+        self._phase_start = 0.0
+        self._durations: Dict[str, float] = {}
+
+    def step(self, signals: Mapping[str, Any], timestamp: Optional[float] = None) -> Optional[str]:
+        """Advance one frame; returns the new phase on a transition, else None.
+
+        Without ``timestamp`` times are counted in frames.
+        """
+        t = float(self.frames) if timestamp is None else timestamp
+        self.frames += 1
+        if self._rep_start is None:
+            self._rep_start = self._phase_start = t
+        if self.dwell < self.min_dwell:
+            self.dwell += 1
+            if self.dwell < self.min_dwell:
+                return None
+        for key, next_phase in self.transitions.get(self.phase, ()):
+            if signals[key]:
+                self._enter(next_phase, t)
+                return next_phase
+        return None
+
+    def run(self, signals: Mapping[str, np.ndarray], timestamps: Optional[np.ndarray] = None) -> List[Tuple[int, str]]:
+        """Advance over ``(T,)`` boolean signal arrays; returns ``[(frame, new_phase), ...]``.
+
+        Instead of stepping through every frame it jumps straight to the next
+        frame on which one of the current phase's signals fires (and the dwell
+        is satisfied), so the cost is one ``searchsorted`` per transition.
+        """
+        keys = {key for options in self.transitions.values() for key, _ in options}
+        n = len(signals[next(iter(keys))]) if keys else 0
+        if not n:
+            return []
+        times = self.frames + np.arange(n, dtype=float) if timestamps is None else np.asarray(timestamps, dtype=float)
+        if self._rep_start is None:
+            self._rep_start = self._phase_start = float(times[0])
+        hits = {key: np.flatnonzero(signals[key]) for key in keys}
+        changes: List[Tuple[int, str]] = []
+        start = self.min_dwell - self.dwell - 1 if self.dwell < self.min_dwell else 0
+        while start < n:
+            best: Optional[Tuple[int, str]] = None
+            for key, next_phase in self.transitions.get(self.phase, ()):
+                idx = hits[key]
+                k = int(np.searchsorted(idx, start))
+                if k < len(idx) and (best is None or idx[k] < best[0]):
+                    best = (int(idx[k]), next_phase)
+            if best is None:
+                break
+            changes.append(best)
+            self._enter(best[1], float(times[best[0]]))
+            start = best[0] + self.min_dwell
+        since = n if not changes else n - 1 - changes[-1][0]
+        self.dwell = min(self.min_dwell, (self.dwell if not changes else 0) + since)
+        self.frames += n
+        return changes
+
+    def _enter(self, phase: str, t: float) -> None:
+        self._durations[self.phase] = self._durations.get(self.phase, 0.0) + (t - self._phase_start)
+        self.phase = phase
+        self._phase_start = t
+        self.dwell = 0
+        if phase != self.count_phase:
+            return
+        self.reps += 1
+        rep: Dict[str, Any] = {
+            "rep": self.reps,
+            "start": self._rep_start,
+            "end": t,
+            "phases": self._durations,
+            "time_under_tension": t - self._rep_start,
+        }
+        for name, tempo_phase in self.tempo.items():
+            rep[name] = self._durations.get(tempo_phase, 0.0)
+        self.rep_times.append(rep)
+        self._rep_start = t
+        self._durations = {}
@@ -0,0 +1,133 @@
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class RoiPoseEstimator:
+    """Drop-in ``pose`` wrapper that runs inference on a crop around the athlete.
+
+    The crop is a padded bounding box of the previous frame's visible
+    landmarks, downscaled so its longer side is at most ``max_side`` pixels.
+    Landmarks are mapped back to full-frame normalized coordinates in place, so
+    ``extract_landmarks`` and drawing see ordinary full-frame results. The crop
+    only moves when the athlete gets close to its edge, which keeps MediaPipe's
+    own tracking and smoothing stable. If the crop loses the person the same
+    frame is re-run at full resolution and ROI mode restarts from there.
+    """
+
+    def __init__(
+        self,
+        pose,
+        padding: float = 0.25,
+        max_side: int = 512,
+        min_side_ratio: float = 0.2,
+        edge_margin: float = 0.08,
+        visibility_threshold: float = 0.3,
+    ):
+        self.pose = pose
+        self.padding = padding
+        self.max_side = max_side
+        self.min_side_ratio = min_side_ratio
+        self.edge_margin = edge_margin
+        self.visibility_threshold = visibility_threshold
+        self.roi: Optional[Tuple[int, int, int, int]] = None
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.fallbacks = 0
+        self._pixel_fraction_sum = 0.0
+
+    def process(self, frame_rgb):
+        h, w = frame_rgb.shape[:2]
+        if self.roi is not None:
+            results = self._process_roi(frame_rgb, self.roi)
+            if results.pose_landmarks is not None:
+                if self._update_roi(results.pose_landmarks.landmark, w, h):
+                    # MediaPipe's track is in crop coordinates; a moved crop invalidates it
+                    self.pose.reset()
+                return results
+            self.fallbacks += 1
+            self.roi = None
+            self.pose.reset()
+
+        self.full_frames += 1
+        self._pixel_fraction_sum += 1.0
+        results = self.pose.process(frame_rgb)
+        if results.pose_landmarks is not None and self._update_roi(results.pose_landmarks.landmark, w, h):
+            self.pose.reset()
+        return results
+
+    def reset(self) -> None:
+        self.roi = None
+        self.pose.reset()
+
+    def close(self) -> None:
+        self.pose.close()
+
+    def stats(self) -> Dict[str, float]:
+        frames = self.roi_frames + self.full_frames
+        return {
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "fallbacks": self.fallbacks,
+            "mean_pixel_fraction": round(self._pixel_fraction_sum / frames, 3) if frames else 0.0,
+        }
+
+    def _process_roi(self, frame_rgb, roi):
+        x0, y0, x1, y1 = roi
+        h, w = frame_rgb.shape[:2]
+        crop = frame_rgb[y0:y1, x0:x1]
+        cw, ch = x1 - x0, y1 - y0
+        scale = self.max_side / float(max(cw, ch))
+        if scale < 1.0:
+            crop = cv2.resize(crop, (max(1, int(cw * scale)), max(1, int(ch * scale))), interpolation=cv2.INTER_AREA)
+            inferred_pixels = crop.shape[0] * crop.shape[1]
+        else:
+            crop = np.ascontiguousarray(crop)
+            inferred_pixels = cw * ch
+        self.roi_frames += 1
+        self._pixel_fraction_sum += inferred_pixels / float(w * h)
+
+        results = self.pose.process(crop)
+        if results.pose_landmarks is not None:
+            # Crop-normalized -> full-frame-normalized, in place
+            sx, sy = cw / float(w), ch / float(h)
+            ox, oy = x0 / float(w), y0 / float(h)
+            for lm in results.pose_landmarks.landmark:
+                lm.x = ox + lm.x * sx
+                lm.y = oy + lm.y * sy
+        return results
+
+    def _update_roi(self, landmarks, w: int, h: int) -> bool:
+        """Re-centre the crop on ``landmarks`` if needed; True when the crop changed."""
+        xs = []
+        ys = []
+        for lm in landmarks:
+            if lm.visibility >= self.visibility_threshold:
+                xs.append(lm.x)
+                ys.append(lm.y)
+        if len(xs) < 4:
+            self.roi = None
+            return False
+        bx0, bx1 = min(xs) * w, max(xs) * w
+        by0, by1 = min(ys) * h, max(ys) * h
+
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            mx, my = self.edge_margin * (x1 - x0), self.edge_margin * (y1 - y0)
+            if bx0 >= x0 + mx and bx1 <= x1 - mx and by0 >= y0 + my and by1 <= y1 - my:
+                return False
+
+        bw, bh = bx1 - bx0, by1 - by0
+        side_min = self.min_side_ratio * min(w, h)
+        pad_x = max(self.padding * bw, (side_min - bw) / 2.0, 0.0)
+        pad_y = max(self.padding * bh, (side_min - bh) / 2.0, 0.0)
+        x0 = int(max(0, bx0 - pad_x))
+        y0 = int(max(0, by0 - pad_y))
+        x1 = int(min(w, bx1 + pad_x))
+        y1 = int(min(h, by1 + pad_y))
+        if x1 - x0 < 8 or y1 - y0 < 8:
+            self.roi = None
+            return False
+        self.roi = (x0, y0, x1, y1)
+        return True
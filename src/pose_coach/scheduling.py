@@ -0,0 +1,265 @@
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from .utils import NUM_LANDMARKS, LandmarkBuffers
+
+
+class LandmarkExtrapolator:
+    """Constant-velocity prediction of the 33-point array between keyframes.
+
+    Works in normalized image space so predictions stay valid if the frame
+    size changes. Velocity comes from the last two keyframes; with a single
+    keyframe the pose is held. Predictions stop after ``max_gap`` frames.
+    """
+
+    def __init__(self, max_gap: int = 8):
+        self.max_gap = max_gap
+        self._prev = np.zeros((NUM_LANDMARKS, 2), dtype=np.float32)
+        self._last = np.zeros((NUM_LANDMARKS, 2), dtype=np.float32)
+        self._last_vis = np.zeros(NUM_LANDMARKS, dtype=np.float32)
+        self._velocity = np.zeros((NUM_LANDMARKS, 2), dtype=np.float32)
+        self._prev_idx: Optional[int] = None
+        self._last_idx: Optional[int] = None
+
+    def reset(self) -> None:
+        self._prev_idx = None
+        self._last_idx = None
+
+    def add_keyframe(self, frame_idx: int, normalized: Optional[np.ndarray]) -> None:
+        """Register a freshly inferred (33, 3) x/y/visibility array, or None if nobody was detected."""
+        if normalized is None:
+            self.reset()
+            return
+        if self._last_idx is not None:
+            self._prev[:] = self._last
+            self._prev_idx = self._last_idx
+        self._last[:] = normalized[:, :2]
+        self._last_vis[:] = normalized[:, 2]
+        self._last_idx = frame_idx
+        if self._prev_idx is not None:
+            np.subtract(self._last, self._prev, out=self._velocity)
+            self._velocity /= float(self._last_idx - self._prev_idx)
+        else:
+            self._velocity[:] = 0.0
+
+    def predict_into(self, frame_idx: int, buffers: LandmarkBuffers, frame_shape) -> bool:
+        """Write the prediction for ``frame_idx`` into ``buffers``; False if there is none."""
+        if self._last_idx is None or frame_idx - self._last_idx > self.max_gap:
+            return False
+        out = buffers.normalized[:, :2]
+        np.multiply(self._velocity, float(frame_idx - self._last_idx), out=out)
+        out += self._last
+        buffers.normalized[:, 2] = self._last_vis
+        buffers.rescale(frame_shape)
+        return True
+
+
+class AdaptiveInferenceScheduler:
+    """Decides which frames run pose inference so the loop holds ``target_fps``.
+
+    Inference runs every ``stride`` frames. After each keyframe the stride is
+    re-derived from the smoothed inference latency against the per-frame budget
+    (1 / target_fps) and clamped to ``[1, max_stride]``. Frames in between get
+    landmarks from a ``LandmarkExtrapolator`` so analyzers still see every frame.
+    """
+
+    def __init__(self, target_fps: float = 30.0, max_stride: int = 4, smoothing: float = 0.8, headroom: float = 0.1):
+        self.budget_s = 1.0 / max(1e-3, target_fps)
+        self.max_stride = max(1, max_stride)
+        self.smoothing = smoothing
+        self.headroom = headroom
+        self.stride = 1
+        self.latency_s = 0.0
+        self.frame_idx = -1
+        self.keyframes = 0
+        self.predicted = 0
+        self._last_keyframe = -self.max_stride
+        self.extrapolator = LandmarkExtrapolator(max_gap=2 * self.max_stride)
+
+    def begin_frame(self) -> bool:
+        """Advance to the next frame and return True if it should run inference."""
+        self.frame_idx += 1
+        return self.frame_idx - self._last_keyframe >= self.stride
+
+    def keyframe(self, latency_s: float, normalized: Optional[np.ndarray]) -> None:
+        self.keyframes += 1
+        self._last_keyframe = self.frame_idx
+        if self.keyframes == 1:
+            self.latency_s = latency_s
+        else:
+            self.latency_s = self.smoothing * self.latency_s + (1 - self.smoothing) * latency_s
+        needed = math.ceil(self.latency_s * (1.0 + self.headroom) / self.budget_s)
+        self.stride = max(1, min(self.max_stride, needed))
+        self.extrapolator.add_keyframe(self.frame_idx, normalized)
+
+    def predict(self, buffers: LandmarkBuffers, frame_shape) -> bool:
+        ok = self.extrapolator.predict_into(self.frame_idx, buffers, frame_shape)
+        if ok:
+            self.predicted += 1
+        return ok
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "stride": self.stride,
+            "inference_ms": round(self.latency_s * 1000.0, 2),
+            "budget_ms": round(self.budget_s * 1000.0, 2),
+            "keyframes": self.keyframes,
+            "predicted": self.predicted,
+        }
+
+
+class ModelComplexityController:
+    """Drop-in ``pose`` wrapper that moves between MediaPipe model complexities 0-2.
+
+    Rolling inference latency is compared with the ``1 / target_fps`` budget:
+    above ``downgrade_ratio`` of the budget the next lighter model is loaded,
+    below ``upgrade_ratio`` the next heavier one, unless that model was already
+    seen to blow the budget. Replacement models are built on a background thread
+    so loading never stalls the loop. To keep tracking continuous, the new model
+    only takes over once it detects the person the old one was tracking (or
+    after ``handover_frames`` attempts); until then both run on the same frame.
+    """
+
+    def __init__(
+        self,
+        pose_factory: Callable[[int], Any],
+        target_fps: float = 30.0,
+        initial: int = 1,
+        min_complexity: int = 0,
+        max_complexity: int = 2,
+        window: int = 30,
+        downgrade_ratio: float = 1.0,
+        upgrade_ratio: float = 0.5,
+        cooldown_frames: int = 90,
+        handover_frames: int = 5,
+    ):
+        self.pose_factory = pose_factory
+        self.budget_s = 1.0 / max(1e-3, target_fps)
+        self.min_complexity = min_complexity
+        self.max_complexity = max_complexity
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.cooldown_frames = cooldown_frames
+        self.handover_frames = handover_frames
+        self.complexity = initial
+        self.pose = pose_factory(initial)
+        self.switches = 0
+        # Last rolling latency seen per complexity, used to avoid flapping
+        self.latency_by_complexity: Dict[int, float] = {}
+        self.unavailable = set()
+        self._latencies = deque(maxlen=window)
+        self._frames_since_switch = 0
+        self._lock = threading.Lock()
+        self._loading: Optional[int] = None
+        self._candidate = None
+        self._candidate_complexity: Optional[int] = None
+        self._handover_attempts = 0
+        self._tracking = False
+
+    def process(self, frame_rgb):
+        self._frames_since_switch += 1
+        candidate = self._take_candidate()
+        if candidate is not None:
+            return self._handover(candidate, frame_rgb)
+
+        start = time.perf_counter()
+        results = self.pose.process(frame_rgb)
+        self._latencies.append(time.perf_counter() - start)
+        self._tracking = results.pose_landmarks is not None
+        self._maybe_switch()
+        return results
+
+    def reset(self) -> None:
+        self.pose.reset()
+
+    def close(self) -> None:
+        self.pose.close()
+
+    def rolling_latency(self) -> float:
+        if not self._latencies:
+            return 0.0
+        return sorted(self._latencies)[len(self._latencies) // 2]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "complexity": self.complexity,
+            "rolling_ms": round(self.rolling_latency() * 1000.0, 2),
+            "budget_ms": round(self.budget_s * 1000.0, 2),
+            "switches": self.switches,
+            "unavailable": sorted(self.unavailable),
+        }
+
+    def _maybe_switch(self) -> None:
+        if self._loading is not None or self._frames_since_switch < self.cooldown_frames:
+            return
+        if len(self._latencies) < self._latencies.maxlen:
+            return
+        latency = self.rolling_latency()
+        self.latency_by_complexity[self.complexity] = latency
+        target = None
+        if latency > self.budget_s * self.downgrade_ratio:
+            target = self._next(-1)
+        elif latency < self.budget_s * self.upgrade_ratio:
+            heavier = self._next(+1)
+            if heavier is not None and self.latency_by_complexity.get(heavier, 0.0) <= self.budget_s * self.downgrade_ratio:
+                target = heavier
+        if target is not None:
+            self._start_loading(target)
+
+    def _next(self, step: int) -> Optional[int]:
+        c = self.complexity + step
+        while self.min_complexity <= c <= self.max_complexity:
+            if c not in self.unavailable:
+                return c
+            c += step
+        return None
+
+    def _start_loading(self, complexity: int) -> None:
+        self._loading = complexity
+
+        def load():
+            try:
+                pose = self.pose_factory(complexity)
+            except Exception:
+                # e.g. the model file could not be downloaded; never try it again
+                with self._lock:
+                    self.unavailable.add(complexity)
+                    self._loading = None
+                return
+            with self._lock:
+                self._candidate = pose
+                self._candidate_complexity = complexity
+
+        threading.Thread(target=load, name="pose-model-loader", daemon=True).start()
+
+    def _take_candidate(self):
+        with self._lock:
+            return self._candidate
+
+    def _handover(self, candidate, frame_rgb):
+        start = time.perf_counter()
+        results = candidate.process(frame_rgb)
+        latency = time.perf_counter() - start
+        self._handover_attempts += 1
+        if results.pose_landmarks is None and self._tracking and self._handover_attempts < self.handover_frames:
+            # New model has not picked the person up yet; keep the old track alive
+            return self.pose.process(frame_rgb)
+        old = self.pose
+        with self._lock:
+            self.pose = candidate
+            self.complexity = self._candidate_complexity
+            self._candidate = None
+            self._candidate_complexity = None
+            self._loading = None
+        old.close()
+        self._handover_attempts = 0
+        self._latencies.clear()
+        self._latencies.append(latency)
+        self._frames_since_switch = 0
+        self.switches += 1
+        return results
@@ -0,0 +1,84 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class SequenceAnalysis:
+    """Result of ``Analyzer.analyze_sequence`` over ``T`` frames.
+
+    ``signals`` holds every per-frame value the analyzer's ``measure`` returns
+    (angles, form-check flags, ``score`` for pose raters), zero/False on
+    frames without a detection. Exercise coaches also get ``phases`` (phase
+    after each frame), ``reps`` (running count after each frame),
+    ``transitions``, ``rep_frames`` (frames on which a rep was counted) and
+    ``rep_times`` (``RepCounter`` timing records of those reps).
+    """
+
+    def __init__(
+        self,
+        detected: np.ndarray,
+        timestamps: Optional[np.ndarray],
+        signals: Dict[str, np.ndarray],
+        phases: Optional[np.ndarray] = None,
+        reps: Optional[np.ndarray] = None,
+        transitions: Sequence[Tuple[int, str]] = (),
+        rep_frames: Optional[np.ndarray] = None,
+        rep_times: Sequence[Dict[str, Any]] = (),
+    ):
+        self.detected = detected
+        self.timestamps = timestamps
+        self.signals = signals
+        self.phases = phases
+        self.reps = reps
+        self.transitions = list(transitions)
+        self.rep_frames = rep_frames if rep_frames is not None else np.zeros(0, dtype=np.intp)
+        self.rep_times = list(rep_times)
+
+    def __len__(self) -> int:
+        return len(self.detected)
+
+    def rep_bounds(self) -> List[Tuple[int, int]]:
+        """``(first_frame, last_frame)`` of each rep counted in this sequence.
+
+        A rep runs from the frame after the previous rep was counted (or the
+        start of the sequence) to the frame it was counted on.
+        """
+        starts = np.concatenate([[0], self.rep_frames[:-1] + 1]) if len(self.rep_frames) else []
+        return [(int(s), int(e)) for s, e in zip(starts, self.rep_frames)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly summary: rep boundaries, phase timeline and check pass rates."""
+        frames = len(self)
+        detected = int(self.detected.sum())
+        result: Dict[str, Any] = {"frames": frames, "detected_frames": detected, "reps": None}
+
+        def when(i: int):
+            return round(float(self.timestamps[i]), 3) if self.timestamps is not None else None
+
+        if self.reps is not None:
+            result["reps"] = int(self.reps[-1]) if frames else 0
+            result["rep_bounds"] = [
+                {"start_frame": s, "end_frame": e, "start_time": when(s), "end_time": when(e)}
+                for s, e in self.rep_bounds()
+            ]
+            result["transitions"] = [{"frame": i, "time": when(i), "phase": p} for i, p in self.transitions]
+            result["rep_times"] = [rounded_rep_time(rep) for rep in self.rep_times]
+        checks = {}
+        for key, values in self.signals.items():
+            if values.dtype == bool and detected:
+                checks[key] = round(float(values[self.detected].mean()), 4)
+        result["check_ratios"] = checks
+        score = self.signals.get("score")
+        if score is not None and detected:
+            valid = score[self.detected]
+            result["score"] = {"mean": round(float(valid.mean()), 2), "max": int(valid.max()), "min": int(valid.min())}
+        return result
+
+
+def rounded_rep_time(rep: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-friendly copy of a ``RepCounter`` timing record."""
+    return {
+        key: {k: round(v, 3) for k, v in value.items()} if isinstance(value, dict)
+        else round(value, 3) if isinstance(value, float) else value
+        for key, value in rep.items()
+    }
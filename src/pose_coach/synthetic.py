@@ -0,0 +1,103 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .utils import NUM_LANDMARKS
+
+# Standing, camera-facing skeleton in a 1280x720 frame (pixel coordinates)
+_BASE_POSE = {
+    0: (640, 150), 1: (650, 138), 2: (655, 138), 3: (660, 138), 4: (630, 138),
+    5: (625, 138), 6: (620, 138), 7: (668, 146), 8: (612, 146), 9: (648, 168),
+    10: (632, 168),
+    11: (710, 230), 12: (570, 230),
+    13: (740, 330), 14: (540, 330),
+    15: (750, 420), 16: (530, 420),
+    17: (755, 440), 18: (525, 440), 19: (752, 445), 20: (528, 445), 21: (748, 435), 22: (532, 435),
+    23: (680, 420), 24: (600, 420),
+    25: (685, 540), 26: (595, 540),
+    27: (690, 660), 28: (590, 660),
+    29: (686, 675), 30: (594, 675), 31: (705, 680), 32: (575, 680),
+}
+
+_LEFT_ARM = (13, 15, 17, 19, 21)
+_RIGHT_ARM = (14, 16, 18, 20, 22)
+_LEFT_HAND = (15, 17, 19, 21)
+_RIGHT_HAND = (16, 18, 20, 22)
+_UPPER_BODY = tuple(range(0, 25))
+
+
+def base_pose() -> np.ndarray:
+    return np.array([_BASE_POSE[i] for i in range(NUM_LANDMARKS)], dtype=np.float64)
+
+
+def synthetic_stream(
+    num_frames: int,
+    period: int = 60,
+    frame_shape: Tuple[int, int, int] = (720, 1280, 3),
+    noise_px: float = 2.0,
+    dropout: float = 0.02,
+    seed: int = 0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Generate a repeating movement that sweeps every analyzer's thresholds.
+
+    The arms curl and raise, the torso hinges, the hips sink into a squat and
+    the feet leave the floor on overlapping cycles derived from ``period``, so
+    rep state machines and form checks in all analyzers get exercised. Returns ``(landmarks_px (T, 33, 2) int32,
+    visibility (T, 33) float32, detected (T,) bool)``; frames with
+    ``detected`` False should be fed to analyzers as ``None``.
+    """
+    rng = np.random.default_rng(seed)
+    h, w = frame_shape[:2]
+    t = np.arange(num_frames, dtype=np.float64)
+
+    def wave(p: float) -> np.ndarray:
+        # 0 -> 1 -> 0 every p frames
+        return 0.5 - 0.5 * np.cos(2.0 * np.pi * t / p)
+
+    curl, lift, hinge, rise = wave(period), wave(2 * period), wave(3 * period), wave(period / 2)
+
+    pts = np.repeat(base_pose()[None], num_frames, axis=0)
+    pts[..., 0] *= w / 1280.0
+    pts[..., 1] *= h / 720.0
+    scale = h / 720.0
+
+    # Arms: raise elbows to shoulder height on a slow wave, curl wrists on a fast one
+    for side, elbow, wrist, hand, arm in ((1.0, 13, 15, _LEFT_HAND, _LEFT_ARM), (-1.0, 14, 16, _RIGHT_HAND, _RIGHT_ARM)):
+        pts[:, list(arm), 1] -= (lift * 100.0 * scale)[:, None]
+        pts[:, list(arm), 0] += side * (lift * 60.0 * scale)[:, None]
+        theta = curl * np.radians(160.0)
+        forearm = 90.0 * scale
+        wrist_x = pts[:, elbow, 0] + side * forearm * np.sin(theta) * 0.3
+        wrist_y = pts[:, elbow, 1] + forearm * np.cos(theta)
+        for idx in hand:
+            pts[:, idx, 0] = wrist_x + (_BASE_POSE[idx][0] - _BASE_POSE[wrist][0]) * scale
+            pts[:, idx, 1] = wrist_y + (_BASE_POSE[idx][1] - _BASE_POSE[wrist][1]) * scale
+
+    # Hinge: rotate head, arms and shoulders forward around the hip midpoint
+    upper = list(range(0, 23))
+    pivot = (pts[:, 23] + pts[:, 24]) / 2.0
+    angle = hinge * np.radians(80.0)
+    rel = pts[:, upper] - pivot[:, None]
+    cos_a, sin_a = np.cos(angle)[:, None], np.sin(angle)[:, None]
+    pts[:, upper, 0] = pivot[:, None, 0] + cos_a * rel[..., 0] - sin_a * rel[..., 1]
+    pts[:, upper, 1] = pivot[:, None, 1] + sin_a * rel[..., 0] + cos_a * rel[..., 1]
+
+    # Squat: hips drop below knees, knees travel forward
+    pts[:, _UPPER_BODY, 1] += (curl * 150.0 * scale)[:, None]
+    pts[:, [25, 26], 0] += (curl * 90.0 * scale)[:, None]
+    # Calf raise / jump: feet leave the floor
+    pts[:, 27:, 1] -= (rise * 25.0 * scale)[:, None]
+
+    pts += rng.normal(0.0, noise_px, pts.shape)
+    visibility = np.clip(rng.normal(0.9, 0.08, (num_frames, NUM_LANDMARKS)), 0.0, 1.0).astype(np.float32)
+    detected = rng.random(num_frames) >= dropout
+    return pts.astype(np.int32), visibility, detected
+
+
+def stream_frames(landmarks_px: np.ndarray, visibility: np.ndarray, detected: Optional[np.ndarray] = None):
+    """Yield ``(landmarks_px, visibility)`` per frame with ``(None, None)`` for dropouts."""
+    for i in range(len(landmarks_px)):
+        if detected is not None and not detected[i]:
+            yield None, None
+        else:
+            yield landmarks_px[i], visibility[i]
@@ -4,6 +4,7 @@ import numpy as np
 
 try:
     import mediapipe as mp
+    from mediapipe.framework.formats import landmark_pb2
 except ImportError as exc:
     raise RuntimeError("mediapipe is required. Install via requirements.txt") from exc
 
@@ -31,9 +32,81 @@ def init_pose_estimator(
     )
 
 
-def extract_landmarks(results, frame_shape) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+NUM_LANDMARKS = 33
+
+
+class LandmarkBuffers:
+    """Preallocated per-stream arrays filled in place by ``extract_landmarks``.
+
+    ``normalized`` holds (x, y, visibility) in MediaPipe's [0, 1] image space,
+    ``points`` the sub-pixel float32 pixel coordinates and ``pixels`` the
+    truncated int32 coordinates the analyzers consume. ``visibility`` is a view
+    into ``normalized``. All arrays are overwritten on every frame, so callers
+    that need to keep a frame's landmarks must copy them.
+    """
+
+    def __init__(self, num_landmarks: int = NUM_LANDMARKS):
+        self.num_landmarks = num_landmarks
+        self.normalized = np.zeros((num_landmarks, 3), dtype=np.float32)
+        self.points = np.zeros((num_landmarks, 2), dtype=np.float32)
+        self.pixels = np.zeros((num_landmarks, 2), dtype=np.int32)
+        self.visibility = self.normalized[:, 2]
+        self._flat = self.normalized.reshape(-1)
+        # float64 scratch so truncation matches int(lm.x * w) exactly
+        self._scaled = np.zeros((num_landmarks, 2), dtype=np.float64)
+        self._scale = np.zeros(2, dtype=np.float64)
+
+    @property
+    def normalized_xy(self) -> np.ndarray:
+        return self.normalized[:, :2]
+
+    def fill(self, landmarks, frame_shape) -> None:
+        self._flat[:] = [v for lm in landmarks for v in (lm.x, lm.y, lm.visibility)]
+        self.rescale(frame_shape)
+
+    def rescale(self, frame_shape) -> None:
+        """Recompute ``points``/``pixels`` from ``normalized`` for a frame size."""
+        h, w = frame_shape[:2]
+        self._scale[0] = w
+        self._scale[1] = h
+        np.multiply(self.normalized[:, :2], self._scale, out=self._scaled)
+        np.copyto(self.points, self._scaled, casting="same_kind")
+        np.copyto(self.pixels, self._scaled, casting="unsafe")
+
+
+class LandmarkResults:
+    """Minimal stand-in for a MediaPipe result carrying only ``pose_landmarks``."""
+
+    __slots__ = ("pose_landmarks",)
+
+    def __init__(self, pose_landmarks):
+        self.pose_landmarks = pose_landmarks
+
+
+def results_from_normalized(normalized: np.ndarray) -> LandmarkResults:
+    """Wrap a (33, 3) x/y/visibility array so drawing code can treat it like ``pose.process`` output."""
+    landmark_list = landmark_pb2.NormalizedLandmarkList()
+    for x, y, v in normalized.tolist():
+        lm = landmark_list.landmark.add()
+        lm.x = x
+        lm.y = y
+        lm.visibility = v
+    return LandmarkResults(landmark_list)
+
+
+def extract_landmarks(
+    results, frame_shape, buffers: Optional[LandmarkBuffers] = None
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """Return (landmarks_px int32 (33, 2), visibility float32 (33,)) or (None, None).
+
+    With ``buffers`` the arrays returned are views into the reusable buffers
+    instead of fresh allocations.
+    """
     if not results or not results.pose_landmarks:
         return None, None
+    if buffers is not None:
+        buffers.fill(results.pose_landmarks.landmark, frame_shape)
+        return buffers.pixels, buffers.visibility
     h, w = frame_shape[:2]
     points = []
     visibility = []
@@ -42,4 +115,4 @@ def extract_landmarks(results, frame_shape) -> Tuple[Optional[np.ndarray], Optio
         y_px = int(lm.y * h)
         points.append([x_px, y_px])
         visibility.append(lm.visibility)
-    return np.array(points, dtype=np.int32), np.array(visibility, dtype=np.float32)
\ No newline at end of file
+    return np.array(points, dtype=np.int32), np.array(visibility, dtype=np.float32)
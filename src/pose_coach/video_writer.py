@@ -0,0 +1,147 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .profiling import StageHistogram
+
+# OpenCV codec per container; anything else falls back to mp4v
+FOURCC_BY_EXTENSION = {".avi": "MJPG", ".mp4": "mp4v", ".mov": "mp4v", ".mkv": "XVID"}
+
+
+class AnnotatedVideoWriter:
+    """Encodes rendered frames to a video file on a background thread.
+
+    ``write`` copies the frame into a bounded queue and returns at once; the
+    encoder thread runs ``cv2.VideoWriter.write``, which releases the GIL while
+    it encodes. When the encoder falls behind, ``policy="drop"`` evicts the
+    oldest queued frame so the live loop never waits, while ``policy="block"``
+    makes ``write`` wait for room so every frame is kept. The video size is
+    taken from the first frame. ``stats()`` reports dropped frames, time spent
+    blocked and the encoder lag, i.e. how long frames waited to be encoded.
+    """
+
+    POLICIES = ("drop", "block")
+
+    def __init__(
+        self,
+        path: str,
+        fps: float = 30.0,
+        queue_size: int = 64,
+        policy: str = "drop",
+        fourcc: Optional[str] = None,
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}")
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        self.path = path
+        self.fps = fps
+        self.queue_size = queue_size
+        self.policy = policy
+        self.fourcc = fourcc or FOURCC_BY_EXTENSION.get(os.path.splitext(path)[1].lower(), "mp4v")
+        self.frame_size: Optional[Tuple[int, int]] = None
+        self.written = 0
+        self.dropped = 0
+        self.blocked_s = 0.0
+        self.lag = StageHistogram()
+        self.encode = StageHistogram()
+        self.error: Optional[BaseException] = None
+        self._items: deque = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._encode_loop, name="video-encoder", daemon=True)
+        self._thread.start()
+
+    def write(self, frame: np.ndarray) -> None:
+        """Queue a copy of ``frame`` (BGR) for encoding."""
+        item = (time.perf_counter(), frame.copy())
+        with self._cond:
+            if self._closed:
+                raise ValueError("write() after close()")
+            if self.error is not None:
+                self.dropped += 1
+                return
+            if len(self._items) >= self.queue_size:
+                if self.policy == "drop":
+                    self._items.popleft()
+                    self.dropped += 1
+                else:
+                    t = time.perf_counter()
+                    while len(self._items) >= self.queue_size and self.error is None:
+                        self._cond.wait()
+                    self.blocked_s += time.perf_counter() - t
+                    if self.error is not None:
+                        self.dropped += 1
+                        return
+            self._items.append(item)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Encode whatever is still queued, then finalize the file."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            depth = len(self._items)
+            dropped = self.dropped
+            blocked_s = self.blocked_s
+        lag = self.lag.summary()
+        stats = {
+            "path": self.path,
+            "written": self.written,
+            "dropped": dropped,
+            "queue_depth": depth,
+            "blocked_s": round(blocked_s, 3),
+            "lag_p50_ms": round(lag["p50_us"] / 1000, 1),
+            "lag_p99_ms": round(lag["p99_us"] / 1000, 1),
+            "lag_max_ms": round(lag["max_us"] / 1000, 1),
+            "encode_mean_ms": round(self.encode.summary()["mean_us"] / 1000, 2),
+        }
+        if self.error is not None:
+            stats["error"] = str(self.error)
+        return stats
+
+    def _encode_loop(self) -> None:
+        writer = None
+        frame = None
+        try:
+            while True:
+                with self._cond:
+                    while not self._items and not self._closed:
+                        self._cond.wait()
+                    if not self._items:
+                        break
+                    queued_at, frame = self._items.popleft()
+                    # Wake a producer waiting for room under the "block" policy
+                    self._cond.notify_all()
+                if writer is None:
+                    self.frame_size = (frame.shape[1], frame.shape[0])
+                    writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, self.frame_size)
+                    if not writer.isOpened():
+                        raise RuntimeError(f"Could not open {self.path} for writing ({self.fourcc})")
+                if (frame.shape[1], frame.shape[0]) != self.frame_size:
+                    frame = cv2.resize(frame, self.frame_size)
+                t = time.perf_counter()
+                writer.write(frame)
+                done = time.perf_counter()
+                self.encode.add((done - t) * 1e6)
+                self.lag.add((done - queued_at) * 1e6)
+                self.written += 1
+                frame = None
+        except BaseException as exc:  # surfaced through stats() and the dropped count
+            self.error = exc
+            with self._cond:
+                self.dropped += len(self._items) + (frame is not None)
+                self._items.clear()
+                self._cond.notify_all()
+        finally:
+            if writer is not None:
+                writer.release()
@@ -1,71 +1,17 @@
 import argparse
+import threading
 import time
-from typing import Optional
+from typing import Dict, Optional
 
-import cv2
 import gradio as gr
 import numpy as np
 
-from ..pose_coach.utils import init_pose_estimator, extract_landmarks
-from ..pose_coach.drawing import draw_landmarks_and_info
-from ..pose_coach.exercises.bicep_curl import BicepCurlCoach
-from ..pose_coach.exercises.barbell_row import BarbellRowCoach
-from ..pose_coach.exercises.squats import SquatCoach
-from ..pose_coach.exercises.lunges import LungeCoach
-from ..pose_coach.exercises.rdl import RDLCoach
-from ..pose_coach.exercises.leg_press import LegPressCoach
-from ..pose_coach.exercises.calf_raises import CalfRaiseCoach
-from ..pose_coach.exercises.pushups import PushupCoach
-from ..pose_coach.exercises.pull_downs import PullDownCoach
-from ..pose_coach.exercises.bench_press import BenchPressCoach
-from ..pose_coach.exercises.bent_over_rows import BentOverRowCoach
-from ..pose_coach.exercises.lateral_raises import LateralRaiseCoach
-from ..pose_coach.exercises.deadlift import DeadliftCoach
-from ..pose_coach.exercises.box_jumps import BoxJumpCoach
-from ..pose_coach.exercises.cable_woodchoppers import CableWoodchopperCoach
-from ..pose_coach.poses.double_biceps import DoubleBicepsRater
-from ..pose_coach.poses.arnold_pose import ArnoldPoseRater
-from ..pose_coach.poses.quarter_turns import QuarterTurnsRater
-from ..pose_coach.poses.front_lat_spread import FrontLatSpreadRater
-from ..pose_coach.poses.back_lat_spread import RearLatSpreadRater
-from ..pose_coach.poses.side_chest import SideChestRater
-from ..pose_coach.poses.side_triceps import SideTricepsRater
-from ..pose_coach.poses.ab_thigh import AbdominalsAndThighsRater
-from ..pose_coach.poses.most_muscular import MostMuscularRater
-from ..pose_coach.poses.vacuum import VacuumPoseRater
-from ..pose_coach.poses.moon_pose import MoonPoseRater
-
-
-EXERCISES = [
-    ("bicep_curl", BicepCurlCoach),
-    ("barbell_row", BarbellRowCoach),
-    ("squat", SquatCoach),
-    ("lunge", LungeCoach),
-    ("rdl", RDLCoach),
-    ("leg_press", LegPressCoach),
-    ("calf_raise", CalfRaiseCoach),
-    ("pushup", PushupCoach),
-    ("pull_down", PullDownCoach),
-    ("bench_press", BenchPressCoach),
-    ("bent_over_row", BentOverRowCoach),
-    ("lateral_raise", LateralRaiseCoach),
-    ("deadlift", DeadliftCoach),
-    ("box_jump", BoxJumpCoach),
-    ("cable_woodchopper", CableWoodchopperCoach),
-]
-POSES = [
-    ("double_biceps", DoubleBicepsRater),
-    ("arnold", ArnoldPoseRater),
-    ("quarter_turns", QuarterTurnsRater),
-    ("front_lat_spread", FrontLatSpreadRater),
-    ("rear_lat_spread", RearLatSpreadRater),
-    ("side_chest", SideChestRater),
-    ("side_triceps", SideTricepsRater),
-    ("ab_thigh", AbdominalsAndThighsRater),
-    ("most_muscular", MostMuscularRater),
-    ("vacuum", VacuumPoseRater),
-    ("moon_pose", MoonPoseRater),
-]
+from ..pose_coach.utils import LandmarkBuffers, init_pose_estimator, extract_landmarks
+from ..pose_coach.drawing import OverlayRenderer
+from ..pose_coach.estimator_pool import EstimatorPool
+from ..pose_coach.pipeline import InferenceResizer, LatestFrameSlot, parse_inference_size
+from ..pose_coach.profiling import StageTimer, format_stage_summary
+from ..pose_coach.registry import EXERCISES, POSES
 
 
 def build_analyzer(mode: str, name: str):
@@ -79,53 +25,158 @@ def build_analyzer(mode: str, name: str):
     return cls()
 
 
-def app():
+INFERENCE_SIZES = ["full", "720", "480", "360"]
+
+
+def build_estimator():
+    return init_pose_estimator(
+        static_image_mode=False,
+        model_complexity=1,
+        smooth_landmarks=True,
+        enable_segmentation=False,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5,
+    )
+
+
+def app(timer: Optional[StageTimer] = None, inference_size: str = "full", pool: Optional[EstimatorPool] = None):
+    timer = timer if timer is not None else StageTimer(enabled=False)
+    pool = pool if pool is not None else EstimatorPool(build_estimator)
+
     with gr.Blocks(title="Pose Coach") as demo:
         gr.Markdown("## Ai-Gym-Trainer")
         with gr.Row():
             mode = gr.Dropdown(["exercise", "pose"], value="exercise", label="Mode")
             exercise = gr.Dropdown([name for name, _ in EXERCISES], value="bicep_curl", label="Exercise")
             pose = gr.Dropdown([name for name, _ in POSES], value="double_biceps", label="Pose")
+            size = gr.Dropdown(INFERENCE_SIZES, value=inference_size, label="Inference size")
         cam = gr.Video(streaming=True, label="Webcam", height=480)
         out = gr.Image(label="Output", type="numpy")
 
-        state = gr.State({"analyzer": None, "pose": None})
+        state = gr.State({"analyzer": None, "buffers": None, "resizer": None, "renderer": None})
 
         def init(mode_val, ex_val, pose_val):
             analyzer = build_analyzer(mode_val, ex_val if mode_val == "exercise" else pose_val)
-            pose_model = init_pose_estimator(
-                static_image_mode=False,
-                model_complexity=1,
-                smooth_landmarks=True,
-                enable_segmentation=False,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5,
-            )
-            return {"analyzer": analyzer, "pose": pose_model}
-
-        def process_frame(frame, mode_val, ex_val, pose_val, st):
+            return {
+                "analyzer": analyzer,
+                "buffers": LandmarkBuffers(),
+                "resizer": None,
+                "renderer": OverlayRenderer(color_order="rgb"),
+            }
+
+        slots: Dict[str, LatestFrameSlot] = {}
+        slots_lock = threading.Lock()
+
+        def session_slot(session_id: str) -> LatestFrameSlot:
+            with slots_lock:
+                slot = slots.get(session_id)
+                if slot is None:
+                    slot = slots[session_id] = LatestFrameSlot()
+                return slot
+
+        def process_frame(frame, mode_val, ex_val, pose_val, size_val, st, request: gr.Request):
             if frame is None:
                 return None, st
+            slot = session_slot(request.session_hash)
+            # While this session's frame is in flight, newer frames only replace
+            # each other and return at once, leaving the output to the running call
+            return slot.serve(
+                frame,
+                lambda newest: infer_frame(newest, mode_val, ex_val, pose_val, size_val, st, slot, request.session_hash),
+                default=(gr.update(), st),
+            )
+
+        def infer_frame(frame, mode_val, ex_val, pose_val, size_val, st, slot, session_id):
             if st.get("analyzer") is None:
-                st = init(mode_val, ex_val, pose_val)
+                # In place, so overlapping calls of the same session share one state
+                st.update(init(mode_val, ex_val, pose_val))
             analyzer = st["analyzer"]
-            pose_model = st["pose"]
-
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            results = pose_model.process(frame)
-            landmarks_px, visibility = extract_landmarks(results, frame_bgr.shape)
-            overlay = analyzer.update(landmarks_px, visibility, frame_bgr.shape)
-            out_img = draw_landmarks_and_info(frame_bgr, results, overlay, fps=0.0)
-            return cv2.cvtColor(out_img, cv2.COLOR_BGR2RGB), st
-
-        cam.change(process_frame, inputs=[cam, mode, exercise, pose, state], outputs=[out, state])
+            # Never blocks: a session over the limit keeps its queue place and retries next frame
+            pose_model = pool.checkout(session_id, timeout=0.0)
+            if pose_model is None:
+                ahead = pool.queue_position(session_id)
+                waiting = [f"All coaches busy - waiting ({ahead} ahead)"]
+                return st["renderer"].render(frame, None, None, waiting, fps=0.0, in_place=frame.flags.writeable), st
+            target = parse_inference_size(size_val)
+            resizer = st.get("resizer")
+            if resizer is None or resizer.size != target:
+                resizer = st["resizer"] = InferenceResizer(target)
+
+            # Browser frames are RGB end to end: MediaPipe reads them as-is and
+            # the renderer draws RGB colors, so no cvtColor pass is needed
+            t = timer.now()
+            frame_in = resizer.prepare(frame)
+            t = timer.record("prepare_frame", t)
+            results = pose_model.process(frame_in)
+            t = timer.record("pose_process", t)
+            landmarks_px, visibility = extract_landmarks(results, frame.shape, st["buffers"])
+            t = timer.record("extract_landmarks", t)
+            overlay = analyzer.update(landmarks_px, visibility, frame.shape)
+            t = timer.record("analyzer_update", t)
+            overlay = list(overlay or []) + [f"Dropped frames: {slot.dropped}"]
+            out_img = st["renderer"].render(frame, landmarks_px, visibility, overlay, fps=0.0, in_place=frame.flags.writeable)
+            timer.record("draw", t)
+            timer.maybe_dump()
+            return out_img, st
+
+        cam.change(
+            process_frame,
+            inputs=[cam, mode, exercise, pose, size, state],
+            outputs=[out, state],
+            concurrency_limit=pool.max_size,
+            trigger_mode="always_last",
+        )
         mode.change(lambda m: None, inputs=mode, outputs=None)
         exercise.change(lambda e: None, inputs=exercise, outputs=None)
         pose.change(lambda p: None, inputs=pose, outputs=None)
 
+        def release(request: gr.Request):
+            pool.checkin(request.session_hash)
+            with slots_lock:
+                slots.pop(request.session_hash, None)
+
+        demo.unload(release)
+
     return demo
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pose Coach web UI")
+    parser.add_argument("--inference-size", choices=INFERENCE_SIZES, default="full", help="Default inference height for new sessions")
+    parser.add_argument("--max-estimators", type=int, default=4, help="Most MediaPipe estimators shared by all sessions")
+    parser.add_argument("--prewarm", type=int, default=1, help="Estimators loaded before the first visitor arrives")
+    parser.add_argument("--idle-timeout", type=float, default=30.0, help="Seconds without frames before a session's estimator is reclaimed")
+    parser.add_argument("--profile", action="store_true", help="Time every frame stage and print latency histograms on exit")
+    parser.add_argument("--profile-out", metavar="PATH", help="Periodically dump stage latencies to PATH (.json or .csv)")
+    parser.add_argument("--profile-interval", type=float, default=10.0, help="Seconds between --profile-out dumps")
+    parser.add_argument("--chrome-trace", metavar="PATH", help="Write the most recent stage spans as a Chrome trace on exit")
+    parser.add_argument("--trace-events", type=int, default=100000, help="Spans kept for --chrome-trace")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    demo = app()
-    demo.launch()
\ No newline at end of file
+    args = parse_args()
+    timer = StageTimer(
+        enabled=bool(args.profile or args.profile_out or args.chrome_trace),
+        trace_events=args.trace_events if args.chrome_trace else 0,
+    )
+    if args.profile_out:
+        timer.dump_every(args.profile_out, args.profile_interval)
+    pool = EstimatorPool(
+        build_estimator,
+        max_size=args.max_estimators,
+        prewarm=args.prewarm,
+        idle_timeout_s=args.idle_timeout,
+    )
+    demo = app(timer, inference_size=args.inference_size, pool=pool)
+    try:
+        demo.launch()
+    finally:
+        print("Estimator pool:", pool.stats())
+        pool.close()
+        if timer.enabled:
+            timer.close()
+            if args.chrome_trace:
+                timer.write_chrome_trace(args.chrome_trace)
+            for line in format_stage_summary(timer.summary()):
+                print(line)
\ No newline at end of file
@@ -0,0 +1,94 @@
+import argparse
+import json
+
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+
+from ..pose_coach.ingest import IngestService
+
+
+class OpenSession(BaseModel):
+    mode: str
+    name: str
+
+
+def create_app(service: IngestService) -> FastAPI:
+    api = FastAPI(title="Pose Coach landmark ingest")
+
+    @api.post("/sessions")
+    def open_session(req: OpenSession):
+        try:
+            return {"session_id": service.open(req.mode, req.name)}
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        except RuntimeError as exc:
+            raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+    @api.post("/sessions/{session_id}/frames")
+    def feed(session_id: str, batch: dict):
+        try:
+            return {"results": service.feed(session_id, batch)}
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail="Unknown session") from exc
+        except (ValueError, TypeError) as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    @api.delete("/sessions/{session_id}")
+    def close_session(session_id: str):
+        try:
+            return service.close(session_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail="Unknown session") from exc
+
+    @api.get("/stats")
+    def stats():
+        return service.stats()
+
+    @api.websocket("/ws/{mode}/{name}")
+    async def stream(websocket: WebSocket, mode: str, name: str):
+        """One session per connection: each text message is a batch, each reply its results."""
+        await websocket.accept()
+        try:
+            session_id = service.open(mode, name)
+        except (ValueError, RuntimeError) as exc:
+            await websocket.close(code=1008, reason=str(exc))
+            return
+        try:
+            while True:
+                message = await websocket.receive_text()
+                try:
+                    # Analyzer work runs off the event loop so one busy athlete can't stall other connections
+                    reply = {"results": await run_in_threadpool(service.feed, session_id, json.loads(message))}
+                except KeyError:
+                    await websocket.close(code=1008, reason="Session expired")
+                    return
+                except (ValueError, TypeError) as exc:
+                    reply = {"error": str(exc)}
+                await websocket.send_json(reply)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            try:
+                service.close(session_id)
+            except KeyError:
+                pass
+
+    return api
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pose Coach: analyze landmarks estimated on the client")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-sessions", type=int, default=1000)
+    parser.add_argument("--idle-timeout", type=float, default=300.0, help="Seconds before an idle session is dropped")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    args = parse_args()
+    service = IngestService(max_sessions=args.max_sessions, idle_timeout_s=args.idle_timeout)
+    uvicorn.run(create_app(service), host=args.host, port=args.port)
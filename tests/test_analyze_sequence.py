@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from src.pose_coach.registry import EXERCISES, POSES
+from src.pose_coach.synthetic import synthetic_stream
+
+ANALYZERS = EXERCISES + POSES
+SHAPE = (720, 1280, 3)
+
+
+def _stream(kind):
+    landmarks, visibility, detected = synthetic_stream(600, frame_shape=SHAPE, dropout=0.1)
+    if kind == "absent":
+        detected = np.zeros_like(detected)
+    elif kind == "gap":
+        detected = detected.copy()
+        detected[200:320] = False
+    return landmarks, visibility, detected, np.arange(len(landmarks)) / 30.0
+
+
+@pytest.mark.parametrize("name,cls", ANALYZERS)
+@pytest.mark.parametrize("frames", [0, 5])
+def test_no_detections(name, cls, frames):
+    landmarks = np.zeros((frames, 33, 2))
+    result = cls().analyze_sequence(landmarks, np.zeros((frames, 33)), frame_shape=SHAPE, detected=np.zeros(frames, bool))
+    if cls.CHECKS:
+        assert result.signals["faults"].tolist() == [0] * frames
+    result.to_dict()
+
+
+@pytest.mark.parametrize("name,cls", ANALYZERS)
+@pytest.mark.parametrize("kind", ["dropout", "gap", "absent"])
+def test_sequence_matches_update(name, cls, kind):
+    landmarks, visibility, detected, timestamps = _stream(kind)
+    streamed = cls()
+    now = [0.0]
+    streamed.clock = lambda: now[0]
+    faults, phases, reps = [], [], []
+    for i in range(len(landmarks)):
+        now[0] = float(timestamps[i])
+        if detected[i]:
+            feedback = streamed.update(landmarks[i], visibility[i], SHAPE)
+        else:
+            feedback = streamed.update(None, None, SHAPE)
+        faults.append(feedback.faults)
+        if streamed.TRANSITIONS:
+            phases.append(streamed.state)
+            reps.append(streamed.reps)
+
+    # Two chunks, so the counter also has to carry its state across calls
+    batched = cls()
+    results = [
+        batched.analyze_sequence(landmarks[idx], visibility[idx], timestamps[idx], frame_shape=SHAPE, detected=detected[idx])
+        for idx in np.array_split(np.arange(len(landmarks)), 2)
+    ]
+    if cls.CHECKS:
+        assert np.concatenate([r.signals["faults"] for r in results]).tolist() == faults
+    if cls.TRANSITIONS:
+        assert [p for r in results for p in r.phases] == phases
+        assert [int(v) for r in results for v in r.reps] == reps
+        assert [t for r in results for t in r.rep_times] == streamed.counter.rep_times
+        assert batched.counter.dwell == streamed.counter.dwell
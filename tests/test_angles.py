@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from src.pose_coach.angles import (
+    angle_at_point,
+    angle_between_vectors,
+    angle_of_vector,
+    angles_at_points,
+    angles_between_vectors,
+    angles_of_vectors,
+    horizontal_angle,
+    horizontal_angles,
+    joint_angles,
+)
+
+
+# Integer pixels like the analyzers see, with some repeated points for the zero-length case
+POINTS = np.random.default_rng(3).integers(0, 1280, (3, 200, 2)).astype(np.int32)
+POINTS[1, :5] = POINTS[0, :5]
+
+
+def test_angles_at_points_match_the_scalar_version():
+    a, b, c = POINTS
+    expected = [angle_at_point(a[i], b[i], c[i]) for i in range(len(a))]
+    np.testing.assert_allclose(angles_at_points(a, b, c), expected, atol=1e-9)
+
+
+def test_vector_kernels_match_the_scalar_versions():
+    v1, v2 = POINTS[0] - 640, POINTS[1] - 640
+    np.testing.assert_allclose(angles_between_vectors(v1, v2), [angle_between_vectors(x, y) for x, y in zip(v1, v2)], atol=1e-9)
+    np.testing.assert_allclose(angles_of_vectors(v1), [angle_of_vector(x) for x in v1], atol=1e-9)
+    np.testing.assert_allclose(horizontal_angles(v1, v2), [horizontal_angle(x, y) for x, y in zip(v1, v2)], atol=1e-9)
+
+
+@pytest.mark.parametrize("a, b, c, expected", [
+    ((700, 400), (600, 400), (600, 500), 90.0),
+    ((700, 400), (600, 400), (800, 400), 0.0),
+    ((700, 400), (600, 400), (300, 400), 180.0),
+    ((700, 500), (600, 400), (600, 500), 45.0),
+])
+def test_known_angles(a, b, c, expected):
+    assert angles_at_points(np.array(a), np.array(b), np.array(c)) == pytest.approx(expected, abs=0.01)
+
+
+def test_arguments_broadcast():
+    # One fixed vertex against a sequence of points
+    a, b, c = POINTS[0], np.array([640, 360]), POINTS[2]
+    assert angles_at_points(a, b, c).shape == (200,)
+    np.testing.assert_allclose(angles_at_points(a, b, c), [angle_at_point(a[i], b, c[i]) for i in range(200)], atol=1e-9)
+
+
+def test_joint_angles_for_frames_and_sequences():
+    landmarks = np.random.default_rng(4).integers(0, 720, (10, 33, 2)).astype(np.int32)
+    triples = [(11, 13, 15), (12, 14, 16), (23, 25, 27)]
+    sequence = joint_angles(landmarks, triples)
+    assert sequence.shape == (10, 3)
+    for t in range(10):
+        np.testing.assert_allclose(joint_angles(landmarks[t], triples), sequence[t])
+        for k, (i, j, m) in enumerate(triples):
+            assert sequence[t, k] == pytest.approx(angle_at_point(landmarks[t, i], landmarks[t, j], landmarks[t, m]), abs=1e-9)
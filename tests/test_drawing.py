@@ -0,0 +1,85 @@
+import cv2
+import numpy as np
+import pytest
+
+from src.pose_coach.drawing import LINE_HEIGHT, TEXT_COLOR, TEXT_ORIGIN, OverlayRenderer, draw_landmarks_and_info
+from src.pose_coach.synthetic import synthetic_stream
+from src.pose_coach.utils import results_from_normalized
+
+SHAPE = (480, 640, 3)
+
+
+def _frame(seed=0):
+    return np.random.default_rng(seed).integers(0, 256, SHAPE, dtype=np.uint8)
+
+
+def _landmarks():
+    landmarks, _, _ = synthetic_stream(1, frame_shape=SHAPE, dropout=0.0)
+    return landmarks[0], np.ones(33, np.float32)
+
+
+def test_render_copies_unless_in_place():
+    renderer = OverlayRenderer()
+    frame = _frame()
+    original = frame.copy()
+    landmarks_px, visibility = _landmarks()
+    output = renderer.render(frame, landmarks_px, visibility, ["Reps: 3"], fps=30.0)
+    assert output is not frame
+    np.testing.assert_array_equal(frame, original)
+    assert renderer.render(frame, landmarks_px, visibility, ["Reps: 3"], fps=30.0, in_place=True) is frame
+    np.testing.assert_array_equal(frame, output)
+
+
+def test_cached_lines_look_like_put_text():
+    renderer = OverlayRenderer()
+    lines = ["Reps: 3", "Go deeper"]
+    cached = np.full(SHAPE, 40, np.uint8)
+    renderer.draw_lines(cached, lines)
+    expected = np.full(SHAPE, 40, np.uint8)
+    for i, line in enumerate(lines):
+        origin = (TEXT_ORIGIN[0], TEXT_ORIGIN[1] + i * LINE_HEIGHT)
+        cv2.putText(expected, line, origin, cv2.FONT_HERSHEY_SIMPLEX, 0.7, TEXT_COLOR, 2, cv2.LINE_AA)
+    # Blending the cached coverage mask differs from putText by rounding only
+    assert np.abs(cached.astype(int) - expected).max() <= 4
+
+
+def test_line_cache_is_bounded_lru():
+    renderer = OverlayRenderer(cache_size=2)
+    image = np.zeros(SHAPE, np.uint8)
+    renderer.draw_lines(image, ["a"])
+    first = renderer._line("a", TEXT_ORIGIN[1])
+    renderer.draw_lines(image, ["b"])
+    renderer.draw_lines(image, ["a"])
+    renderer.draw_lines(image, ["c"])
+    assert [text for text, _ in renderer._lines] == ["a", "c"]
+    assert renderer._line("a", TEXT_ORIGIN[1]) is first
+
+
+def test_hidden_landmarks_are_not_drawn():
+    renderer = OverlayRenderer()
+    frame = _frame()
+    landmarks_px, _ = _landmarks()
+    bare = renderer.render(frame, None, None, None, fps=0.0)
+    assert (renderer.render(frame, landmarks_px, np.zeros(33, np.float32), None, fps=0.0) == bare).all()
+    off_frame = np.full((33, 2), -50, np.int32)
+    assert (renderer.render(frame, off_frame, None, None, fps=0.0) == bare).all()
+    assert (renderer.render(frame, landmarks_px, np.ones(33, np.float32), None, fps=0.0) != bare).any()
+
+
+def test_compatibility_wrapper_matches_the_renderer():
+    landmarks_px, visibility = _landmarks()
+    normalized = np.column_stack([(landmarks_px + 0.5) / (SHAPE[1], SHAPE[0]), visibility]).astype(np.float32)
+    frame = _frame()
+    output = draw_landmarks_and_info(frame, results_from_normalized(normalized), ["Reps: 3"], 30.0)
+    assert output is not frame
+    np.testing.assert_array_equal(output, OverlayRenderer().render(frame, landmarks_px, visibility, ["Reps: 3"], fps=30.0))
+
+
+def test_rgb_renderer_draws_the_same_colors():
+    landmarks_px, visibility = _landmarks()
+    frame = _frame()
+    bgr = OverlayRenderer().render(frame, landmarks_px, visibility, ["Reps: 3"], fps=12.0)
+    rgb = OverlayRenderer(color_order="rgb").render(np.ascontiguousarray(frame[..., ::-1]), landmarks_px, visibility, ["Reps: 3"], fps=12.0)
+    np.testing.assert_array_equal(rgb, bgr[..., ::-1])
+    with pytest.raises(ValueError):
+        OverlayRenderer(color_order="hsv")
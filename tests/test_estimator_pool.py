@@ -0,0 +1,103 @@
+import threading
+import time
+
+import pytest
+
+from src.pose_coach.estimator_pool import EstimatorPool
+
+
+class FakeEstimator:
+    def __init__(self, number):
+        self.number = number
+        self.resets = 0
+        self.closed = False
+
+    def reset(self):
+        self.resets += 1
+
+    def close(self):
+        self.closed = True
+
+
+def _pool(**kwargs):
+    made = []
+
+    def factory():
+        made.append(FakeEstimator(len(made)))
+        return made[-1]
+
+    return EstimatorPool(factory, **kwargs), made
+
+
+def test_sessions_keep_their_estimator():
+    pool, made = _pool(max_size=2, prewarm=1)
+    assert len(made) == 1
+    a = pool.checkout("a")
+    b = pool.checkout("b")
+    assert a is not b
+    assert pool.checkout("a") is a and pool.checkout("b") is b
+    assert pool.stats() == {"estimators": 2, "idle": 0, "pinned": 2, "waiting": 0, "evictions": 0}
+
+
+def test_sessions_over_the_limit_wait_in_order():
+    pool, made = _pool(max_size=1, prewarm=0)
+    a = pool.checkout("a")
+    assert pool.checkout("b", timeout=0.0) is None
+    assert pool.checkout("c", timeout=0.0) is None
+    assert (pool.queue_position("b"), pool.queue_position("c"), pool.queue_position("a")) == (0, 1, -1)
+
+    pool.checkin("a")
+    # "c" can't jump the queue, even with an estimator free
+    assert pool.checkout("c", timeout=0.0) is None
+    b = pool.checkout("b", timeout=0.0)
+    assert b is a and b.resets == 1
+    assert pool.queue_position("c") == 0
+    assert len(made) == 1
+
+
+def test_checkout_waits_for_a_checkin():
+    pool, _ = _pool(max_size=1, prewarm=1)
+    a = pool.checkout("a")
+    threading.Timer(0.05, pool.checkin, args=("a",)).start()
+    started = time.monotonic()
+    assert pool.checkout("b", timeout=5.0) is a
+    assert time.monotonic() - started < 1.0
+
+
+def test_idle_sessions_are_evicted():
+    pool, made = _pool(max_size=1, prewarm=1, idle_timeout_s=0.05)
+    a = pool.checkout("a")
+    time.sleep(0.1)
+    assert pool.checkout("b", timeout=0.0) is a
+    assert a.resets == 2  # once on first checkout, again after the eviction
+    assert pool.stats()["evictions"] == 1
+    # The evicted session queues like a new one
+    assert pool.checkout("a", timeout=0.0) is None
+    assert pool.queue_position("a") == 0
+    assert len(made) == 1
+
+
+def test_failed_factory_frees_its_slot():
+    calls = []
+
+    def factory():
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError("model download failed")
+        return FakeEstimator(len(calls))
+
+    pool = EstimatorPool(factory, max_size=1, prewarm=0)
+    with pytest.raises(RuntimeError):
+        pool.checkout("a")
+    assert pool.stats()["estimators"] == 0
+    assert pool.checkout("a", timeout=0.0) is not None
+
+
+def test_close_closes_every_estimator():
+    pool, made = _pool(max_size=3, prewarm=2)
+    pool.checkout("a")
+    pool.checkout("b")
+    pool.checkout("c")
+    pool.checkin("c")
+    pool.close()
+    assert len(made) == 3 and all(e.closed for e in made)
@@ -0,0 +1,130 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from src.pose_coach.events import FeedbackEvents, JsonlWriter
+from src.pose_coach.exercises.squats import SquatCoach
+from src.pose_coach.ingest import IngestService
+from src.pose_coach.synthetic import synthetic_stream
+
+SHAPE = (720, 1280, 3)
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _read(path):
+    return [json.loads(line) for line in Path(path).read_text().splitlines()]
+
+
+def _batch(frames, seed=0):
+    landmarks, visibility, detected = synthetic_stream(frames, frame_shape=SHAPE, seed=seed)
+    points = (landmarks + 0.5) / np.array([SHAPE[1], SHAPE[0]])
+    return {
+        "frame_shape": list(SHAPE[:2]),
+        "frames": [
+            {"timestamp": i / 30, "landmarks": np.column_stack([p, v]).tolist() if d else None}
+            for i, (p, v, d) in enumerate(zip(points, visibility, detected))
+        ],
+    }
+
+
+def test_writer_drains_every_event_on_close(tmp_path):
+    path = tmp_path / "events.jsonl"
+    writer = JsonlWriter(str(path))
+    for i in range(1000):
+        writer.write({"event": "tick", "frame": i})
+    writer.close()
+    assert [e["frame"] for e in _read(path)] == list(range(1000))
+    assert (writer.written, writer.dropped, writer.error) == (1000, 0, None)
+
+
+def test_writer_keeps_draining_after_the_reader_goes_away(tmp_path):
+    writer = JsonlWriter(str(tmp_path / "events.jsonl"))
+    # Writes now fail the way they do on a closed pipe
+    writer._file.close()
+    for i in range(10):
+        writer.write({"event": "tick", "frame": i})
+    writer.close()
+    assert (writer.written, writer.dropped) == (0, 10)
+    assert isinstance(writer.error, ValueError)
+
+
+def test_events_follow_the_feedback(tmp_path):
+    landmarks, visibility, detected = synthetic_stream(300, frame_shape=SHAPE)
+    writer = JsonlWriter(str(tmp_path / "events.jsonl"))
+    coach = SquatCoach()
+    events = FeedbackEvents(writer, coach, clock=lambda: 0.0, person=7)
+    phases = []
+    for i in range(len(landmarks)):
+        px, vis = (landmarks[i], visibility[i]) if detected[i] else (None, None)
+        feedback = coach.update(px, vis, SHAPE)
+        events.observe(feedback)
+        phases.append(feedback.phase)
+    writer.close()
+
+    stream = _read(tmp_path / "events.jsonl")
+    assert len(stream) == events.events == writer.written
+    assert all(e["person"] == 7 and e["time"] == 0.0 for e in stream)
+    assert [e["frame"] for e in stream] == sorted(e["frame"] for e in stream)
+    assert stream[0] == {"event": "person", "frame": 0, "time": 0.0, "person": 7, "detected": True}
+
+    reps = [e for e in stream if e["event"] == "rep"]
+    assert [e["reps"] for e in reps] == list(range(1, coach.counter.reps + 1))
+    assert coach.counter.reps > 1
+    assert all(e["time_under_tension"] > 0 for e in reps)
+    # One phase event per change, in order
+    changes = [p for i, p in enumerate(phases) if p is not None and (i == 0 or p != phases[i - 1])]
+    assert [e["phase"] for e in stream if e["event"] == "phase"] == changes
+    for e in stream:
+        if e["event"] == "faults":
+            assert set(e["raised"]) <= set(e["faults"])
+            assert not set(e["cleared"]) & set(e["faults"])
+    assert (events.frames, events.detected_frames) == (len(landmarks), int(detected.sum()))
+
+
+def test_ingest_sessions_tag_events_with_their_source(tmp_path):
+    writer = JsonlWriter(str(tmp_path / "events.jsonl"))
+    service = IngestService()
+    sessions = {}
+    for source in ("0", "rtsp://cam2"):
+        coach = SquatCoach()
+        sessions[source] = service.open("exercise", "squat", coach, FeedbackEvents(writer, coach, source=source))
+    for seed, (source, session_id) in enumerate(sessions.items()):
+        service.feed(session_id, _batch(200, seed=seed))
+    writer.close()
+
+    stream = _read(tmp_path / "events.jsonl")
+    for source in sessions:
+        own = [e for e in stream if e["source"] == source]
+        assert own[0]["event"] == "person"
+        assert any(e["event"] == "rep" for e in own)
+    assert {e["source"] for e in stream} == set(sessions)
+
+
+def test_multi_camera_headless_run_streams_tagged_events(tmp_path):
+    pytest.importorskip("mediapipe")
+    clips = [str(tmp_path / f"cam{i}.avi") for i in range(2)]
+    for clip in clips:
+        video = cv2.VideoWriter(clip, cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (320, 240))
+        for _ in range(10):
+            video.write(np.zeros((240, 320, 3), dtype=np.uint8))
+        video.release()
+    events = tmp_path / "events.jsonl"
+
+    subprocess.run(
+        [sys.executable, "-m", "src.main", "--mode", "exercise", "--exercise", "squat",
+         "--camera-index", *clips, "--headless", "--events", str(events)],
+        cwd=ROOT, check=True, capture_output=True, timeout=120,
+    )
+
+    stream = _read(events)
+    # Nobody is in the blank clips: each source reports that and its starting phase
+    for clip in clips:
+        own = [e for e in stream if e["source"] == clip]
+        assert [e["event"] for e in own] == ["person", "phase"]
+        assert own[0]["detected"] is False
+    assert len(stream) == 2 * len(clips)
@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.pose_coach.ingest import IngestService
+from src.pose_coach.synthetic import synthetic_stream
+
+SHAPE = (720, 1280)
+
+
+def _normalized(count=1):
+    landmarks, visibility, _ = synthetic_stream(count, frame_shape=SHAPE + (3,), dropout=0.0)
+    points = (landmarks + 0.5) / np.array([SHAPE[1], SHAPE[0]])
+    return [np.column_stack([p, v]).tolist() for p, v in zip(points, visibility)]
+
+
+def test_feed_runs_the_analyzer():
+    service = IngestService()
+    session_id = service.open("exercise", "squat")
+    frames = [{"timestamp": i / 30, "landmarks": marks} for i, marks in enumerate(_normalized(3))]
+    results = service.feed(session_id, {"frame_shape": list(SHAPE), "frames": frames + [{"landmarks": None}]})
+    assert [r["detected"] for r in results] == [True, True, True, False]
+    assert service.close(session_id)["frames"] == 4
+
+
+@pytest.mark.parametrize("batch", [
+    [1, 2],
+    "x",
+    {"frames": "nope"},
+    {"frame_shape": ["a", 2], "frames": []},
+    {"frame_shape": [0, 640], "frames": []},
+    {"frames": [{"timestamp": "soon", "landmarks": None}]},
+    {"frames": [{"timestamp": float("nan"), "landmarks": None}]},
+    {"frames": [{"landmarks": [[0.5, 0.5, 1.0]] * 32}]},
+    {"frames": [{"landmarks": [["x", 0.5, 1.0]] * 33}]},
+    {"frames": [{"landmarks": [[float("nan"), 0.5, 1.0]] * 33}]},
+    {"frames": [{"landmarks": [[50.0, 0.5, 1.0]] * 33}]},
+    {"frames": [{"landmarks": [[0.5, 0.5, 1.5]] * 33}]},
+])
+def test_malformed_batch_is_rejected_before_analysis(batch):
+    service = IngestService()
+    session_id = service.open("exercise", "squat")
+    good = {"landmarks": _normalized()[0]}
+    if isinstance(batch, dict) and isinstance(batch.get("frames"), list):
+        # A valid frame ahead of the bad one must not reach the analyzer either
+        batch = dict(batch, frames=[good] + batch["frames"])
+    with pytest.raises(ValueError):
+        service.feed(session_id, batch)
+    assert service.close(session_id)["frames"] == 0
+
+
+def test_websocket_survives_bad_messages():
+    testclient = pytest.importorskip("fastapi.testclient")
+    from src.web.ingest import create_app
+
+    service = IngestService()
+    client = testclient.TestClient(create_app(service))
+    with client.websocket_connect("/ws/exercise/squat") as ws:
+        for message in ("[1, 2]", '"x"', "{not json", json.dumps({"frames": [{"landmarks": [[1e9, 0, 0]] * 33}]})):
+            ws.send_text(message)
+            assert "error" in ws.receive_json()
+        ws.send_text(json.dumps({"frames": [{"landmarks": _normalized()[0]}]}))
+        assert ws.receive_json()["results"][0]["detected"] is True
@@ -0,0 +1,96 @@
+import numpy as np
+
+from src.pose_coach.exercises.squats import SquatCoach
+from src.pose_coach.multi_person import MultiPersonCoach, PoseTracker
+from src.pose_coach.synthetic import synthetic_stream
+
+# Two 1280x720 views side by side, so each athlete keeps the synthetic stream's geometry
+SHAPE = (720, 2560, 3)
+
+
+def _person(x, y=0.5, spread=0.05):
+    pose = np.empty((33, 3), np.float32)
+    pose[:, 0] = x + np.linspace(-spread, spread, 33)
+    pose[:, 1] = y + np.linspace(-2 * spread, 2 * spread, 33)
+    pose[:, 2] = 0.9
+    return pose
+
+
+def _ids(matches, count):
+    by_pose = {pi: track_id for track_id, pi in matches}
+    return [by_pose[pi] for pi in range(count)]
+
+
+def test_ids_follow_people_not_detection_order():
+    tracker = PoseTracker()
+    left, right = _person(0.2), _person(0.7)
+    first, _ = tracker.update(np.stack([left, right]))
+    left_id, right_id = _ids(first, 2)
+    for step in range(1, 30):
+        left, right = _person(0.2 + 0.002 * step), _person(0.7 - 0.002 * step)
+        # Detection order flips every frame
+        poses = np.stack([right, left] if step % 2 else [left, right])
+        matches, evicted = tracker.update(poses)
+        expected = [right_id, left_id] if step % 2 else [left_id, right_id]
+        assert _ids(matches, 2) == expected and evicted == []
+
+
+def test_occluded_tracks_survive_until_max_missing():
+    tracker = PoseTracker(max_missing=3)
+    matches, _ = tracker.update(_person(0.3)[None])
+    (track_id, _), = matches
+    for _ in range(3):
+        assert tracker.update(np.zeros((0, 33, 3), np.float32)) == ([], [])
+    # Back within max_missing frames: same ID
+    assert tracker.update(_person(0.3)[None])[0] == [(track_id, 0)]
+    for _ in range(3):
+        tracker.update(np.zeros((0, 33, 3), np.float32))
+    assert tracker.update(np.zeros((0, 33, 3), np.float32)) == ([], [track_id])
+    # Gone for good: a returning athlete gets a new ID
+    assert tracker.update(_person(0.3)[None])[0] == [(track_id + 1, 0)]
+
+
+def test_far_detections_start_new_tracks():
+    tracker = PoseTracker(max_cost=0.5)
+    tracker.update(_person(0.2)[None])
+    matches, _ = tracker.update(_person(0.8)[None])
+    assert matches == [(2, 0)]
+    assert sorted(tracker.tracks) == [1, 2]
+
+
+def test_invisible_landmarks_never_match():
+    tracker = PoseTracker()
+    tracker.update(_person(0.5)[None])
+    hidden = _person(0.5)
+    hidden[:, 2] = 0.0
+    assert tracker.update(hidden[None])[0] == [(2, 0)]
+
+
+def test_each_athlete_gets_their_own_coach():
+    landmarks, visibility, detected = synthetic_stream(300, frame_shape=(720, 1280, 3))
+    squatting = np.concatenate([landmarks / [SHAPE[1], SHAPE[0]], visibility[..., None]], axis=-1).astype(np.float32)
+    standing = squatting[0].copy()
+    standing[:, 0] += 0.5
+    coach = MultiPersonCoach(SquatCoach)
+    reps = {}
+    for i in range(len(squatting)):
+        poses = [standing] + ([squatting[i]] if detected[i] else [])
+        if i % 2:
+            poses.reverse()
+        for track_id, (_, _, feedback) in coach.update(np.stack(poses), SHAPE).items():
+            reps[track_id] = feedback.reps
+    # Dropped detections are brief occlusions, so nobody is re-identified
+    assert sorted(coach.analyzers) == [1, 2]
+    squatter = coach.analyzers[1 if coach.tracker.tracks[1][0, 0] < 0.5 else 2]
+    assert squatter.counter.reps > 1
+    assert sorted(reps.values()) == [0, squatter.counter.reps]
+
+
+def test_coaches_are_capped_and_dropped_with_their_track():
+    coach = MultiPersonCoach(SquatCoach, tracker=PoseTracker(max_missing=1), max_people=2)
+    people = np.stack([_person(0.1), _person(0.4), _person(0.7)])
+    assert len(coach.update(people, SHAPE)) == 2
+    assert len(coach.analyzers) == 2
+    for _ in range(2):
+        coach.update(people[:1], SHAPE)
+    assert list(coach.analyzers) == [1]
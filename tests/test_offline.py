@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from src.pose_coach.exercises.squats import SquatCoach
+from src.pose_coach.offline import analyze_video
+from src.pose_coach.sequence import rounded_rep_time
+from src.pose_coach.synthetic import synthetic_stream
+
+SHAPE = (720, 1280, 3)
+FPS = 10.0
+
+
+class ScriptedPose:
+    """Stands in for MediaPipe, returning a synthetic stream one frame per ``process`` call."""
+
+    def __init__(self, landmarks, visibility, detected):
+        self.frames = iter(zip(landmarks, visibility, detected))
+
+    def process(self, frame_rgb):
+        points, visibility, detected = next(self.frames)
+        if not detected:
+            return SimpleNamespace(pose_landmarks=None)
+        h, w = frame_rgb.shape[:2]
+        # Pixel centres, so extract_landmarks truncates back to exactly these pixels
+        marks = [SimpleNamespace(x=(x + 0.5) / w, y=(y + 0.5) / h, visibility=v) for (x, y), v in zip(points, visibility)]
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=marks))
+
+
+def test_rep_times_follow_video_time(tmp_path):
+    landmarks, visibility, detected = synthetic_stream(240, frame_shape=SHAPE)
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), FPS, (SHAPE[1], SHAPE[0]))
+    blank = np.zeros(SHAPE, dtype=np.uint8)
+    for _ in range(len(landmarks)):
+        writer.write(blank)
+    writer.release()
+
+    result = analyze_video(path, SquatCoach(), ScriptedPose(landmarks, visibility, detected))
+
+    timestamps = np.arange(len(landmarks)) / FPS
+    expected = SquatCoach().analyze_sequence(landmarks, visibility, timestamps, frame_shape=SHAPE, detected=detected)
+    assert result["reps"] == len(expected.rep_times) > 1
+    assert result["rep_times"] == [rounded_rep_time(rep) for rep in expected.rep_times]
+    # Each rep ends where the timeline enters the counted phase, in the same time base
+    entered = {(p["phase"], p["start_time"]) for p in result["phase_timeline"]}
+    for rep in result["rep_times"]:
+        assert (SquatCoach.COUNT_PHASE, rep["end"]) in entered
+        assert 0 < rep["time_under_tension"] <= len(landmarks) / FPS
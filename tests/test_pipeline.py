@@ -0,0 +1,269 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+
+from src.pose_coach.pipeline import (
+    DropOldestQueue,
+    FrameProcessor,
+    InferenceResizer,
+    LatestFrameSlot,
+    ThreadedPipeline,
+    parse_inference_size,
+)
+
+
+def test_drop_oldest_keeps_newest():
+    q = DropOldestQueue(2)
+    for item in range(5):
+        q.put(item)
+    assert (q.get(), q.get(), q.dropped) == (3, 4, 3)
+    assert q.get(timeout=0.01) is None
+
+
+def test_blocking_put_keeps_every_item():
+    q = DropOldestQueue(1, block=True)
+    received = []
+
+    def consume():
+        while True:
+            item = q.get(timeout=1.0)
+            if item is None:
+                return
+            received.append(item)
+            time.sleep(0.001)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for item in range(50):
+        q.put(item)
+    # Let the consumer drain before close() ends it
+    while len(q):
+        time.sleep(0.001)
+    q.close()
+    consumer.join()
+    assert received == list(range(50))
+    assert q.dropped == 0
+
+
+def test_close_releases_blocked_producer():
+    q = DropOldestQueue(1, block=True)
+    q.put("kept")
+    producer = threading.Thread(target=q.put, args=("late",))
+    producer.start()
+    time.sleep(0.05)
+    q.close()
+    producer.join(timeout=1.0)
+    assert not producer.is_alive()
+    assert q.dropped == 1
+    assert q.get() == "kept" and q.get() is None
+
+
+def test_blocking_put_waits_for_consumer():
+    q = DropOldestQueue(1, block=True)
+    q.put("first")
+    producer = threading.Thread(target=q.put, args=("second",))
+    producer.start()
+    time.sleep(0.05)
+    assert producer.is_alive() and len(q) == 1
+    assert q.get() == "first"
+    producer.join(timeout=1.0)
+    assert not producer.is_alive()
+    assert q.get() == "second" and q.dropped == 0
+
+
+def _frames(count):
+    frames = iter(range(count))
+
+    def read():
+        item = next(frames, None)
+        return item is not None, item
+
+    return read
+
+
+def test_lossless_pipeline_processes_every_frame():
+    seen = []
+
+    def process(frame):
+        # Much slower than capture, so a drop-oldest queue would lose frames
+        time.sleep(0.002)
+        seen.append(frame)
+        return frame
+
+    pipeline = ThreadedPipeline(_frames(200), process, lossless=True).start()
+    while not pipeline.finished:
+        pipeline.get(timeout=0.05)
+    pipeline.stop()
+    assert seen == list(range(200))
+    assert pipeline.stats()["capture_dropped"] == 0
+
+
+def test_lossy_pipeline_drops_when_inference_lags():
+    pipeline = ThreadedPipeline(_frames(200), lambda frame: time.sleep(0.002) or frame).start()
+    while not pipeline.finished:
+        pipeline.get(timeout=0.05)
+    pipeline.stop()
+    stats = pipeline.stats()
+    assert stats["captured"] == 200
+    assert stats["inferred"] + stats["capture_dropped"] == 200
+    assert stats["capture_dropped"] > 0
+
+
+def test_latest_frame_slot_serves_one_frame_at_a_time():
+    slot = LatestFrameSlot()
+    assert slot.serve(1, lambda frame: frame * 10) == 10
+    assert slot.serve(2, lambda frame: frame * 10) == 20
+    assert (slot.processed, slot.dropped) == (2, 0)
+
+
+def test_stale_frames_do_not_hold_workers_from_other_sessions():
+    slots = {"a": LatestFrameSlot(), "b": LatestFrameSlot()}
+    started, release = threading.Event(), threading.Event()
+    processed = []
+
+    def process(item):
+        if item == ("a", 0):
+            started.set()
+            assert release.wait(5)
+        processed.append(item)
+        return item
+
+    def handler(session, n):
+        return slots[session].serve((session, n), process, default="skipped")
+
+    # Two workers stand in for the web server's concurrency limit
+    with ThreadPoolExecutor(max_workers=2) as server:
+        first = server.submit(handler, "a", 0)
+        assert started.wait(5)
+        # Session "a" keeps streaming while its first frame is stuck in inference
+        assert [server.submit(handler, "a", n).result(timeout=5) for n in (1, 2, 3)] == ["skipped"] * 3
+        # ... and session "b" still gets a worker straight away
+        assert server.submit(handler, "b", 0).result(timeout=5) == ("b", 0)
+        release.set()
+        # The running call catches up on the newest frame and returns its result
+        assert first.result(timeout=5) == ("a", 3)
+    assert processed == [("b", 0), ("a", 0), ("a", 3)]
+    assert (slots["a"].processed, slots["a"].dropped) == (2, 2)
+
+
+def test_burst_collapses_to_the_newest_frame():
+    slot = LatestFrameSlot(catch_up=0)
+    processed = []
+
+    def process(frame):
+        if frame == 0:
+            # A burst arrives while the first frame is in inference
+            assert [slot.serve(n, process) for n in (1, 2, 3)] == [None] * 3
+        processed.append(frame)
+        return frame
+
+    assert slot.serve(0, process) == 0
+    # Without catch-up frame 3 stays parked until the next frame replaces it
+    assert slot.serve(4, process) == 4
+    assert processed == [0, 4]
+    assert (slot.processed, slot.dropped) == (2, 3)
+
+
+def test_latest_frame_slot_recovers_from_a_failed_frame():
+    slot = LatestFrameSlot()
+
+    def fail(frame):
+        raise RuntimeError("inference failed")
+
+    with pytest.raises(RuntimeError):
+        slot.serve(1, fail)
+    assert slot.serve(2, lambda frame: frame) == 2
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    ("", None),
+    ("full", None),
+    ("FULL", None),
+    ("none", None),
+    ("480", (0, 480)),
+    ("854x480", (854, 480)),
+    ("854X480", (854, 480)),
+])
+def test_parse_inference_size(value, expected):
+    assert parse_inference_size(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-360", "640x0", "-1x480", "big", "640x"])
+def test_parse_inference_size_rejects_bad_sizes(value):
+    with pytest.raises(ValueError):
+        parse_inference_size(value)
+
+
+def _gradient(h, w):
+    frame = np.zeros((h, w, 3), np.uint8)
+    frame[..., 0] = np.linspace(0, 255, w, dtype=np.uint8)[None]
+    frame[..., 1] = np.linspace(0, 255, h, dtype=np.uint8)[:, None]
+    frame[..., 2] = 7
+    return frame
+
+
+def test_resizer_keeps_the_aspect_ratio_and_reuses_its_buffers():
+    resizer = InferenceResizer((0, 360), cv2.COLOR_BGR2RGB)
+    frame = _gradient(720, 1280)
+    first = resizer.prepare(frame)
+    expected = cv2.cvtColor(cv2.resize(frame, (640, 360), interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2RGB)
+    np.testing.assert_array_equal(first, expected)
+    assert resizer.prepare(_gradient(720, 1280)) is first
+    # A new capture size gets new buffers
+    assert resizer.prepare(_gradient(480, 640)).shape == (360, 480, 3)
+
+
+def test_resizer_leaves_small_frames_alone():
+    frame = _gradient(240, 320)
+    assert InferenceResizer((0, 360)).prepare(frame) is frame
+    assert InferenceResizer(None).prepare(frame) is frame
+    np.testing.assert_array_equal(InferenceResizer((640, 360), cv2.COLOR_BGR2RGB).prepare(frame), frame[..., ::-1])
+
+
+class FixedPose:
+    """Finds the same normalized landmarks in every frame and remembers the frame sizes it saw."""
+
+    def __init__(self, x=0.25, y=0.75):
+        self.shapes = []
+        self.marks = [SimpleNamespace(x=x, y=y, visibility=0.9) for _ in range(33)]
+
+    def process(self, frame_rgb):
+        self.shapes.append(frame_rgb.shape)
+        self.last = frame_rgb
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=self.marks))
+
+
+class RecordingAnalyzer:
+    def __init__(self):
+        self.calls = []
+
+    def update(self, landmarks_px, visibility, frame_shape):
+        self.calls.append((None if landmarks_px is None else landmarks_px.copy(), frame_shape))
+        return []
+
+
+def test_landmarks_stay_in_capture_resolution():
+    pose, analyzer = FixedPose(), RecordingAnalyzer()
+    processor = FrameProcessor(pose, analyzer, inference_size=parse_inference_size("360"))
+    processor.process(_gradient(720, 1280))
+    assert pose.shapes == [(360, 640, 3)]
+    (landmarks_px, shape), = analyzer.calls
+    assert shape == (720, 1280, 3)
+    assert (landmarks_px == [320, 540]).all()
+
+
+@pytest.mark.parametrize("color_order", ["bgr", "rgb"])
+def test_mediapipe_always_sees_rgb(color_order):
+    pose, analyzer = FixedPose(), RecordingAnalyzer()
+    rgb = _gradient(240, 320)
+    frame = np.ascontiguousarray(rgb[..., ::-1]) if color_order == "bgr" else rgb
+    FrameProcessor(pose, analyzer, color_order=color_order).process(frame)
+    np.testing.assert_array_equal(pose.last, rgb)
+    # RGB frames go to MediaPipe without any conversion pass
+    assert (pose.last is frame) == (color_order == "rgb")
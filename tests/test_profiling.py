@@ -0,0 +1,105 @@
+import csv
+import json
+import threading
+
+import pytest
+
+from src.pose_coach.profiling import BUCKET_EDGES_US, StageHistogram, StageTimer, format_stage_summary
+
+
+def test_histogram_summary():
+    hist = StageHistogram()
+    for us in [100.0] * 90 + [5000.0] * 10:
+        hist.add(us)
+    summary = hist.summary()
+    assert (summary["count"], summary["mean_us"], summary["min_us"], summary["max_us"]) == (100, 590.0, 100.0, 5000.0)
+    assert summary["p50_us"] == pytest.approx(100.0)
+    # Percentiles are capped at the largest sample
+    assert summary["p99_us"] == 5000.0
+    assert StageHistogram().summary()["p99_us"] == 0.0
+
+
+def test_histogram_percentile_within_one_bucket():
+    hist = StageHistogram()
+    for us in range(1, 10001):
+        hist.add(float(us))
+    # Never below the exact percentile and at most one bucket (~12%) above it
+    for q in (50, 90, 99):
+        exact = 10000 * q / 100
+        assert exact <= hist.percentile(q) <= exact * 10 ** (1 / 20)
+    assert hist.percentile(100) == 10000.0
+    assert BUCKET_EDGES_US[-1] == pytest.approx(1e7)
+
+
+def test_chained_records_time_each_stage():
+    timer = StageTimer()
+    t = timer.record("capture", 0, 2_000)
+    t = timer.record("pose_process", t, 12_000)
+    timer.record("draw", t, 13_500)
+    summary = timer.summary()
+    assert list(summary) == ["capture", "pose_process", "draw"]
+    assert [row["mean_us"] for row in summary.values()] == [2.0, 10.0, 1.5]
+
+
+def test_disabled_timer_stores_nothing():
+    timer = StageTimer(enabled=False)
+    assert timer.record("capture", 0, 5_000) == 5_000
+    with timer.measure("draw"):
+        pass
+    assert timer.summary() == {}
+
+
+def test_threads_share_a_timer():
+    timer = StageTimer()
+
+    def work():
+        for _ in range(1000):
+            timer.record("infer", 0, 1_000)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert timer.summary()["infer"]["count"] == 4000
+
+
+@pytest.mark.parametrize("name", ["stages.json", "stages.csv"])
+def test_dumps(tmp_path, name):
+    timer = StageTimer()
+    timer.record("capture", 0, 3_000)
+    timer.record("capture", 0, 5_000)
+    path = tmp_path / name
+    timer.dump_every(str(path), 0.0)
+    timer.maybe_dump()
+    if name.endswith(".csv"):
+        (row,) = csv.DictReader(path.read_text().splitlines())
+        assert (row["stage"], row["count"], float(row["mean_us"])) == ("capture", "2", 4.0)
+    else:
+        data = json.loads(path.read_text())
+        assert data["stages"]["capture"]["count"] == 2
+        assert data["elapsed_s"] >= 0
+    assert not (tmp_path / (name + ".tmp")).exists()
+
+
+def test_chrome_trace_keeps_the_latest_spans(tmp_path):
+    timer = StageTimer(trace_events=2)
+    with timer.measure("capture"):
+        pass
+    timer.record("pose_process", timer.now())
+    timer.record("draw", timer.now())
+    path = tmp_path / "trace.json"
+    timer.write_chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [e["name"] for e in events] == ["pose_process", "draw"]
+    assert all(e["ph"] == "X" and e["dur"] >= 0 and e["tid"] == threading.get_ident() for e in events)
+    # The histograms still count every span
+    assert timer.summary()["capture"]["count"] == 1
+
+
+def test_format_stage_summary():
+    timer = StageTimer()
+    timer.record("analyzer_update", 0, 42_000)
+    header, line = format_stage_summary(timer.summary())
+    assert header.split()[:2] == ["stage", "count"]
+    assert line.split()[:3] == ["analyzer_update", "1", "42.0"]
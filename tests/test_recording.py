@@ -0,0 +1,92 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.pose_coach.exercises.squats import SquatCoach
+from src.pose_coach.offline import replay_files
+from src.pose_coach.recording import LandmarkRecorder, LandmarkRecording
+from src.pose_coach.synthetic import synthetic_stream
+
+SHAPE = (720, 1280, 3)
+
+
+def _record(path, frames=120, block_size=256):
+    landmarks, visibility, detected = synthetic_stream(frames, frame_shape=SHAPE)
+    with LandmarkRecorder(str(path), block_size=block_size) as recorder:
+        for i in range(frames):
+            normalized = (landmarks[i] + 0.5) / (SHAPE[1], SHAPE[0]) if detected[i] else None
+            recorder.write(i / 30, SHAPE, normalized, visibility[i])
+    return landmarks, visibility, detected
+
+
+def test_replay_keeps_the_source_analysis(tmp_path):
+    _record(tmp_path / "set1.landmarks.npy")
+    original = tmp_path / "set1.json"
+    original.write_text(json.dumps({"reps": 7}))
+
+    (result,) = replay_files([str(tmp_path / "set1.landmarks.npy")], SquatCoach, str(tmp_path))
+
+    assert json.loads(original.read_text()) == {"reps": 7}
+    assert result["output"] == str(tmp_path / "set1.replay.json")
+    assert json.loads((tmp_path / "set1.replay.json").read_text())["frames"] == 120
+
+
+def test_recording_round_trips_pixels(tmp_path):
+    path = tmp_path / "set.landmarks.npy"
+    # A block size that doesn't divide the frame count exercises the partial flush
+    landmarks, visibility, detected = _record(path, frames=100, block_size=7)
+
+    recording = LandmarkRecording(str(path))
+    assert len(recording) == 100
+    np.testing.assert_allclose(recording.timestamps, np.arange(100) / 30)
+    pixels, vis, det = recording.pixel_landmarks()
+    np.testing.assert_array_equal(det, detected)
+    np.testing.assert_array_equal(pixels[det], landmarks[detected])
+    np.testing.assert_array_equal(vis[det], visibility[detected])
+    # np.load reads the same records through the finalized header
+    assert len(np.load(path)) == 100
+
+    frames = list(recording.frames(chunk_size=16))
+    assert len(frames) == 100
+    for (timestamp, px, v, shape), was_detected in zip(frames, detected):
+        assert shape == SHAPE
+        assert (px is not None) == was_detected
+
+
+def test_unclosed_recording_is_still_readable(tmp_path):
+    path = tmp_path / "crashed.landmarks.npy"
+    recorder = LandmarkRecorder(str(path), block_size=8)
+    for i in range(20):
+        recorder.write(i / 30, SHAPE, np.full((33, 3), 0.5, np.float32))
+    recorder.flush()
+    # The header still says zero records; the reader sizes itself from the file
+    assert len(LandmarkRecording(str(path))) == 20
+    recorder.close()
+
+
+def test_replay_matches_live_updates(tmp_path):
+    path = tmp_path / "set.landmarks.npy"
+    landmarks, visibility, detected = _record(path, frames=240)
+
+    live = SquatCoach()
+    expected = []
+    for i in range(240):
+        px, vis = (landmarks[i], visibility[i]) if detected[i] else (None, None)
+        expected.append(live.update(px, vis, SHAPE).reps)
+
+    replayed = SquatCoach()
+    reps = []
+    count = LandmarkRecording(str(path)).replay(replayed, on_frame=lambda t, tips, det: reps.append(tips.reps))
+    assert count == 240
+    assert reps == expected
+    assert replayed.counter.reps == live.counter.reps > 0
+    # Reps are timed by the recorded timestamps, not the wall clock
+    assert replayed.counter.rep_times[-1]["end"] <= 239 / 30
+
+
+def test_other_npy_files_are_rejected(tmp_path):
+    path = tmp_path / "plain.npy"
+    np.save(path, np.zeros(10))
+    with pytest.raises(ValueError):
+        LandmarkRecording(str(path))
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from src.pose_coach.reps import RepCounter
+
+TRANSITIONS = {"up": [("at_bottom", "down")], "down": [("at_top", "up")]}
+
+
+def _counter(min_dwell):
+    return RepCounter(TRANSITIONS, "up", "up", min_dwell=min_dwell, tempo={"eccentric": "up", "concentric": "down"})
+
+
+@pytest.mark.parametrize("min_dwell", [1, 3, 6])
+@pytest.mark.parametrize("chunks", [1, 7])
+def test_run_matches_step(min_dwell, chunks):
+    rng = np.random.default_rng(min_dwell)
+    # Noisy signals that flicker around the thresholds, so the dwell matters
+    signals = {"at_bottom": rng.random(500) < 0.3, "at_top": rng.random(500) < 0.3}
+    # Stand still first, so the first rep's eccentric phase has a duration too
+    for value in signals.values():
+        value[:5] = False
+    timestamps = np.cumsum(rng.uniform(0.02, 0.05, 500))
+
+    stepped = _counter(min_dwell)
+    expected = []
+    for i in range(500):
+        phase = stepped.step({key: value[i] for key, value in signals.items()}, float(timestamps[i]))
+        if phase is not None:
+            expected.append((i, phase))
+
+    run = _counter(min_dwell)
+    changes = []
+    for idx in np.array_split(np.arange(500), chunks):
+        changes += [(int(idx[0]) + frame, phase) for frame, phase in run.run({k: v[idx] for k, v in signals.items()}, timestamps[idx])]
+    assert changes == expected
+    assert (run.phase, run.reps, run.dwell, run.frames) == (stepped.phase, stepped.reps, stepped.dwell, stepped.frames)
+    assert run.rep_times == stepped.rep_times
+    assert stepped.reps > 10
+    for rep in stepped.rep_times:
+        assert rep["eccentric"] > 0 and rep["concentric"] > 0
+        assert rep["eccentric"] + rep["concentric"] == pytest.approx(rep["time_under_tension"])
+
+
+def test_min_dwell_filters_jitter():
+    flicker = {
+        "at_bottom": np.array([0, 0, 1, 0, 0, 0, 0, 0], bool),
+        "at_top": np.array([0, 0, 0, 1, 1, 1, 1, 1], bool),
+    }
+    plain, held = _counter(1), _counter(3)
+    plain.run(flicker)
+    held.run(flicker)
+    # Without dwell the rep counts on the frame after the dip; with it "down" is held for three frames first
+    assert plain.reps == held.reps == 1
+    (quick,), (slow,) = plain.rep_times, held.rep_times
+    assert (quick["end"], quick["eccentric"], quick["concentric"]) == (3.0, 2.0, 1.0)
+    assert (slow["end"], slow["eccentric"], slow["concentric"]) == (5.0, 2.0, 3.0)
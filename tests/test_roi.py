@@ -0,0 +1,96 @@
+import numpy as np
+
+from src.pose_coach.roi import RoiPoseEstimator
+from src.pose_coach.utils import LandmarkResults, extract_landmarks, results_from_normalized
+
+SHAPE = (720, 1280, 3)
+
+
+class BrightBoxPose:
+    """Finds the bright box in whatever image it is given and spreads 33 landmarks along its diagonal."""
+
+    def __init__(self, visibility=0.9):
+        self.visibility = visibility
+        self.shapes = []
+        self.resets = 0
+
+    def process(self, image):
+        self.shapes.append(image.shape)
+        ys, xs = np.nonzero(image[..., 0] > 127)
+        if not len(xs):
+            return LandmarkResults(None)
+        h, w = image.shape[:2]
+        t = np.linspace(0.0, 1.0, 33)
+        normalized = np.empty((33, 3), np.float32)
+        normalized[:, 0] = (xs.min() + t * (xs.max() + 1 - xs.min())) / w
+        normalized[:, 1] = (ys.min() + t * (ys.max() + 1 - ys.min())) / h
+        normalized[:, 2] = self.visibility
+        return results_from_normalized(normalized)
+
+    def reset(self):
+        self.resets += 1
+
+    def close(self):
+        pass
+
+
+def _frame(x0, y0, x1=None, y1=None):
+    frame = np.zeros(SHAPE, np.uint8)
+    frame[y0:y1 if y1 is not None else y0 + 400, x0:x1 if x1 is not None else x0 + 200] = 255
+    return frame
+
+
+def _pixels(results):
+    landmarks_px, _ = extract_landmarks(results, SHAPE)
+    return landmarks_px
+
+
+def test_crop_landmarks_map_back_to_the_full_frame():
+    pose = BrightBoxPose()
+    roi = RoiPoseEstimator(pose, padding=0.25, max_side=512)
+    frame = _frame(500, 200)
+    full = _pixels(roi.process(frame))
+    # The 200x400 box padded by a quarter on every side
+    np.testing.assert_allclose(roi.roi, (450, 100, 750, 700), atol=1)
+
+    cropped = _pixels(roi.process(frame))
+    # The 300x600 crop is downscaled to fit 512 px
+    assert pose.shapes[0] == SHAPE and max(pose.shapes[1]) == 512
+    assert np.abs(cropped - full).max() <= 3
+    stats = roi.stats()
+    assert (stats["roi_frames"], stats["full_frames"], stats["fallbacks"]) == (1, 1, 0)
+    assert stats["mean_pixel_fraction"] < 0.6
+
+
+def test_crop_moves_only_near_its_edge():
+    pose = BrightBoxPose()
+    roi = RoiPoseEstimator(pose, padding=0.25, max_side=512)
+    roi.process(_frame(500, 200))
+    first, resets = roi.roi, pose.resets
+    # A small step stays well inside the crop: MediaPipe keeps its track
+    roi.process(_frame(510, 205))
+    assert (roi.roi, pose.resets) == (first, resets)
+    # Walking towards the edge re-centres the crop and restarts tracking
+    roi.process(_frame(700, 200, 900, 600))
+    assert roi.roi != first and pose.resets == resets + 1
+
+
+def test_losing_the_person_falls_back_to_the_full_frame():
+    pose = BrightBoxPose()
+    roi = RoiPoseEstimator(pose)
+    roi.process(_frame(500, 200))
+    # The athlete jumps out of the crop: the same frame is re-run at full resolution
+    moved = _frame(50, 50, 250, 450)
+    results = roi.process(moved)
+    assert pose.shapes[-1] == SHAPE
+    assert np.abs(_pixels(results)[0] - [50, 50]).max() <= 1
+    assert roi.stats()["fallbacks"] == 1
+    assert roi.roi is not None and roi.roi[0] == 0
+
+
+def test_no_crop_without_enough_visible_landmarks():
+    roi = RoiPoseEstimator(BrightBoxPose(visibility=0.1))
+    roi.process(_frame(500, 200))
+    roi.process(_frame(500, 200))
+    assert roi.roi is None
+    assert roi.stats()["full_frames"] == 2
@@ -0,0 +1,191 @@
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.pose_coach.pipeline import FrameProcessor
+from src.pose_coach.scheduling import AdaptiveInferenceScheduler, LandmarkExtrapolator, ModelComplexityController
+from src.pose_coach.utils import NUM_LANDMARKS, LandmarkBuffers
+
+SHAPE = (480, 640, 3)
+
+
+def _pose(x, y=0.5, visibility=0.9):
+    normalized = np.empty((NUM_LANDMARKS, 3), np.float32)
+    normalized[:, 0], normalized[:, 1], normalized[:, 2] = x, y, visibility
+    return normalized
+
+
+@pytest.mark.parametrize("latency_s, stride", [(0.001, 1), (0.05, 2), (0.09, 3), (1.0, 4)])
+def test_stride_follows_latency(latency_s, stride):
+    scheduler = AdaptiveInferenceScheduler(target_fps=30, max_stride=4)
+    assert scheduler.begin_frame()
+    scheduler.keyframe(latency_s, _pose(0.5))
+    assert scheduler.stride == stride
+    # Inference runs again exactly ``stride`` frames later
+    assert [scheduler.begin_frame() for _ in range(stride)] == [False] * (stride - 1) + [True]
+
+
+def test_latency_is_smoothed():
+    scheduler = AdaptiveInferenceScheduler(target_fps=30, max_stride=4, smoothing=0.8)
+    scheduler.begin_frame()
+    scheduler.keyframe(0.01, _pose(0.5))
+    scheduler.begin_frame()
+    # A single slow frame moves the average only a fifth of the way
+    scheduler.keyframe(0.11, _pose(0.5))
+    assert scheduler.latency_s == pytest.approx(0.03)
+    assert scheduler.stride == 1
+
+
+def test_extrapolation_is_constant_velocity():
+    extrapolator = LandmarkExtrapolator(max_gap=4)
+    buffers = LandmarkBuffers()
+    extrapolator.add_keyframe(0, _pose(0.10, 0.50, 0.7))
+    # A single keyframe holds the pose
+    assert extrapolator.predict_into(1, buffers, SHAPE)
+    np.testing.assert_allclose(buffers.normalized[:, :2], [[0.10, 0.50]] * NUM_LANDMARKS, atol=1e-6)
+
+    extrapolator.add_keyframe(2, _pose(0.20, 0.40, 0.9))
+    assert extrapolator.predict_into(3, buffers, SHAPE)
+    np.testing.assert_allclose(buffers.normalized, [[0.25, 0.35, 0.9]] * NUM_LANDMARKS, atol=1e-6)
+    assert (buffers.pixels == [160, 168]).all()
+    assert extrapolator.predict_into(6, buffers, SHAPE)
+    np.testing.assert_allclose(buffers.normalized[:, :2], [[0.40, 0.20]] * NUM_LANDMARKS, atol=1e-6)
+    # Predictions stop after max_gap frames
+    assert not extrapolator.predict_into(7, buffers, SHAPE)
+
+
+def test_lost_person_stops_prediction():
+    extrapolator = LandmarkExtrapolator()
+    buffers = LandmarkBuffers()
+    assert not extrapolator.predict_into(0, buffers, SHAPE)
+    extrapolator.add_keyframe(0, _pose(0.1))
+    extrapolator.add_keyframe(1, None)
+    assert not extrapolator.predict_into(2, buffers, SHAPE)
+
+
+class SlowMovingPose:
+    """Slower than the frame budget; the person moves right by 1% of the frame per frame.
+
+    Frames carry their index in every pixel, so the pose knows where it is.
+    """
+
+    def __init__(self, delay_s):
+        self.delay_s = delay_s
+        self.frames = []
+
+    def process(self, frame_rgb):
+        time.sleep(self.delay_s)
+        idx = int(frame_rgb[0, 0, 0])
+        self.frames.append(idx)
+        marks = [SimpleNamespace(x=0.1 + 0.01 * idx, y=0.5, visibility=0.9) for _ in range(NUM_LANDMARKS)]
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=marks))
+
+
+class RecordingAnalyzer:
+    def __init__(self):
+        self.xs = []
+
+    def update(self, landmarks_px, visibility, frame_shape):
+        self.xs.append(None if landmarks_px is None else int(landmarks_px[0, 0]))
+        return []
+
+
+def test_skipped_frames_get_extrapolated_landmarks():
+    # 30 ms of inference against a 10 ms budget: the stride hits max_stride at once
+    pose, analyzer = SlowMovingPose(0.03), RecordingAnalyzer()
+    scheduler = AdaptiveInferenceScheduler(target_fps=100, max_stride=2)
+    processor = FrameProcessor(pose, analyzer, scheduler=scheduler)
+    for idx in range(10):
+        processor.process(np.full(SHAPE, idx, np.uint8))
+
+    assert pose.frames == [0, 2, 4, 6, 8]
+    assert scheduler.stats()["keyframes"] == 5
+    assert scheduler.stats()["predicted"] == 5
+    # Frame 1 holds the first pose; later frames continue the measured motion
+    expected = [int((0.1 + 0.01 * idx) * SHAPE[1]) for idx in range(10)]
+    expected[1] = expected[0]
+    np.testing.assert_allclose(analyzer.xs, expected, atol=1)
+
+
+class TimedPose:
+    """A model of one complexity: takes ``delay_s`` per frame and finds the person after ``blind_frames``."""
+
+    def __init__(self, complexity, delay_s, blind_frames=0):
+        self.complexity = complexity
+        self.delay_s = delay_s
+        self.blind_frames = blind_frames
+        self.calls = 0
+        self.closed = False
+
+    def process(self, frame_rgb):
+        self.calls += 1
+        time.sleep(self.delay_s)
+        found = self.calls > self.blind_frames
+        return SimpleNamespace(pose_landmarks=object() if found else None, complexity=self.complexity)
+
+    def close(self):
+        self.closed = True
+
+
+def _controller(delays, blind_frames=0, **kwargs):
+    made = []
+
+    def factory(complexity):
+        delay = delays[complexity]
+        if delay is None:
+            raise RuntimeError(f"model {complexity} is not available")
+        made.append(TimedPose(complexity, delay, blind_frames if made else 0))
+        return made[-1]
+
+    # 100 fps: a 10 ms budget
+    kwargs = dict(dict(target_fps=100, initial=1, window=3, cooldown_frames=3), **kwargs)
+    return ModelComplexityController(factory, **kwargs), made
+
+
+def _run_until(controller, done, frames=300):
+    for _ in range(frames):
+        if done():
+            return
+        controller.process(None)
+        time.sleep(0.001)
+    raise AssertionError("controller never got there")
+
+
+def test_slow_model_is_downgraded_without_flapping_back():
+    controller, made = _controller({0: 0.0, 1: 0.015, 2: 0.0})
+    _run_until(controller, lambda: controller.complexity == 0)
+    assert made[0].closed and controller.switches == 1
+    # Model 0 is fast, but model 1 is known to blow the budget
+    for _ in range(20):
+        controller.process(None)
+    assert controller.complexity == 0 and len(made) == 2
+    assert controller.stats()["switches"] == 1
+
+
+def test_fast_models_are_upgraded():
+    controller, made = _controller({0: 0.0, 1: 0.0, 2: 0.0}, initial=0)
+    _run_until(controller, lambda: controller.complexity == 2)
+    assert [pose.complexity for pose in made] == [0, 1, 2]
+    assert [pose.closed for pose in made] == [True, True, False]
+
+
+def test_new_model_takes_over_once_it_sees_the_person():
+    controller, made = _controller({0: 0.0, 1: 0.015, 2: 0.0}, blind_frames=2, handover_frames=5)
+    _run_until(controller, lambda: len(made) == 2 and controller._take_candidate() is not None)
+    old, new = made
+    # While the new model is still blind, the old one keeps the track
+    assert controller.process(None).complexity == 1
+    assert controller.process(None).complexity == 1
+    assert controller.process(None).complexity == 0
+    assert (controller.complexity, new.calls, old.closed) == (0, 3, True)
+
+
+def test_unavailable_models_are_not_retried():
+    controller, made = _controller({0: None, 1: 0.015, 2: None})
+    _run_until(controller, lambda: controller.unavailable == {0})
+    for _ in range(20):
+        controller.process(None)
+    assert controller.complexity == 1 and controller.switches == 0
+    assert controller.stats()["unavailable"] == [0]
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.pose_coach.utils import LandmarkBuffers, LandmarkResults, extract_landmarks, results_from_normalized
+
+
+def _results(seed):
+    rng = np.random.default_rng(seed)
+    normalized = rng.uniform(-0.2, 1.2, (33, 3)).astype(np.float32)
+    normalized[:, 2] = rng.random(33)
+    return results_from_normalized(normalized)
+
+
+@pytest.mark.parametrize("shape", [(720, 1280, 3), (480, 640), (1081, 1919, 3)])
+def test_buffers_match_the_per_landmark_path(shape):
+    buffers = LandmarkBuffers()
+    for seed in range(5):
+        results = _results(seed)
+        expected_px, expected_vis = extract_landmarks(results, shape)
+        landmarks_px, visibility = extract_landmarks(results, shape, buffers)
+        assert landmarks_px.dtype == np.int32 and visibility.dtype == np.float32
+        np.testing.assert_array_equal(landmarks_px, expected_px)
+        np.testing.assert_array_equal(visibility, expected_vis)
+        # Same truncation toward zero as int(lm.x * w), also off-frame
+        h, w = shape[:2]
+        assert [tuple(p) for p in landmarks_px] == [(int(lm.x * w), int(lm.y * h)) for lm in results.pose_landmarks.landmark]
+
+
+def test_buffers_are_reused_between_frames():
+    buffers = LandmarkBuffers()
+    first, _ = extract_landmarks(_results(0), (720, 1280), buffers)
+    kept = first.copy()
+    second, visibility = extract_landmarks(_results(1), (720, 1280), buffers)
+    assert second is first is buffers.pixels
+    assert visibility is buffers.visibility
+    assert not np.array_equal(second, kept)
+
+
+def test_rescale_follows_the_frame_size():
+    buffers = LandmarkBuffers()
+    extract_landmarks(_results(2), (720, 1280), buffers)
+    normalized = buffers.normalized.copy()
+    buffers.rescale((360, 640))
+    np.testing.assert_array_equal(buffers.normalized, normalized)
+    np.testing.assert_allclose(buffers.points, normalized[:, :2] * [640, 360], rtol=1e-6)
+
+
+@pytest.mark.parametrize("results", [None, LandmarkResults(None)])
+def test_no_person(results):
+    assert extract_landmarks(results, (720, 1280)) == (None, None)
+    assert extract_landmarks(results, (720, 1280), LandmarkBuffers()) == (None, None)
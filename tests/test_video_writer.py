@@ -0,0 +1,123 @@
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from src.pose_coach import video_writer
+from src.pose_coach.video_writer import AnnotatedVideoWriter
+
+FRAME = np.zeros((48, 64, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("policy", AnnotatedVideoWriter.POLICIES)
+def test_frames_after_an_encoder_failure_are_counted_as_dropped(tmp_path, policy):
+    writer = AnnotatedVideoWriter(str(tmp_path / "missing" / "out.avi"), queue_size=2, policy=policy)
+    threads = [threading.Thread(target=lambda: [writer.write(FRAME) for _ in range(50)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5.0)
+    writer.close()
+    stats = writer.stats()
+    assert "error" in stats
+    assert stats["written"] == 0
+    assert stats["dropped"] == 200 and stats["queue_depth"] == 0
+
+
+def test_frames_are_written_in_order(tmp_path):
+    path = str(tmp_path / "out.avi")
+    writer = AnnotatedVideoWriter(path, fps=10.0, policy="block")
+    for i in range(20):
+        writer.write(np.full((48, 64, 3), i * 10, np.uint8))
+    # A frame of another size is scaled to the first frame's size
+    writer.write(np.full((96, 128, 3), 200, np.uint8))
+    writer.close()
+    assert (writer.stats()["written"], writer.stats()["dropped"], writer.frame_size) == (21, 0, (64, 48))
+
+    cap = cv2.VideoCapture(path)
+    means = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        assert frame.shape == (48, 64, 3)
+        means.append(frame.mean())
+    cap.release()
+    np.testing.assert_allclose(means, [i * 10 for i in range(20)] + [200], atol=3)
+
+
+class StalledEncoder:
+    """Stands in for cv2.VideoWriter; ``write`` waits for ``release`` so the queue backs up."""
+
+    go = None
+    frames = None
+
+    def __init__(self, *args):
+        pass
+
+    def isOpened(self):
+        return True
+
+    def write(self, frame):
+        assert StalledEncoder.go.wait(5)
+        StalledEncoder.frames.append(int(frame[0, 0, 0]))
+
+    def release(self):
+        pass
+
+
+@pytest.fixture
+def stalled(monkeypatch):
+    StalledEncoder.go, StalledEncoder.frames = threading.Event(), []
+    monkeypatch.setattr(video_writer.cv2, "VideoWriter", StalledEncoder)
+    return StalledEncoder
+
+
+def _wait_for_encoder(writer):
+    deadline = time.monotonic() + 5
+    while writer.stats()["queue_depth"] and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_drop_policy_keeps_the_newest_frames(tmp_path, stalled):
+    writer = AnnotatedVideoWriter(str(tmp_path / "out.avi"), queue_size=2, policy="drop")
+    writer.write(np.full((8, 8, 3), 0, np.uint8))
+    _wait_for_encoder(writer)
+    # The encoder is stuck on frame 0; only the two newest of the rest stay queued
+    for i in range(1, 10):
+        writer.write(np.full((8, 8, 3), i, np.uint8))
+    assert writer.stats()["dropped"] == 7
+    stalled.go.set()
+    writer.close()
+    assert stalled.frames == [0, 8, 9]
+    assert (writer.stats()["written"], writer.stats()["blocked_s"]) == (3, 0.0)
+
+
+def test_block_policy_waits_for_room(tmp_path, stalled):
+    writer = AnnotatedVideoWriter(str(tmp_path / "out.avi"), queue_size=1, policy="block")
+    producer = threading.Thread(target=lambda: [writer.write(np.full((8, 8, 3), i, np.uint8)) for i in range(5)])
+    producer.start()
+    producer.join(0.1)
+    # Frame 0 is in the encoder and frame 1 fills the queue, so the producer is stuck on frame 2
+    assert producer.is_alive()
+    stalled.go.set()
+    producer.join(5)
+    writer.close()
+    assert stalled.frames == [0, 1, 2, 3, 4]
+    stats = writer.stats()
+    assert (stats["written"], stats["dropped"]) == (5, 0)
+    assert stats["blocked_s"] >= 0.05
+
+
+def test_writer_arguments_are_checked(tmp_path):
+    with pytest.raises(ValueError):
+        AnnotatedVideoWriter(str(tmp_path / "out.avi"), policy="wait")
+    with pytest.raises(ValueError):
+        AnnotatedVideoWriter(str(tmp_path / "out.avi"), queue_size=0)
+    writer = AnnotatedVideoWriter(str(tmp_path / "out.mkv"))
+    assert writer.fourcc == "XVID"
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.write(FRAME)